@@ -0,0 +1,127 @@
+"""Throughput and latency benchmarks of the UC2 devices.
+
+Drives the real Mimir device classes against the UC2 firmware
+simulator over a pseudo-terminal (POSIX only)::
+
+    python benchmarks/uc2_serial.py --commands 500 --baudrate 115200
+
+Reported latencies are measured from the call to the device method
+to the completion of the returned status; the per-phase breakdown
+recorded by the serial engine is printed at the end. The laser device
+coalesces requests made while a command is in flight, so the pipelined
+benchmark reports both the requests made and the commands actually
+written by the engine.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+from concurrent.futures import Future
+from typing import TYPE_CHECKING
+
+from redsun_mimir.device.youseetoo import (
+    MimirLaserDevice,
+    MimirMotorDevice,
+    MimirSerialDevice,
+)
+from redsun_mimir.device.youseetoo._simulator import UC2Simulator, travel_time
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from redsun_mimir.device.youseetoo._engine import SerialEngine
+
+
+def _summary(label: str, samples: Sequence[float]) -> None:
+    ordered = sorted(samples)
+    p95 = ordered[int(0.95 * (len(ordered) - 1))]
+    p99 = ordered[int(0.99 * (len(ordered) - 1))]
+    print(
+        f"{label:<32} n={len(ordered):<5} "
+        f"mean={statistics.fmean(ordered) * 1e3:8.3f} ms  "
+        f"p50={statistics.median(ordered) * 1e3:8.3f} ms  "
+        f"p95={p95 * 1e3:8.3f} ms  p99={p99 * 1e3:8.3f} ms"
+    )
+
+
+def laser_latency(laser: MimirLaserDevice, commands: int) -> None:
+    """Latency of one laser command at a time."""
+    samples = []
+    for i in range(commands):
+        start = time.perf_counter()
+        laser.set(i % 1024).wait(timeout=5.0)
+        samples.append(time.perf_counter() - start)
+    _summary("laser set (sequential)", samples)
+
+
+def _laser_commands(engine: SerialEngine) -> int:
+    """Return the number of laser commands written by the engine so far."""
+    entry = engine.statistics.snapshot()["tasks"].get("/laser_act", {})
+    return int(entry.get("total", {}).get("count", 0) + entry.get("failures", 0))
+
+
+def laser_throughput(
+    laser: MimirLaserDevice, engine: SerialEngine, commands: int
+) -> None:
+    """Throughput of laser requests submitted without waiting.
+
+    Requests made while a command is in flight replace each other;
+    the commands actually written are counted by the engine.
+    """
+    written = _laser_commands(engine)
+    start = time.perf_counter()
+    statuses = [laser.set(i % 1024) for i in range(commands)]
+    for status in statuses:
+        status.wait(timeout=30.0)
+    elapsed = time.perf_counter() - start
+    written = _laser_commands(engine) - written
+    print(
+        f"{'laser set (pipelined)':<32} n={commands:<5} "
+        f"{commands / elapsed:10.1f} requests/s  "
+        f"{written / elapsed:10.1f} commands/s ({written} written)"
+    )
+
+
+def motor_latency(motor: MimirMotorDevice, moves: int, distance: float) -> None:
+    """Overhead of motor moves on top of the modeled travel time."""
+    steps = int(distance * motor._factor) // motor.motor_step
+    modeled = travel_time(steps, 10_000, 10_000, ramp=False)
+    samples = []
+    for i in range(moves):
+        start = time.perf_counter()
+        motor.set(distance * ((i + 1) % 2)).wait(timeout=10.0)
+        samples.append(time.perf_counter() - start - modeled)
+    _summary(f"motor move overhead ({steps} steps)", samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--commands", type=int, default=200)
+    parser.add_argument("--moves", type=int, default=20)
+    parser.add_argument("--distance", type=float, default=10.0)
+    parser.add_argument("--baudrate", type=int, default=115200)
+    parser.add_argument("--noise", type=float, default=0.0)
+    args = parser.parse_args()
+
+    with UC2Simulator(baudrate=args.baudrate, noise=args.noise, seed=0) as sim:
+        serial = MimirSerialDevice("serial", port=sim.port, timeout=0.1)
+        laser = MimirLaserDevice("laser")
+        motor = MimirMotorDevice("motor")
+        engine = MimirSerialDevice.get()
+        if isinstance(engine, Future):
+            engine = engine.result(timeout=10.0)
+        try:
+            laser.trigger().wait(timeout=5.0)
+            laser_latency(laser, args.commands)
+            laser_throughput(laser, engine, args.commands)
+            motor_latency(motor, args.moves, args.distance)
+            print(engine.statistics.summary())
+        finally:
+            laser.shutdown()
+            serial.shutdown()
+
+
+if __name__ == "__main__":
+    main()
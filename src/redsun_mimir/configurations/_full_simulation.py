@@ -25,6 +25,7 @@ def run_simulation_container() -> None:
     from redsun_mimir.presenter.detector import DetectorPresenter
     from redsun_mimir.presenter.light import LightPresenter
     from redsun_mimir.presenter.median import MedianPresenter
+    from redsun_mimir.presenter.mosaic import MosaicPresenter
     from redsun_mimir.presenter.motor import MotorPresenter
 
     # views
@@ -48,6 +49,7 @@ def run_simulation_container() -> None:
         # presenters
         storage_ctrl = presenter(FileStoragePresenter, from_config="storage_ctrl")
         median_ctrl = presenter(MedianPresenter, from_config="median_ctrl")
+        mosaic_ctrl = presenter(MosaicPresenter, from_config="mosaic_ctrl")
         det_ctrl = presenter(DetectorPresenter, from_config="det_ctrl")
         acq_ctrl = presenter(AcquisitionPresenter, from_config="acq_ctrl")
         light_ctrl = presenter(LightPresenter, from_config="light_ctrl")
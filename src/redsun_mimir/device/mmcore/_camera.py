@@ -110,6 +110,7 @@ class MMCoreCameraDevice(Device, DetectorProtocol, Loggable):
 
         self._complete_status = Status()
         self._assets_collected = False  # Track if stream assets have been collected
+        self._frame_timestamps: list[float] = []
 
         self.logger.debug(f"Initialized {self.config.adapter} -> {self.config.device}")
 
@@ -288,6 +289,7 @@ class MMCoreCameraDevice(Device, DetectorProtocol, Loggable):
         s = Status()
         self._fly_permit.clear()
         self._fly_stop.clear()
+        self._frame_timestamps = []
         try:
             capacity = 0 if value.write_forever else value.capacity
             width, height = self._core.getImageWidth(), self._core.getImageHeight()
@@ -505,6 +507,23 @@ class MMCoreCameraDevice(Device, DetectorProtocol, Loggable):
         """Return the number of frames written since last flight."""
         return self._writer.get_indices_written(self.name)
 
+    def frame_timestamps(self) -> list[float]:
+        """Return the acquisition timestamps of the frames of the last flight.
+
+        Timestamps are computed from the sequence start time and the
+        ``ElapsedTime-ms`` metadata of each frame, when available;
+        otherwise, the time at which the frame was popped from the
+        core buffer is used.
+        """
+        return list(self._frame_timestamps)
+
+    def _frame_timestamp(self, md: Any, start: float) -> float:
+        """Compute the acquisition timestamp of a frame from its metadata."""
+        try:
+            return start + float(md["ElapsedTime-ms"]) / 1000.0
+        except (KeyError, ValueError):
+            return time.time()
+
     def _stream_to_disk(self, *, frames: int) -> None:
         """Stream data from the camera to disk.
 
@@ -527,11 +546,13 @@ class MMCoreCameraDevice(Device, DetectorProtocol, Loggable):
         # it would be spared if we could
         # access the camera image buffer directly
         frames_written = 0
+        start = time.time()
         if frames > 0:
             self._core.startSequenceAcquisition(frames, self._current_exposure, False)
             while frames_written < frames:
                 self._wait_for_buffer()
                 img, md = self._core.popNextImageAndMD()
+                self._frame_timestamps.append(self._frame_timestamp(md, start))
                 last_frame = int(md["ImageNumber"])
                 np.copyto(self._read_buffer, img)
                 self._sink.write(img)
@@ -543,6 +564,7 @@ class MMCoreCameraDevice(Device, DetectorProtocol, Loggable):
             while not self._fly_stop.is_set():
                 self._wait_for_buffer()
                 img, md = self._core.popNextImageAndMD()
+                self._frame_timestamps.append(self._frame_timestamp(md, start))
                 last_frame = int(md["ImageNumber"])
                 np.copyto(self._read_buffer, img)
                 self._sink.write(img)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import time
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 from pymmcore_plus import CMMCorePlus as Core
@@ -20,7 +22,7 @@ from redsun_mimir.device.mmcore.configs import (
     DemoXYStageConfig,
     DemoZStageConfig,
 )
-from redsun_mimir.protocols import MotorProtocol
+from redsun_mimir.protocols import MultiAxisMotor, SequenceableMotor
 
 if TYPE_CHECKING:
     from typing import Any, Literal
@@ -29,9 +31,19 @@ if TYPE_CHECKING:
     from redsun.storage import PrepareInfo
 
 
-class MMCoreStageDevice(Device, MotorProtocol, Loggable):
+class MMCoreStageDevice(Device, SequenceableMotor, MultiAxisMotor, Loggable):
     """Device control for a Micro-Manager stage.
 
+    Moves are absolute, and are issued on a worker thread; the status
+    returned by ``set()`` completes once the stage reports it has stopped.
+    The readback position is kept up to date from the position
+    change events of the core, so it also follows moves in progress.
+
+    If the stage supports it, a sequence of absolute positions for the
+    active axis can be loaded with ``set(positions, propr="sequence")``;
+    ``kickoff()`` starts the sequence, so that the stage advances on every
+    hardware trigger, and ``complete()`` stops it.
+
     Parameters
     ----------
     name : str
@@ -62,6 +74,8 @@ class MMCoreStageDevice(Device, MotorProtocol, Loggable):
         try:
             self._core.loadDevice(self.name, self.config.adapter, self.config.device)
             self._core.initializeDevice(self.name)
+            for prop, value in self.config.defaults.items():
+                self._core.setProperty(self.name, prop, value)
         except Exception as e:
             raise RuntimeError(f"Failed to initialize MMCore stage device: {e}") from e
         # would be nice to recover the origin from
@@ -86,7 +100,21 @@ class MMCoreStageDevice(Device, MotorProtocol, Loggable):
         # TODO: how to retrieve this information from the device?
         # if it is available at all?
         self.step_sizes = self.config.step_sizes
+        self.settle_time = self.config.settle_time
         self._active_axis = self.axis[0]
+        # loaded position sequence, as (axis, positions)
+        self._sequence: tuple[str, list[float]] | None = None
+        # moves are queued on a single worker, so that the
+        # moves of different axes of the same stage are serialized
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=f"{self.name}-move"
+        )
+        if self._stage_type == "Z":
+            self._core.events.stagePositionChanged.connect(self._on_position_changed)
+        else:
+            self._core.events.XYStagePositionChanged.connect(
+                self._on_xy_position_changed
+            )
 
     def set(self, value: Any, **kwargs: Any) -> Status:
         """Set something in the stage device."""
@@ -103,6 +131,14 @@ class MMCoreStageDevice(Device, MotorProtocol, Loggable):
                 self._active_axis = value
                 s.set_finished()
                 return s
+            elif propr == "sequence" and isinstance(value, Sequence):
+                try:
+                    self._load_sequence([float(v) for v in value])
+                except Exception as e:
+                    s.set_exception(e)
+                else:
+                    s.set_finished()
+                return s
             elif propr == "step_size" and isinstance(value, int | float):
                 # bare "step_size" updates the currently active axis
                 self.step_sizes[self._active_axis] = value
@@ -120,41 +156,119 @@ class MMCoreStageDevice(Device, MotorProtocol, Loggable):
             else:
                 s.set_exception(ValueError(f"Invalid property: {propr}"))
                 return s
-        else:
-            if not isinstance(value, int | float):
-                s.set_exception(TypeError(f"Expected float, got {type(value)}"))
+        elif isinstance(value, Mapping):
+            # several axes at once; XY stages move both axes with one call
+            unknown = [ax for ax in value if ax not in self.axis]
+            if unknown or not value:
+                s.set_exception(ValueError(f"Invalid axes {unknown} for {self.axis}."))
                 return s
-        axis = self._active_axis
+            if not all(isinstance(v, int | float) for v in value.values()):
+                s.set_exception(TypeError(f"Expected float targets, got {value}"))
+                return s
+            for ax, target in value.items():
+                self._positions[ax]["setpoint"] = float(target)
+            self._executor.submit(self._move, s)
+            return s
+        elif not isinstance(value, int | float):
+            s.set_exception(TypeError(f"Expected float, got {type(value)}"))
+            return s
+        self._positions[self._active_axis]["setpoint"] = float(value)
+        self._executor.submit(self._move, s)
+        return s
+
+    def sequence_max_length(self, axis: str) -> int:
+        """Return the maximum length of a position sequence for ``axis``.
+
+        Returns 0 if the stage cannot be sequenced.
+        """
+        if axis not in self.axis:
+            return 0
+        if self._stage_type == "Z":
+            if not self._core.isStageSequenceable(self.name):
+                return 0
+            return int(self._core.getStageSequenceMaxLength(self.name))
+        if not self._core.isXYStageSequenceable(self.name):
+            return 0
+        return int(self._core.getXYStageSequenceMaxLength(self.name))
+
+    def kickoff(self) -> Status:
+        """Start the loaded position sequence."""
+        s = Status()
+        if self._sequence is None:
+            s.set_exception(
+                RuntimeError("No position sequence loaded; set a sequence first.")
+            )
+            return s
+        try:
+            if self._stage_type == "Z":
+                self._core.startStageSequence(self.name)
+            else:
+                self._core.startXYStageSequence(self.name)
+        except Exception as e:
+            s.set_exception(RuntimeError(f"Failed to start sequence: {e}"))
+        else:
+            s.set_finished()
+        return s
+
+    def complete(self) -> Status:
+        """Stop the running position sequence.
+
+        The setpoint of the sequenced axis is moved to the last position of the sequence.
+        """
+        s = Status()
+        if self._sequence is None:
+            s.set_exception(RuntimeError("No position sequence loaded."))
+            return s
+        axis, positions = self._sequence
+        self._sequence = None
         try:
-            match self._stage_type:
-                case "Z":
-                    z = self._core.getPosition(self.name) + value
-                    self._core.setPosition(self.name, z)
-                case "XY":
-                    positions = self._core.getXYPosition(self.name)
-                    x = positions[0]
-                    y = positions[1]
-                    if axis == "X":
-                        x = x + value
-                    elif axis == "Y":
-                        y = y + value
-                    self._core.setXYPosition(self.name, x, y)
-                case _:
-                    s.set_exception(  # type: ignore[unreachable]
-                        RuntimeError(f"Unsupported stage type: {self._stage_type}")
-                    )
+            if self._stage_type == "Z":
+                self._core.stopStageSequence(self.name)
+            else:
+                self._core.stopXYStageSequence(self.name)
         except Exception as e:
-            s.set_exception(RuntimeError(f"Failed to set position: {e}"))
+            s.set_exception(RuntimeError(f"Failed to stop sequence: {e}"))
             return s
-        self._positions[self._active_axis]["setpoint"] += value
-        s.add_callback(self._update_readback)
+        self._positions[axis]["setpoint"] = positions[-1]
+        self._refresh_readback()
         s.set_finished()
         return s
 
+    def _load_sequence(self, positions: list[float]) -> None:
+        """Load a sequence of absolute positions for the active axis.
+
+        For XY stages, the other axis is held at its current position.
+        """
+        axis = self._active_axis
+        max_length = self.sequence_max_length(axis)
+        if max_length == 0:
+            raise RuntimeError(f"Stage {self.name} cannot be sequenced.")
+        if not 0 < len(positions) <= max_length:
+            raise ValueError(
+                f"Sequence length must be between 1 and {max_length}, "
+                f"got {len(positions)}."
+            )
+        if self._stage_type == "Z":
+            self._core.loadStageSequence(self.name, positions)
+        else:
+            x, y = self._core.getXYPosition(self.name)
+            held = [x if axis == "Y" else y] * len(positions)
+            xs, ys = (positions, held) if axis == "X" else (held, positions)
+            self._core.loadXYStageSequence(self.name, xs, ys)
+        self._sequence = (axis, positions)
+        self.logger.debug(f"Loaded sequence of {len(positions)} positions on {axis}.")
+
     def locate(self) -> Location[float]:
         """Locate the active axis position."""
         return self._positions[self._active_axis]
 
+    def locate_axes(self) -> dict[str, Location[float]]:
+        """Return the location of every axis."""
+        return {
+            ax: {"setpoint": loc["setpoint"], "readback": loc["readback"]}
+            for ax, loc in self._positions.items()
+        }
+
     def read_configuration(self) -> dict[str, Reading[Any]]:
         timestamp = time.time()
         config: dict[str, Reading[Any]] = {
@@ -194,20 +308,58 @@ class MMCoreStageDevice(Device, MotorProtocol, Loggable):
         return s
 
     def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
+        if self._stage_type == "Z":
+            self._core.events.stagePositionChanged.disconnect(self._on_position_changed)
+        else:
+            self._core.events.XYStagePositionChanged.disconnect(
+                self._on_xy_position_changed
+            )
         self._core.unloadDevice(self.name)
 
-    def _update_readback(self, status: Status) -> None:
-        """Update the currently active axis readback position.
+    def _move(self, status: Status) -> None:
+        """Move the stage to the current setpoints and wait until it stops.
 
-        When the status object is set as finished successfully,
-        the readback position is updated to match the setpoint.
+        Runs on the worker thread. XY stages are moved with a single call
+        using the setpoints of both axes, so that queued moves on
+        different axes do not undo each other.
 
         Parameters
         ----------
-        s : Status
-            The status object associated with the callback.
+        status : Status
+            The status object to complete when the movement is done.
         """
-        if status.success:
-            self._positions[self._active_axis]["readback"] = self._positions[
-                self._active_axis
-            ]["setpoint"]
+        try:
+            if self._stage_type == "Z":
+                self._core.setPosition(self.name, self._positions["Z"]["setpoint"])
+            else:
+                self._core.setXYPosition(
+                    self.name,
+                    self._positions["X"]["setpoint"],
+                    self._positions["Y"]["setpoint"],
+                )
+            self._core.waitForDevice(self.name)
+            self._refresh_readback()
+        except Exception as e:
+            status.set_exception(RuntimeError(f"Failed to set position: {e}"))
+        else:
+            status.set_finished()
+
+    def _refresh_readback(self) -> None:
+        """Query the stage for its current position."""
+        if self._stage_type == "Z":
+            self._on_position_changed(self.name, self._core.getPosition(self.name))
+        else:
+            x, y = self._core.getXYPosition(self.name)
+            self._on_xy_position_changed(self.name, x, y)
+
+    def _on_position_changed(self, name: str, position: float) -> None:
+        """Cache the position reported by a Z stage."""
+        if name == self.name:
+            self._positions["Z"]["readback"] = float(position)
+
+    def _on_xy_position_changed(self, name: str, x: float, y: float) -> None:
+        """Cache the position reported by an XY stage."""
+        if name == self.name:
+            self._positions["X"]["readback"] = float(x)
+            self._positions["Y"]["readback"] = float(y)
@@ -11,6 +11,8 @@ class StageConfigDict(TypedDict):
     axis: list[str]
     limits: dict[str, tuple[float, float]]
     step_sizes: dict[str, float]
+    settle_time: float
+    defaults: dict[str, str]
 
 
 @dataclass(frozen=True)
@@ -35,6 +37,12 @@ class BaseStageConfig(ABC):
     step_sizes: dict[str, float] = field(default_factory=dict)
     """Mapping of axis names to their step sizes in microns."""
 
+    settle_time: float = 0.05
+    """Time in seconds to wait after a movement for the stage to settle."""
+
+    defaults: dict[str, str] = field(default_factory=dict)
+    """Default property values for the stage device."""
+
     def dump(self) -> StageConfigDict:
         """Dump the stage configuration to a dictionary."""
         return {
@@ -43,6 +51,8 @@ class BaseStageConfig(ABC):
             "axis": self.axis,
             "limits": self.limits,
             "step_sizes": self.step_sizes,
+            "settle_time": self.settle_time,
+            "defaults": self.defaults,
         }
 
 
@@ -76,3 +86,6 @@ class DemoZStageConfig(BaseStageConfig):
         default_factory=lambda: {"Z": (-300.0, 300.0)}
     )
     step_sizes: dict[str, float] = field(default_factory=lambda: {"Z": 0.025})
+
+    # the demo stage only reports itself as sequenceable on request
+    defaults: dict[str, str] = field(default_factory=lambda: {"UseSequences": "Yes"})
@@ -1,3 +1,33 @@
+from ._cache import MedianCache
 from ._devices import MedianPseudoDevice
+from ._positions import PositionPseudoDevice
+from ._reducers import (
+    MaxReducer,
+    MeanReducer,
+    MedianReducer,
+    MinReducer,
+    PercentileReducer,
+    Reducer,
+    ReducerKind,
+    RollingMedianReducer,
+    TrimmedMeanReducer,
+    make_reducer,
+)
+from ._tiles import TilePseudoDevice
 
-__all__ = ["MedianPseudoDevice"]
+__all__ = [
+    "MaxReducer",
+    "MeanReducer",
+    "MedianCache",
+    "MedianPseudoDevice",
+    "MedianReducer",
+    "MinReducer",
+    "PercentileReducer",
+    "PositionPseudoDevice",
+    "Reducer",
+    "ReducerKind",
+    "RollingMedianReducer",
+    "TilePseudoDevice",
+    "TrimmedMeanReducer",
+    "make_reducer",
+]
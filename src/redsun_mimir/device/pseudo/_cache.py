@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from pathlib import Path
+from threading import Lock
+from typing import TYPE_CHECKING
+
+import numpy as np
+from redsun.log import Loggable
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    import numpy.typing as npt
+
+
+class MedianCache(Loggable):
+    """On-disk cache of previously computed median (background) frames.
+
+    Each entry is stored as a ``.npy`` file inside ``root``; an
+    ``index.json`` file keeps track of the acquisition context the
+    frame was computed for, when it was created and when it was last used.
+
+    Entries are keyed by a hash of their acquisition context
+    (see [`make_key`][redsun_mimir.device.pseudo.MedianCache.make_key]).
+    When more than ``max_entries`` frames are stored, the least recently
+    used ones are evicted.
+
+    Parameters
+    ----------
+    root : Path | str | None, optional
+        Directory where the cache is stored.
+        Defaults to ``~/redsun-storage/.median-cache``.
+    max_entries : int, optional
+        Maximum number of frames kept in the cache. Defaults to 32.
+    max_age : float, optional
+        Default maximum age of a valid entry, in seconds.
+        Older entries are never returned and are removed on the next write.
+        Defaults to 3600 (one hour).
+    """
+
+    _index_name = "index.json"
+
+    def __init__(
+        self,
+        root: Path | str | None = None,
+        max_entries: int = 32,
+        max_age: float = 3600.0,
+    ) -> None:
+        if root is None:
+            root = Path.home() / "redsun-storage" / ".median-cache"
+        self.root = Path(root)
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self._lock = Lock()
+        self._index: dict[str, dict[str, Any]] | None = None
+
+    @staticmethod
+    def make_key(
+        detector: str,
+        *,
+        exposure: float | None,
+        roi: Any,
+        pixel_type: str,
+        position: Any,
+        bucket: float,
+        **extra: Any,
+    ) -> tuple[str, dict[str, Any]]:
+        """Build the cache key of an acquisition context.
+
+        Parameters
+        ----------
+        detector : str
+            Name of the detector.
+        exposure : float | None
+            Exposure time of the detector.
+        roi : Any
+            Region of interest of the detector (any JSON-serializable value).
+        pixel_type : str
+            Data type of the detector frames.
+        position : Any
+            Stage position where the background was acquired, one value per axis.
+        bucket : float
+            Size of the stage-position bucket; positions falling
+            in the same bucket map to the same key.
+        **extra : Any
+            Any additional JSON-serializable parameter affecting the
+            computed frame (i.e. the reducer used).
+
+        Returns
+        -------
+        tuple[str, dict[str, Any]]
+            The key and the context it was computed from.
+        """
+        context: dict[str, Any] = {
+            "detector": detector,
+            "exposure": exposure,
+            "roi": [int(v) for v in roi],
+            "pixel_type": str(np.dtype(pixel_type)),
+            "position": [int(np.floor(p / bucket)) for p in position],
+            **extra,
+        }
+        payload = json.dumps(context, sort_keys=True)
+        key = hashlib.sha1(payload.encode("utf-8")).hexdigest()
+        return key, context
+
+    def get(self, key: str, max_age: float | None = None) -> npt.NDArray[Any] | None:
+        """Return the cached frame for ``key``, if present and valid.
+
+        Parameters
+        ----------
+        key : str
+            Cache key, as returned by ``make_key``.
+        max_age : float | None, optional
+            Maximum age of the entry in seconds.
+            Defaults to the cache ``max_age``.
+
+        Returns
+        -------
+        numpy.ndarray | None
+            The cached frame, or ``None`` if missing or expired.
+        """
+        max_age = self.max_age if max_age is None else max_age
+        with self._lock:
+            index = self._load_index()
+            entry = index.get(key)
+            if entry is None:
+                return None
+            now = time.time()
+            if now - entry["created"] > max_age:
+                return None
+            try:
+                frame: npt.NDArray[Any] = np.load(self.root / entry["file"])
+            except (OSError, ValueError) as e:
+                self.logger.warning(f"Discarding unreadable cache entry {key}: {e}")
+                index.pop(key)
+                self._save_index(index)
+                return None
+            entry["accessed"] = now
+            self._save_index(index)
+        return frame
+
+    def put(self, key: str, frame: npt.NDArray[Any], context: dict[str, Any]) -> None:
+        """Store ``frame`` in the cache.
+
+        Expired entries are removed and, if the cache is full,
+        the least recently used entries are evicted.
+
+        Parameters
+        ----------
+        key : str
+            Cache key, as returned by ``make_key``.
+        frame : numpy.ndarray
+            Frame to store.
+        context : dict[str, Any]
+            Acquisition context of the frame, as returned by ``make_key``.
+        """
+        with self._lock:
+            self.root.mkdir(parents=True, exist_ok=True)
+            index = self._load_index()
+            now = time.time()
+            filename = f"{key}.npy"
+            np.save(self.root / filename, frame)
+            index[key] = {
+                "file": filename,
+                "created": now,
+                "accessed": now,
+                "context": context,
+            }
+            expired = [k for k, v in index.items() if now - v["created"] > self.max_age]
+            by_access = sorted(
+                (k for k in index if k not in expired),
+                key=lambda k: index[k]["accessed"],
+            )
+            evicted = by_access[: max(0, len(by_access) - self.max_entries)]
+            for k in [*expired, *evicted]:
+                (self.root / index.pop(k)["file"]).unlink(missing_ok=True)
+            self._save_index(index)
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            index = self._load_index()
+            for entry in index.values():
+                (self.root / entry["file"]).unlink(missing_ok=True)
+            index.clear()
+            self._save_index(index)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._load_index())
+
+    def _load_index(self) -> dict[str, dict[str, Any]]:
+        if self._index is None:
+            path = self.root / self._index_name
+            try:
+                self._index = json.loads(path.read_text())
+            except FileNotFoundError:
+                self._index = {}
+            except (OSError, ValueError) as e:
+                self.logger.warning(f"Resetting unreadable cache index: {e}")
+                self._index = {}
+        return self._index
+
+    def _save_index(self, index: dict[str, dict[str, Any]]) -> None:
+        if not self.root.exists():
+            return
+        path = self.root / self._index_name
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(index))
+        tmp.replace(path)
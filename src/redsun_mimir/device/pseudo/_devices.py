@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import time
-from typing import TYPE_CHECKING, Any, cast
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Literal, cast
 
 import numpy as np
 from bluesky.protocols import Reading, Triggerable
@@ -11,7 +12,10 @@ from redsun.utils.descriptors import make_key
 
 from redsun_mimir.protocols import PseudoCacheFlyer, ReadableFlyer
 
+from ._reducers import MedianReducer, RollingMedianReducer
+
 if TYPE_CHECKING:
+    from concurrent.futures import Future
     from typing import Iterator
 
     import numpy.typing as npt
@@ -19,6 +23,13 @@ if TYPE_CHECKING:
     from redsun.storage import PrepareInfo
     from typing_extensions import TypeIs
 
+    from ._reducers import Reducer
+
+
+# shared by all pseudo-devices, so that the reductions
+# of multiple detectors triggered together run in parallel
+_reduction_executor = ThreadPoolExecutor(thread_name_prefix="median-reduction")
+
 
 def is_flat_descriptor(
     d: dict[str, Descriptor] | dict[str, dict[str, Descriptor]],
@@ -38,6 +49,11 @@ class MedianPseudoDevice(PseudoCacheFlyer, Triggerable, Loggable):
     the run is opened. There should be one instance of
     the pseudo-model per each detector that is being monitored for median computation.
 
+    Stashed frames are handed to a [`Reducer`][redsun_mimir.device.pseudo.Reducer],
+    which computes the background frame when the pseudo-model is triggered.
+    By default, the per-pixel median is computed; other reducers
+    (i.e. mean, trimmed mean) trade off quality for speed.
+
     Parameters
     ----------
     reader: ReadableFlyer
@@ -51,6 +67,36 @@ class MedianPseudoDevice(PseudoCacheFlyer, Triggerable, Loggable):
         The stream key suffix to look for in the reader's ``describe_collect()``
         output.  Combined as ``{reader.name}:{collect_target}``.
         Defaults to ``"buffer:stream"``.
+    reducer: Reducer, optional
+        Reducer used to compute the background frame from the stashed readings.
+        Defaults to a new [`MedianReducer`][redsun_mimir.device.pseudo.MedianReducer].
+    dtype: Literal["float32", "float64"], optional
+        Floating point precision of the computed frame, both in memory
+        and when written to disk. ``float32`` is exact for 8/12/16-bit
+        camera data and halves memory and bandwidth compared to ``float64``.
+        Defaults to ``"float32"``.
+    convergence_window: int | None, optional
+        Number of stashed frames over which the running median used to
+        estimate the convergence of the background is computed (see `convergence`).
+        If ``None`` (default), the convergence is not tracked.
+    probe_stride: int, optional
+        Subsampling stride of the frames used to estimate the convergence
+        of the background. Defaults to 8.
+    roi: tuple[int, int, int, int] | None, optional
+        Region ``(x, y, w, h)`` of the frames over which the background is
+        computed, following the reader's buffer convention (the frame is indexed
+        as ``frame[x : x + w, y : y + h]``). Outside of the region, the
+        background is set to the median value of the region.
+        If ``None`` (default), the full frame is used.
+    binning: int, optional
+        Binning factor (1, 2 or 4) applied to the stashed frames before the
+        reduction. The reduced frame is upsampled back to the original size,
+        so that it can still be used for correction. Defaults to 1 (no binning).
+
+    Raises
+    ------
+    ValueError
+        If ``binning`` is not 1, 2 or 4.
     """
 
     def __init__(
@@ -60,8 +106,19 @@ class MedianPseudoDevice(PseudoCacheFlyer, Triggerable, Loggable):
         collect: dict[str, Descriptor] | dict[str, dict[str, Descriptor]],
         describe_target: str = "buffer",
         collect_target: str = "buffer_stream",
+        reducer: Reducer | None = None,
+        dtype: Literal["float32", "float64"] = "float32",
+        convergence_window: int | None = None,
+        probe_stride: int = 8,
+        roi: tuple[int, int, int, int] | None = None,
+        binning: int = 1,
     ) -> None:
+        if binning not in (1, 2, 4):
+            raise ValueError(f"Binning must be 1, 2 or 4, got {binning}.")
         self._name = f"{reader.name}_median"
+        self._roi = roi
+        self._binning = binning
+        self._frame_shape: tuple[int, ...] = tuple(reader.sensor_shape)
         self._reader_shape = reader.sensor_shape
 
         # hijack the internal writer
@@ -99,11 +156,23 @@ class MedianPseudoDevice(PseudoCacheFlyer, Triggerable, Loggable):
             if self._collect_target_key in key
         }
 
-        # initialize the cache with empty lists
-        self._cache: list[npt.NDArray[np.generic]] = []
+        # the reducer holds the cached readings
+        # (or their running statistics)
+        self._reducer = reducer or MedianReducer()
+
+        # running median of the subsampled frames, updated
+        # on each stash to estimate the background convergence
+        self._probe_stride = max(1, probe_stride)
+        self._probe = (
+            RollingMedianReducer(convergence_window)
+            if convergence_window is not None
+            else None
+        )
+        self._probe_estimate: npt.NDArray[Any] | None = None
+        self._convergence = np.inf
 
-        self._target_dtype = np.float64
-        self._empty_median = np.zeros(self._reader_shape, dtype=np.float64)
+        self._target_dtype = np.dtype(dtype)
+        self._empty_median = np.zeros(self._reader_shape, dtype=self._target_dtype)
 
     def describe_configuration(self) -> dict[str, Descriptor]:
         """Return the configuration descriptor.
@@ -149,44 +218,123 @@ class MedianPseudoDevice(PseudoCacheFlyer, Triggerable, Loggable):
     def stash(self, value: dict[str, Reading[Any]]) -> Status:
         """Store readings in the cache."""
         s = Status()
-        self._cache.append(value[self._describe_target_key]["value"])
+        frame = self._prepare_frame(value[self._describe_target_key]["value"])
+        self._reducer.push(frame)
+        self._update_convergence(frame)
         s.set_finished()
         return s
 
+    def _prepare_frame(self, frame: npt.NDArray[Any]) -> npt.NDArray[Any]:
+        """Crop and bin a frame before handing it to the reducer."""
+        self._frame_shape = frame.shape
+        if self._roi is not None:
+            x, y, w, h = self._roi
+            frame = frame[x : x + w, y : y + h]
+        b = self._binning
+        if b > 1:
+            rows, cols = frame.shape[0] // b, frame.shape[1] // b
+            frame = (
+                frame[: rows * b, : cols * b]
+                .reshape(rows, b, cols, b)
+                .mean(axis=(1, 3), dtype=np.float32)
+            )
+        return frame
+
+    def _restore_frame(self, reduced: npt.NDArray[Any]) -> npt.NDArray[Any]:
+        """Upsample and place a reduced frame back to the original frame size."""
+        b = self._binning
+        if self._roi is not None:
+            x, y, w, h = self._roi
+            w = min(w, self._frame_shape[0] - x)
+            h = min(h, self._frame_shape[1] - y)
+        else:
+            x, y = 0, 0
+            w, h = self._frame_shape[0], self._frame_shape[1]
+        if b > 1:
+            reduced = np.repeat(np.repeat(reduced, b, axis=0), b, axis=1)
+            # binning drops the trailing rows and columns
+            # that do not fill a full bin; replicate the edges
+            reduced = np.pad(
+                reduced,
+                ((0, w - reduced.shape[0]), (0, h - reduced.shape[1])),
+                mode="edge",
+            )
+        if self._roi is None:
+            return reduced
+        full = np.full(self._frame_shape, np.median(reduced), dtype=reduced.dtype)
+        full[x : x + w, y : y + h] = reduced
+        return full
+
+    def _update_convergence(self, frame: npt.NDArray[Any]) -> None:
+        """Update the convergence estimate with a new frame."""
+        if self._probe is None:
+            return
+        stride = (slice(None, None, self._probe_stride),) * frame.ndim
+        self._probe.push(frame[stride])
+        estimate = self._probe.result()
+        previous = self._probe_estimate
+        self._probe_estimate = estimate
+        if previous is None:
+            return
+        change = float(np.median(np.abs(estimate - previous)))
+        scale = float(np.median(np.abs(previous)))
+        self._convergence = change / scale if scale > 0 else change
+
     def clear(self) -> Status:
         """Clear the cached readings."""
         s = Status()
-        self._cache.clear()
+        self._reducer.reset()
+        if self._probe is not None:
+            self._probe.reset()
+        self._probe_estimate = None
+        self._convergence = np.inf
         self._valid_readings = False
         s.set_finished()
         return s
 
     def trigger(self) -> Status:
-        """Compute the median of the cached readings."""
+        """Reduce the cached readings to the background frame.
+
+        The reduction runs on a shared worker pool; the returned status
+        completes when the background frame is available. Triggering
+        multiple pseudo-models in the same group computes their frames in parallel.
+        """
         s = Status()
-        if self._cache and not self._valid_readings:
-            stack = np.stack(self._cache, axis=0)
-            median_value = cast(
-                "npt.NDArray[np.generic]",
-                np.median(stack, axis=0).astype(self._target_dtype),
-            )
-            # if any pixels are 0, set them to the minimum
-            # non-zero value to avoid issues with downstream processing
-            nonzero: npt.NDArray[np.generic] = median_value[median_value != 0].min()
-            if nonzero.size > 0:
-                median_value[median_value == 0] = nonzero
-            shape = median_value.shape
-            dtype = median_value.dtype
-            self._median[self._reading_key] = {
-                "value": median_value,
-                "timestamp": time.time(),
-            }
-            self._median_shape = shape
-            self._median_dtype = dtype
-            self._valid_readings = True
-        s.set_finished()
+        if self._reducer.count == 0 or self._valid_readings:
+            s.set_finished()
+            return s
+
+        def _on_done(future: Future[None]) -> None:
+            exc = future.exception()
+            if exc is not None:
+                self.logger.error(f"Failed to compute the median: {exc}")
+                s.set_exception(exc)
+            else:
+                s.set_finished()
+
+        _reduction_executor.submit(self._reduce).add_done_callback(_on_done)
         return s
 
+    def _reduce(self) -> None:
+        median_value = cast(
+            "npt.NDArray[np.generic]",
+            self._restore_frame(self._reducer.result()).astype(
+                self._target_dtype, copy=False
+            ),
+        )
+        # if any pixels are 0, set them to the minimum
+        # non-zero value to avoid issues with downstream processing
+        zeros = median_value == 0
+        if zeros.any() and not zeros.all():
+            median_value[zeros] = median_value[~zeros].min()
+        self._median[self._reading_key] = {
+            "value": median_value,
+            "timestamp": time.time(),
+        }
+        self._median_shape = median_value.shape
+        self._median_dtype = median_value.dtype
+        self._valid_readings = True
+
     def prepare(self, _: PrepareInfo) -> Status:
         """Prepare for flight by constructing a writer for the median frame."""
         s = Status()
@@ -195,7 +343,7 @@ class MedianPseudoDevice(PseudoCacheFlyer, Triggerable, Loggable):
                 self.name,
                 self._collect_key,
                 shape=self._reader_shape,
-                dtype=np.dtype(self._target_dtype),
+                dtype=self._target_dtype,
                 capacity=1,
             )
         except Exception as e:
@@ -245,6 +393,17 @@ class MedianPseudoDevice(PseudoCacheFlyer, Triggerable, Loggable):
             return 0
         return self._writer.get_indices_written(self.name)
 
+    @property
+    def convergence(self) -> float:
+        """Relative change of the background estimate caused by the last stashed frame.
+
+        Computed as the median absolute change of a subsampled running
+        median, divided by the median of the previous estimate.
+        It is ``inf`` until at least two frames have been stashed,
+        or if no ``convergence_window`` was given.
+        """
+        return self._convergence
+
     @property
     def name(self) -> str:
         """The name of the pseudo model."""
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from bluesky.protocols import Readable, Triggerable
+from redsun.engine import Status
+from redsun.log import Loggable
+from redsun.utils.descriptors import make_descriptor, make_key
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+    import numpy.typing as npt
+    from bluesky.protocols import Descriptor, Reading
+
+
+class PositionPseudoDevice(Readable[Any], Triggerable, Loggable):
+    """A pseudo-model providing the stage position of each frame of a flight.
+
+    During a fly scan, frames are acquired while the stage is moving; the
+    motor only reports its position at the start and at the end of each
+    movement. The pseudo-model interpolates linearly between these known
+    positions (`knots`) at the timestamps of the acquired frames.
+
+    After `load`, each call to `trigger` advances to the next frame, and
+    `read` returns its interpolated position, timestamped with the frame
+    acquisition time; the frames can then be emitted as a stream of events
+    with ``trigger_and_read``.
+
+    Positions known at acquisition time (i.e. when the stage is still)
+    can instead be added one at a time with `record`.
+
+    Parameters
+    ----------
+    name: str
+        Name of the pseudo-model.
+    axis: Sequence[str]
+        The motor axes the positions are interpolated for.
+    egu: str, optional
+        Engineering units of the positions. Defaults to ``"um"``.
+    """
+
+    def __init__(self, name: str, axis: Sequence[str], egu: str = "um") -> None:
+        self._name = name
+        self.axis = list(axis)
+        self.egu = egu
+        self._keys = {ax: make_key(self.name, ax.lower()) for ax in self.axis}
+        self._frame_key = make_key(self.name, "frame")
+        self._timestamps: npt.NDArray[np.float64] = np.empty(0)
+        self._positions: dict[str, npt.NDArray[np.float64]] = {}
+        self._index = -1
+
+    def load(
+        self,
+        frame_timestamps: Sequence[float],
+        knot_timestamps: Sequence[float],
+        knot_positions: Mapping[str, Sequence[float]],
+    ) -> None:
+        """Interpolate the positions of a flight.
+
+        Frames acquired before the first knot or after the last
+        one are assigned the first or last known position, respectively.
+
+        Parameters
+        ----------
+        frame_timestamps: Sequence[float]
+            Acquisition timestamps of the frames.
+        knot_timestamps: Sequence[float]
+            Timestamps at which the motor position is known,
+            in increasing order.
+        knot_positions: Mapping[str, Sequence[float]]
+            Known positions for each axis, one per knot timestamp.
+
+        Raises
+        ------
+        ValueError
+            If no knots are given, if the knots are not in increasing order,
+            or if the positions of an axis do not match the knot timestamps.
+        """
+        knots = np.asarray(knot_timestamps, dtype=np.float64)
+        if knots.size == 0:
+            raise ValueError("At least one known position is required.")
+        if np.any(np.diff(knots) < 0):
+            raise ValueError("Knot timestamps must be in increasing order.")
+        self._timestamps = np.asarray(frame_timestamps, dtype=np.float64)
+        self._positions = {}
+        for ax in self.axis:
+            values = np.asarray(knot_positions[ax], dtype=np.float64)
+            if values.shape != knots.shape:
+                raise ValueError(
+                    f"Expected {knots.size} positions for axis {ax}, got {values.size}."
+                )
+            self._positions[ax] = np.interp(self._timestamps, knots, values)
+        self._index = -1
+
+    def record(self, position: Mapping[str, float]) -> None:
+        """Append a position, acquired now, and make it the current frame.
+
+        Parameters
+        ----------
+        position: Mapping[str, float]
+            The current position of each axis.
+        """
+        if self._index < len(self) - 1:
+            # drop the frames that were never read
+            self._timestamps = self._timestamps[: self._index + 1]
+            for ax in self.axis:
+                self._positions[ax] = self._positions[ax][: self._index + 1]
+        self._timestamps = np.append(self._timestamps, time.time())
+        for ax in self.axis:
+            previous = self._positions.get(ax, np.empty(0))
+            self._positions[ax] = np.append(previous, float(position[ax]))
+        self._index = len(self) - 1
+
+    def positions(self) -> dict[str, npt.NDArray[np.float64]]:
+        """Return the interpolated positions of all frames, for each axis."""
+        return dict(self._positions)
+
+    def __len__(self) -> int:
+        return int(self._timestamps.size)
+
+    def trigger(self) -> Status:
+        """Advance to the next frame of the flight."""
+        s = Status()
+        if self._index + 1 >= len(self):
+            s.set_exception(IndexError("No more frames available."))
+            return s
+        self._index += 1
+        s.set_finished()
+        return s
+
+    def describe(self) -> dict[str, Descriptor]:
+        """Return the descriptor of the interpolated positions."""
+        descriptor: dict[str, Descriptor] = {
+            key: make_descriptor("data", "number", units=self.egu)
+            for key in self._keys.values()
+        }
+        descriptor[self._frame_key] = make_descriptor("data", "integer")
+        return descriptor
+
+    def read(self) -> dict[str, Reading[Any]]:
+        """Read the interpolated position of the current frame.
+
+        Before the first `trigger`, the first frame is read.
+        """
+        if len(self) == 0:
+            stamp = time.time()
+            readings: dict[str, Reading[Any]] = {
+                key: {"value": float("nan"), "timestamp": stamp}
+                for key in self._keys.values()
+            }
+            readings[self._frame_key] = {"value": -1, "timestamp": stamp}
+            return readings
+        index = max(self._index, 0)
+        stamp = float(self._timestamps[index])
+        readings = {
+            key: {"value": float(self._positions[ax][index]), "timestamp": stamp}
+            for ax, key in self._keys.items()
+        }
+        readings[self._frame_key] = {"value": index, "timestamp": stamp}
+        return readings
+
+    def describe_configuration(self) -> dict[str, Descriptor]:
+        """Return the configuration descriptor.
+
+        The position pseudo model does not have any configuration parameters.
+        """
+        return {}
+
+    def read_configuration(self) -> dict[str, Reading[Any]]:
+        """Return the configuration readings.
+
+        The position pseudo model does not have any configuration parameters.
+        """
+        return {}
+
+    @property
+    def name(self) -> str:
+        """The name of the pseudo model."""
+        return self._name
+
+    @property
+    def parent(self) -> None:
+        """The parent model, which is None for pseudo models."""
+        return None
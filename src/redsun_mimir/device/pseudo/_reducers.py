@@ -0,0 +1,357 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, Literal, cast
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from typing import ClassVar
+
+    import numpy.typing as npt
+
+ReducerKind = Literal["median", "mean", "trimmed_mean", "percentile", "min", "max"]
+"""Names of the reducers that can be built via [`make_reducer`][redsun_mimir.device.pseudo.make_reducer]."""
+
+
+class Reducer(ABC):
+    """Base class for per-pixel frame reducers.
+
+    A reducer accumulates frames via `push` and collapses
+    them into a single frame via `result`. Reducers marked as
+    `streaming` update their state in place for each new frame,
+    without keeping the individual frames in memory.
+    """
+
+    streaming: ClassVar[bool] = False
+
+    @abstractmethod
+    def push(self, frame: npt.NDArray[Any]) -> None:
+        """Add a new frame to the reducer state."""
+        ...
+
+    @abstractmethod
+    def result(self) -> npt.NDArray[np.float64]:
+        """Return the reduced frame computed over all pushed frames."""
+        ...
+
+    @abstractmethod
+    def reset(self) -> None:
+        """Discard all pushed frames."""
+        ...
+
+    @property
+    @abstractmethod
+    def count(self) -> int:
+        """Number of frames pushed since the last reset."""
+        ...
+
+
+class _BufferedReducer(Reducer):
+    """Reducer keeping all pushed frames until `result` is called."""
+
+    def __init__(self) -> None:
+        self._frames: list[npt.NDArray[Any]] = []
+
+    def push(self, frame: npt.NDArray[Any]) -> None:
+        # frames may come from a reused read buffer; keep our own copy
+        self._frames.append(np.array(frame, copy=True))
+
+    def result(self) -> npt.NDArray[np.float64]:
+        if not self._frames:
+            raise RuntimeError("No frames available to reduce.")
+        stack = np.stack(self._frames, axis=0)
+        return self._reduce(stack)
+
+    def reset(self) -> None:
+        self._frames.clear()
+
+    @property
+    def count(self) -> int:
+        return len(self._frames)
+
+    @abstractmethod
+    def _reduce(self, stack: npt.NDArray[Any]) -> npt.NDArray[np.float64]:
+        """Reduce a ``(frames, height, width)`` stack along the first axis."""
+        ...
+
+
+class MedianReducer(_BufferedReducer):
+    """Per-pixel median of the pushed frames."""
+
+    def _reduce(self, stack: npt.NDArray[Any]) -> npt.NDArray[np.float64]:
+        return cast("npt.NDArray[np.float64]", np.median(stack, axis=0))
+
+
+class PercentileReducer(_BufferedReducer):
+    """Per-pixel percentile of the pushed frames.
+
+    Parameters
+    ----------
+    q : float
+        Percentile to compute, in the range ``[0, 100]``.
+    """
+
+    def __init__(self, q: float = 50.0) -> None:
+        if not 0.0 <= q <= 100.0:
+            raise ValueError(f"Percentile must be in [0, 100], got {q}.")
+        super().__init__()
+        self.q = q
+
+    def _reduce(self, stack: npt.NDArray[Any]) -> npt.NDArray[np.float64]:
+        return cast("npt.NDArray[np.float64]", np.percentile(stack, self.q, axis=0))
+
+
+class TrimmedMeanReducer(_BufferedReducer):
+    """Per-pixel trimmed mean of the pushed frames.
+
+    Parameters
+    ----------
+    proportion : float
+        Fraction of frames to cut from each end of the
+        sorted per-pixel distribution, in the range ``[0, 0.5)``.
+        Defaults to 0.2 (20% trimmed mean).
+    """
+
+    def __init__(self, proportion: float = 0.2) -> None:
+        if not 0.0 <= proportion < 0.5:
+            raise ValueError(f"Trim proportion must be in [0, 0.5), got {proportion}.")
+        super().__init__()
+        self.proportion = proportion
+
+    def _reduce(self, stack: npt.NDArray[Any]) -> npt.NDArray[np.float64]:
+        n = stack.shape[0]
+        cut = int(self.proportion * n)
+        if cut == 0:
+            return cast("npt.NDArray[np.float64]", stack.mean(axis=0, dtype=np.float64))
+        stack = np.sort(stack, axis=0)
+        return cast(
+            "npt.NDArray[np.float64]",
+            stack[cut : n - cut].mean(axis=0, dtype=np.float64),
+        )
+
+
+class MeanReducer(Reducer):
+    """Running per-pixel mean.
+
+    Frames are accumulated into a single float64
+    buffer, so each push costs one in-place addition.
+    """
+
+    streaming = True
+
+    def __init__(self) -> None:
+        self._sum: npt.NDArray[np.float64] | None = None
+        self._count = 0
+
+    def push(self, frame: npt.NDArray[Any]) -> None:
+        if self._sum is None or self._sum.shape != frame.shape:
+            self._sum = np.zeros(frame.shape, dtype=np.float64)
+            self._count = 0
+        np.add(self._sum, frame, out=self._sum)
+        self._count += 1
+
+    def result(self) -> npt.NDArray[np.float64]:
+        if self._sum is None or self._count == 0:
+            raise RuntimeError("No frames available to reduce.")
+        return self._sum / self._count
+
+    def reset(self) -> None:
+        # keep the accumulator allocated for the next run
+        if self._sum is not None:
+            self._sum.fill(0.0)
+        self._count = 0
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+
+class _ExtremumReducer(Reducer):
+    """Running per-pixel extremum."""
+
+    streaming = True
+
+    def __init__(self) -> None:
+        self._value: npt.NDArray[Any] | None = None
+        self._count = 0
+
+    def push(self, frame: npt.NDArray[Any]) -> None:
+        if self._count == 0 or self._value is None or self._value.shape != frame.shape:
+            self._value = np.array(frame, copy=True)
+        else:
+            self._update(self._value, frame)
+        self._count += 1
+
+    def result(self) -> npt.NDArray[np.float64]:
+        if self._value is None or self._count == 0:
+            raise RuntimeError("No frames available to reduce.")
+        return self._value.astype(np.float64)
+
+    def reset(self) -> None:
+        self._count = 0
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @abstractmethod
+    def _update(self, value: npt.NDArray[Any], frame: npt.NDArray[Any]) -> None:
+        """Update ``value`` in place with ``frame``."""
+        ...
+
+
+class MinReducer(_ExtremumReducer):
+    """Running per-pixel minimum."""
+
+    def _update(self, value: npt.NDArray[Any], frame: npt.NDArray[Any]) -> None:
+        np.minimum(value, frame, out=value)
+
+
+class MaxReducer(_ExtremumReducer):
+    """Running per-pixel maximum."""
+
+    def _update(self, value: npt.NDArray[Any], frame: npt.NDArray[Any]) -> None:
+        np.maximum(value, frame, out=value)
+
+
+class RollingMedianReducer(Reducer):
+    """Per-pixel median over a sliding window of the last pushed frames.
+
+    The reducer keeps, for each pixel, the values of the current window
+    in sorted order, together with a ring buffer of the raw frames. Each push
+    removes the oldest value from the sorted window and inserts the new
+    one with a few element-wise passes over preallocated buffers, so the
+    cost of a push grows linearly with the window size rather than with a
+    full sort. Before the window is full, the missing entries are padded
+    with the largest value representable by ``dtype``.
+
+    Parameters
+    ----------
+    window : int
+        Number of frames in the sliding window. Defaults to 15.
+    dtype : numpy.typing.DTypeLike
+        Floating point type used to store the window. Defaults to ``float32``.
+    """
+
+    streaming = True
+
+    def __init__(self, window: int = 15, dtype: npt.DTypeLike = np.float32) -> None:
+        if window < 1:
+            raise ValueError(f"Window size must be at least 1, got {window}.")
+        self.window = window
+        self._dtype = np.dtype(dtype)
+        if not np.issubdtype(self._dtype, np.floating):
+            raise ValueError(f"Window dtype must be floating point, got {self._dtype}.")
+        # the largest finite value pads the window instead of +inf,
+        # so that the arithmetic selection never computes inf * 0
+        self._pad = np.finfo(self._dtype).max
+        self._shape: tuple[int, ...] = ()
+        self._sorted: npt.NDArray[Any] = np.empty((0, 0), dtype=self._dtype)
+        self._spare: npt.NDArray[Any] = np.empty((0, 0), dtype=self._dtype)
+        self._mask: npt.NDArray[Any] = np.empty((0, 0), dtype=self._dtype)
+        self._ring: npt.NDArray[Any] = np.empty((0, 0), dtype=self._dtype)
+        self._head = 0
+        self._count = 0
+
+    def _allocate(self, shape: tuple[int, ...]) -> None:
+        size = int(np.prod(shape))
+        self._shape = shape
+        self._sorted = np.full((self.window, size), self._pad, dtype=self._dtype)
+        self._spare = np.empty((self.window - 1, size), dtype=self._dtype)
+        self._mask = np.empty((self.window - 1, size), dtype=self._dtype)
+        self._ring = np.full((self.window, size), self._pad, dtype=self._dtype)
+        self._head = 0
+        self._count = 0
+
+    def push(self, frame: npt.NDArray[Any]) -> None:
+        if frame.shape != self._shape:
+            self._allocate(frame.shape)
+        new = np.asarray(frame, dtype=self._dtype).reshape(-1)
+        old = self._ring[self._head]
+        window = self._sorted
+        if self.window == 1:
+            window[0] = new
+        else:
+            # remove the value leaving the window: entries from its
+            # position onwards are taken from the next slot; the selection
+            # is done arithmetically, since masked copies are much slower
+            removed, keep = self._spare, self._mask
+            np.less(window[:-1], old, out=keep)
+            np.multiply(window[:-1], keep, out=removed)
+            np.subtract(1, keep, out=keep)
+            np.multiply(window[1:], keep, out=keep)
+            np.add(removed, keep, out=removed)
+            # ... then insert the new value, clipping it between
+            # the neighbours of each slot of the sorted window
+            np.minimum(new, removed[0], out=window[0])
+            np.maximum(removed[:-1], new, out=window[1:-1])
+            np.minimum(window[1:-1], removed[1:], out=window[1:-1])
+            np.maximum(removed[-1], new, out=window[-1])
+
+        self._ring[self._head] = new
+        self._head = (self._head + 1) % self.window
+        self._count = min(self._count + 1, self.window)
+
+    def result(self) -> npt.NDArray[Any]:
+        if self._count == 0:
+            raise RuntimeError("No frames available to reduce.")
+        n = self._count
+        lower = self._sorted[(n - 1) // 2]
+        median: npt.NDArray[Any]
+        if n % 2:
+            median = lower.copy()
+        else:
+            median = (lower + self._sorted[n // 2]) / 2
+        return median.reshape(self._shape)
+
+    def reset(self) -> None:
+        self._sorted.fill(self._pad)
+        self._ring.fill(self._pad)
+        self._head = 0
+        self._count = 0
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+
+def make_reducer(kind: ReducerKind, percent: float | None = None) -> Reducer:
+    """Build a reducer from its name.
+
+    Parameters
+    ----------
+    kind : ReducerKind
+        Name of the reducer to build.
+    percent : float | None, optional
+        Reducer parameter expressed as a percentage.
+        For ``"trimmed_mean"``, the percentage of frames cut from
+        each end of the distribution (defaults to 20).
+        For ``"percentile"``, the percentile to compute (defaults to 50).
+        Ignored by the other reducers.
+
+    Returns
+    -------
+    Reducer
+        A new reducer instance.
+
+    Raises
+    ------
+    ValueError
+        If ``kind`` is not a known reducer name.
+    """
+    match kind:
+        case "median":
+            return MedianReducer()
+        case "mean":
+            return MeanReducer()
+        case "trimmed_mean":
+            return TrimmedMeanReducer((20.0 if percent is None else percent) / 100.0)
+        case "percentile":
+            return PercentileReducer(50.0 if percent is None else percent)
+        case "min":
+            return MinReducer()
+        case "max":
+            return MaxReducer()
+        case _:
+            raise ValueError(f"Unknown reducer: {kind}")
@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from redsun.engine import Status
+from redsun.log import Loggable
+from redsun.storage import register_metadata
+from redsun.utils.descriptors import make_key
+
+from redsun_mimir.protocols import PseudoCacheFlyer
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+    import numpy.typing as npt
+    from bluesky.protocols import Descriptor, Reading, StreamAsset
+    from redsun.storage import FrameSink, PrepareInfo
+
+    from redsun_mimir.protocols import ReadableFlyer
+
+
+class TilePseudoDevice(PseudoCacheFlyer, Loggable):
+    """A pseudo-model streaming the tiles of a mosaic to disk.
+
+    Each reading stashed into the pseudo-model is written right away,
+    at full resolution, to the storage backend of the reference reader,
+    under the ``{reader.name}_tiles`` name. The stage position of each
+    tile is registered as metadata of the store.
+
+    The pseudo-model is intended to be created inside a plan before
+    the run is opened, one per detector.
+
+    Parameters
+    ----------
+    reader: ReadableFlyer
+        Reader whose frames are stashed as tiles, and whose writer is used
+        to store them.
+    shape: tuple[int, ...]
+        Shape of the tiles.
+    dtype: numpy.typing.DTypeLike
+        Data type of the tiles.
+    positions: Sequence[Sequence[float]]
+        Stage position of each tile, in acquisition order.
+    axis: Sequence[str]
+        Stage axes of the coordinates in ``positions``.
+    egu: str, optional
+        Engineering units of ``positions``. Defaults to ``"um"``.
+    describe_target: str, optional
+        The property suffix of the frames in the reader's readings.
+        Defaults to ``"buffer"``.
+    collect_target: str, optional
+        The stream key suffix of the tiles in the store.
+        Defaults to ``"buffer_stream"``.
+    """
+
+    def __init__(
+        self,
+        reader: ReadableFlyer,
+        shape: tuple[int, ...],
+        dtype: npt.DTypeLike,
+        positions: Sequence[Sequence[float]],
+        axis: Sequence[str],
+        egu: str = "um",
+        describe_target: str = "buffer",
+        collect_target: str = "buffer_stream",
+    ) -> None:
+        self._name = f"{reader.name}_tiles"
+        self._writer = reader.get_writer()
+        self._shape = tuple(shape)
+        self._dtype = np.dtype(dtype)
+        self._positions = [[float(v) for v in p] for p in positions]
+        self._axis = list(axis)
+        self._egu = egu
+        self._reading_key = make_key(reader.name, describe_target)
+        self._collect_key = make_key(self.name, collect_target)
+        self._sink: FrameSink | None = None
+        self._written = 0
+        self._assets_collected = False
+
+    def describe_configuration(self) -> dict[str, Descriptor]:
+        """Return the configuration descriptor.
+
+        The tile pseudo model does not have any configuration parameters.
+        """
+        return {}
+
+    def read_configuration(self) -> dict[str, Reading[Any]]:
+        """Return the configuration readings.
+
+        The tile pseudo model does not have any configuration parameters.
+        """
+        return {}
+
+    def describe(self) -> dict[str, Descriptor]:
+        """Return the descriptor of the number of tiles written."""
+        return {
+            make_key(self.name, "written"): {
+                "source": "data",
+                "dtype": "integer",
+                "shape": [],
+            }
+        }
+
+    def read(self) -> dict[str, Reading[Any]]:
+        """Read the number of tiles written so far."""
+        return {
+            make_key(self.name, "written"): {
+                "value": self._written,
+                "timestamp": time.time(),
+            }
+        }
+
+    def describe_collect(self) -> dict[str, Descriptor]:
+        """Return the descriptor of the tiles stored on disk."""
+        return {
+            self._collect_key: {
+                "source": "data",
+                "dtype": "array",
+                "shape": [None, *self._shape],
+                "external": "STREAM:",
+            }
+        }
+
+    def stash(self, value: dict[str, Reading[Any]]) -> Status:
+        """Write the frame of a reading as the next tile."""
+        s = Status()
+        try:
+            if self._sink is None:
+                raise RuntimeError("Tiles can only be stashed after prepare().")
+            self._sink.write(np.asarray(value[self._reading_key]["value"]))
+        except (KeyError, RuntimeError, ValueError, OSError) as e:
+            s.set_exception(e)
+        else:
+            self._written += 1
+            s.set_finished()
+        return s
+
+    def clear(self) -> Status:
+        """Reset the count of written tiles."""
+        s = Status()
+        self._written = 0
+        s.set_finished()
+        return s
+
+    def prepare(self, value: PrepareInfo) -> Status:
+        """Prepare the storage for the tiles of the mosaic.
+
+        The tile positions are registered as metadata of the store.
+        """
+        s = Status()
+        try:
+            register_metadata(
+                self.name,
+                {
+                    "tile_axis": self._axis,
+                    "tile_positions": self._positions,
+                    "tile_egu": self._egu,
+                },
+            )
+            self._sink = self._writer.prepare(
+                self.name,
+                self._collect_key,
+                dtype=self._dtype,
+                shape=self._shape,
+                capacity=len(self._positions),
+            )
+            self._written = 0
+        except (RuntimeError, TypeError, ValueError, OSError) as e:
+            s.set_exception(e)
+        else:
+            s.set_finished()
+        return s
+
+    def kickoff(self) -> Status:
+        """Open the store, so that stashed tiles are written right away."""
+        s = Status()
+        try:
+            self._assets_collected = False
+            self._writer.kickoff()
+        except (RuntimeError, OSError) as e:
+            s.set_exception(e)
+        else:
+            s.set_finished()
+        return s
+
+    def complete(self) -> Status:
+        """Close the tile sink."""
+        s = Status()
+        if self._sink is not None:
+            self._sink.close()
+            self._sink = None
+        s.set_finished()
+        return s
+
+    def collect_asset_docs(self, index: int | None = None) -> Iterator[StreamAsset]:
+        if self._assets_collected or self._sink is not None:
+            return
+
+        frames_written = self._writer.get_indices_written(self.name)
+        if frames_written == 0:
+            return
+
+        frames_to_report = (
+            min(index, frames_written) if index is not None else frames_written
+        )
+
+        self._assets_collected = True
+        yield from self._writer.collect_stream_docs(self.name, frames_to_report)
+
+    def get_index(self) -> int:
+        return self._writer.get_indices_written(self.name)
+
+    @property
+    def name(self) -> str:
+        """The name of the pseudo model."""
+        return self._name
+
+    @property
+    def parent(self) -> None:
+        """The parent model, which is None for pseudo models."""
+        return None
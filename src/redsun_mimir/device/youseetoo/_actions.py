@@ -1,8 +1,13 @@
 from __future__ import annotations
 
 import re
+from typing import TYPE_CHECKING, Final
 
 from msgspec import UNSET, Struct, UnsetType, field
+from msgspec.json import Decoder
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
 
 
 def _tag_action(class_name: str) -> str:
@@ -233,6 +238,27 @@ class MotorAction(_Action):
             position=position,
         )
 
+    @classmethod
+    def generate_movements(cls, positions: Mapping[int, int]) -> Movement:
+        """Generate a movement of several stepper motors at once.
+
+        Parameters
+        ----------
+        positions: `Mapping[int, int]`
+            Target position of each stepper motor, by ID.
+
+        Returns
+        -------
+        `Movement`
+            A `Movement` struct with a `MovementInfo` per stepper motor.
+        """
+        return Movement(
+            steppers=[
+                MovementInfo(id=id, position=position)
+                for id, position in positions.items()
+            ]
+        )
+
 
 class MovementResponseInfo(Struct):
     """Information about a movement response.
@@ -274,3 +300,118 @@ class MotorResponse(Struct):
 
     steppers: list[MovementResponseInfo]
     qid: int
+
+
+class StateRequest(Struct, tag_field="task", tag="/state_get"):
+    """Mimir request for the state of the board.
+
+    The board answers with a description of its state,
+    tagged with the request ``qid``; the request has no
+    side effects, and is used to probe whether the
+    board is up and responsive.
+
+    Attributes
+    ----------
+    qid: `int`, optional
+        UC2 queue ID for tracking the request.
+    """
+
+    qid: int | UnsetType = field(default=UNSET)
+
+
+class PositionRequest(Struct, tag_field="task", tag="/motor_get"):
+    """Mimir request for the current position of the steppers.
+
+    The board answers with a single `PositionResponse`,
+    reporting all the steppers at once.
+
+    Attributes
+    ----------
+    qid: `int`, optional
+        UC2 queue ID for tracking the request.
+    position: `bool`
+        Only report the positions, not the whole stepper configuration.
+        Defaults to ``True``.
+    """
+
+    qid: int | UnsetType = field(default=UNSET)
+    position: bool = field(default=True)
+
+
+class StepperPosition(Struct):
+    """Current position of a stepper motor.
+
+    Attributes
+    ----------
+    id: `int`
+        ID of the stepper motor.
+        Encoded name will be `stepperid`.
+    position: `int`
+        Current position of the stepper motor, in steps.
+    """
+
+    id: int = field(name="stepperid")
+    position: int
+
+
+class MotorState(Struct):
+    """Container for the positions of the stepper motors.
+
+    Attributes
+    ----------
+    steppers: `list[StepperPosition]`
+        Position of each stepper motor.
+    """
+
+    steppers: list[StepperPosition]
+
+
+class PositionResponse(Struct):
+    """Response for a position request.
+
+    Attributes
+    ----------
+    state: `MotorState`
+        Position of the stepper motors.
+        Encoded name will be `motor`.
+    qid: `int`
+        UC2 queue ID of the requested action.
+        Must match the `qid` in the `PositionRequest`.
+    """
+
+    state: MotorState = field(name="motor")
+    qid: int
+
+
+_acknowledge_decoder: Final = Decoder(Acknowledge)
+_motor_response_decoder: Final = Decoder(MotorResponse)
+_position_response_decoder: Final = Decoder(PositionResponse)
+
+
+def decode_response(frame: bytes) -> Acknowledge | MotorResponse | PositionResponse:
+    """Decode a response frame received from the device.
+
+    Position responses are recognized by their ``motor`` field,
+    and motor responses by their ``steppers`` field;
+    any other frame is decoded as an `Acknowledge`.
+
+    Parameters
+    ----------
+    frame: `bytes`
+        A complete JSON object, as extracted from the serial stream.
+
+    Returns
+    -------
+    `Acknowledge | MotorResponse | PositionResponse`
+        The decoded response.
+
+    Raises
+    ------
+    `msgspec.DecodeError`
+        If the frame is not valid JSON, or does not match the response type.
+    """
+    if b'"steppers"' in frame:
+        if b'"motor"' in frame:
+            return _position_response_decoder.decode(frame)
+        return _motor_response_decoder.decode(frame)
+    return _acknowledge_decoder.decode(frame)
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import threading
 import time
+from collections.abc import Mapping, Sequence
 from concurrent.futures import Future
+from functools import partial
 from typing import TYPE_CHECKING
 
 import msgspec
@@ -14,15 +17,29 @@ from redsun.utils.descriptors import make_descriptor, make_key, make_reading
 from serial import Serial
 
 import redsun_mimir.device.youseetoo.utils as uc2utils
-from redsun_mimir.protocols import LightProtocol, MotorProtocol
-
-from ._actions import Acknowledge, LaserAction, MotorAction, MotorResponse
+from redsun_mimir.protocols import LightProtocol, MultiAxisMotor, TrajectoryMotor
+from redsun_mimir.utils.trajectory import Trajectory
+
+from ._actions import (
+    LaserAction,
+    MotorAction,
+    MotorResponse,
+    PositionRequest,
+    PositionResponse,
+    StateRequest,
+    decode_response,
+)
+from ._engine import SerialEngine
+from ._framing import JSONFramer
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from typing import Any, ClassVar, Final
 
     from bluesky.protocols import Descriptor, Location, Reading
 
+    from ._actions import Acknowledge, MovementResponseInfo, StepperPosition
+
 
 class MimirSerialDevice(Device, Loggable):
     """Mimir interface for serial communication.
@@ -30,7 +47,12 @@ class MimirSerialDevice(Device, Loggable):
     This model is in charge of setting up the serial
     communication with a Mimir device. It does not provide
     direct interaction with the device, but rather opens the
-    serial port and provides it to other models.
+    serial port and provides a ``SerialEngine`` over it to other models;
+    all commands to the device go through the engine.
+
+    The connection handshake runs in the background, so that the
+    other devices can be built in the meantime; they receive the
+    engine through the future returned by `get` once the board is ready.
 
     Parameters
     ----------
@@ -42,16 +64,47 @@ class MimirSerialDevice(Device, Loggable):
         Baud rate for serial communication.
     timeout: `float`
         Timeout for serial communication in seconds.
-        Default is 3.0 s.
+        Default is 1.0 s.
+    command_timeout: `float`
+        Time in seconds to wait for the responses of a command
+        before reporting a failure. Default is 10.0 s.
+    probe_timeout: `float`
+        Time in seconds to wait for the board to answer a state
+        request; if it does, the board is already up and is not reset.
+        Default is 0.5 s.
+    reset_timeout: `float`
+        Maximum time in seconds to wait for the board to report
+        that its setup is done after a reset. Default is 5.0 s.
+    stats_interval: `float`
+        Time in seconds between two logs of the command timing
+        statistics (see `statistics`); 0 disables the logging.
+        Default is 60.0 s.
     """
 
-    # as the serial port needs to be shared between devices
+    # as the serial engine needs to be shared between devices
     # via a class method, it gets stored as a class variable
-    _serial: ClassVar[Serial | None] = None
-    _futures: ClassVar[set[Future[Serial]]] = set()
+    _engine: ClassVar[SerialEngine | None] = None
+    # futures are resolved in order of request, so that
+    # the devices built first are also served first
+    _futures: ClassVar[list[Future[SerialEngine]]] = []
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+
+    # qid of the probe; the engine starts counting from 1
+    _probe_qid: ClassVar[int] = 0
+    # printed by the firmware when the setup after a reset is done
+    _ready_marker: ClassVar[bytes] = b"{'setup': 'done'}"
 
     def __init__(
-        self, name: str, /, port: str, bauderate: int = 115200, timeout: float = 1.0
+        self,
+        name: str,
+        /,
+        port: str,
+        bauderate: int = 115200,
+        timeout: float = 1.0,
+        command_timeout: float = 10.0,
+        probe_timeout: float = 0.5,
+        reset_timeout: float = 5.0,
+        stats_interval: float = 60.0,
     ) -> None:
         if bauderate not in uc2utils.BaudeRate.__members__.values():
             self.logger.error(
@@ -60,7 +113,21 @@ class MimirSerialDevice(Device, Loggable):
                 f"Setting to default value {uc2utils.BaudeRate.BR115200.value}."
             )
             bauderate = uc2utils.BaudeRate.BR115200.value
-        super().__init__(name, port=port, bauderate=bauderate, timeout=timeout)
+        super().__init__(
+            name,
+            port=port,
+            bauderate=bauderate,
+            timeout=timeout,
+            command_timeout=command_timeout,
+            probe_timeout=probe_timeout,
+            reset_timeout=reset_timeout,
+            stats_interval=stats_interval,
+        )
+        self.command_timeout = command_timeout
+        self.stats_interval = stats_interval
+        self.probe_timeout = probe_timeout
+        self.reset_timeout = reset_timeout
+        self._instance_engine: SerialEngine | None = None
 
         # we could wrap the serial creation in a
         # try-except block to catch potential errors;
@@ -68,39 +135,107 @@ class MimirSerialDevice(Device, Loggable):
         # serial port cannot be opened, because without
         # it the device can't work at all
         try:
-            MimirSerialDevice._serial = Serial(
+            self._instance_serial = Serial(
                 port=port,
                 baudrate=bauderate,
                 timeout=timeout,
             )
         except Exception as e:
             raise RuntimeError(f"Failed to open serial port: {e}") from e
-        if MimirSerialDevice._serial is not None:
-            self._instance_serial = MimirSerialDevice._serial
-        if len(MimirSerialDevice._futures) > 0:
-            # if there are futures waiting for the serial to be ready,
-            # set the result for all of them
-            for future in MimirSerialDevice._futures:
-                future.set_result(self._instance_serial)
-            MimirSerialDevice._futures.clear()
 
+        self._handshake_thread = threading.Thread(
+            target=self._handshake, name="uc2-handshake", daemon=True
+        )
+        self._handshake_thread.start()
+
+    def _handshake(self) -> None:
+        """Make sure the board is ready, then start the serial engine."""
+        try:
+            if self._probe():
+                self.logger.info("Board is up; skipping reset.")
+            else:
+                self._reset()
+            # from now on, the engine owns the serial port
+            engine = SerialEngine(
+                self._instance_serial,
+                timeout=self.command_timeout,
+                stats_interval=self.stats_interval or None,
+            )
+        except Exception as e:
+            self.logger.error(f"Serial handshake failed: {e}")
+            with MimirSerialDevice._lock:
+                futures, MimirSerialDevice._futures = MimirSerialDevice._futures, []
+            for future in futures:
+                future.set_exception(e)
+            return
+        self._instance_engine = engine
+        with MimirSerialDevice._lock:
+            MimirSerialDevice._engine = engine
+            # set the result for all the futures
+            # waiting for the engine to be ready
+            futures, MimirSerialDevice._futures = MimirSerialDevice._futures, []
+        for future in futures:
+            future.set_result(engine)
+
+    def _read_for(self, timeout: float, done: Callable[[bytes], bool]) -> bool:
+        """Read incrementally, handing each chunk to ``done`` until it returns ``True``.
+
+        Returns ``False`` if ``timeout`` expires first.
+        """
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            chunk = self._instance_serial.read(max(1, self._instance_serial.in_waiting))
+            if chunk and done(chunk):
+                return True
+        return False
+
+    def _probe(self) -> bool:
+        """Check whether the board already answers commands."""
+        self._instance_serial.reset_input_buffer()
+        self._instance_serial.write(
+            msgspec.json.encode(StateRequest(qid=self._probe_qid))
+        )
+        framer = JSONFramer()
+
+        def answers_probe(frame: bytes) -> bool:
+            try:
+                return decode_response(frame).qid == self._probe_qid
+            except msgspec.DecodeError:
+                return False
+
+        return self._read_for(
+            self.probe_timeout,
+            lambda chunk: any(answers_probe(frame) for frame in framer.feed(chunk)),
+        )
+
+    def _reset(self) -> None:
+        """Reset the board and wait until it reports its setup is done."""
         # do an hard reset of the serial port,
         # to ensure that the device is ready
-        self._instance_serial.dtr = False
-        self._instance_serial.rts = True
-        time.sleep(0.5)
-        self._instance_serial.dtr = False
-        self._instance_serial.rts = False
-        # give it abundant time to reset; we might lose
-        # some output from the reset process
-        # which would cause follow-up comms to fail
-        time.sleep(2.0)
-        reset_bytes = self._instance_serial.read_until(expected=b"{'setup': 'done'}")
-        if reset_bytes is not None:
-            response = reset_bytes.decode(errors="ignore").strip()
-            self.logger.info("Serial reset response")
-            for line in response.splitlines():
-                self.logger.info(line)
+        try:
+            self._instance_serial.dtr = False
+            self._instance_serial.rts = True
+            time.sleep(0.1)
+            self._instance_serial.dtr = False
+            self._instance_serial.rts = False
+        except OSError as e:
+            # i.e. pseudo-terminals and adapters without modem lines
+            self.logger.warning(f"Cannot reset the device via DTR/RTS: {e}")
+        # the board prints its boot log before the marker;
+        # stop reading as soon as the marker is received
+        boot_log = bytearray()
+
+        def setup_done(chunk: bytes) -> bool:
+            boot_log.extend(chunk)
+            return self._ready_marker in boot_log
+
+        if not self._read_for(self.reset_timeout, setup_done):
+            self.logger.warning(
+                f"Board did not report setup done within {self.reset_timeout} s."
+            )
+        self.logger.info("Serial reset response")
+        for line in boot_log.decode(errors="ignore").strip().splitlines():
+            self.logger.info(line)
 
     def read_configuration(self) -> dict[str, Reading[Any]]:
         # TODO: for now we don't return anything...
@@ -117,32 +252,55 @@ class MimirSerialDevice(Device, Loggable):
 
         This method is called when the application is closed.
         """
+        self._handshake_thread.join()
+        if self._instance_engine is not None:
+            self._instance_engine.close()
+        with MimirSerialDevice._lock:
+            if MimirSerialDevice._engine is self._instance_engine:
+                MimirSerialDevice._engine = None
         if self._instance_serial.is_open:
             self._instance_serial.close()
 
     @classmethod
-    def get(cls) -> Serial | Future[Serial]:
-        """Get the serial object.
+    def statistics(cls) -> dict[str, Any]:
+        """Get the timing and traffic statistics of the commands sent so far.
+
+        Returns
+        -------
+        dict[str, Any]
+            Snapshot of the statistics of the serial engine
+            (see `SerialStatistics.snapshot`); empty
+            if the engine is not ready yet.
+        """
+        with cls._lock:
+            engine = cls._engine
+        if engine is None:
+            return {}
+        return engine.statistics.snapshot()
+
+    @classmethod
+    def get(cls) -> SerialEngine | Future[SerialEngine]:
+        """Get the serial engine.
 
         Returns
         -------
-        Serial | Future[Serial]
-            Serial object to use for communication with the Mimir device.
+        SerialEngine | Future[SerialEngine]
+            Engine to use for communication with the Mimir device.
             If the serial port is not ready yet (i.e. the app hasn't built
-            the device yet), a Future object is returned which will be set when the
-            serial port is ready.
+            the device yet, or the board is still resetting), a Future
+            object is returned which will be set when the engine is ready.
         """
-        if cls._serial is None:
-            # the app hasn't built it yet; we create a future
-            # object which will be set when the app will build
-            # the serial; we return the future object to the
-            # caller so that it can wait for the serial to be ready before
-            # using it
-            future: Future[Serial] = Future()
-            cls._futures.add(future)
-            return future
+        with cls._lock:
+            if cls._engine is None:
+                # the engine is not ready yet; we create a future
+                # object which will be set when the handshake is done;
+                # we return the future object to the caller so that
+                # it can wait for the engine to be ready before using it
+                future: Future[SerialEngine] = Future()
+                cls._futures.append(future)
+                return future
 
-        return cls._serial
+            return cls._engine
 
 
 class MimirLaserDevice(Device, LightProtocol, Loggable):
@@ -182,23 +340,43 @@ class MimirLaserDevice(Device, LightProtocol, Loggable):
         self.enabled = False
         self.intensity = 0
         self.id = 1
-        self.qid = 1
 
-        def callback(future: Future[Serial]) -> None:
-            self._serial = future.result()
+        self._engine: SerialEngine | None = None
+
+        # at most one laser command is in flight; values requested
+        # in the meantime replace each other, and only the latest
+        # one is sent once the board acknowledges the previous command
+        self._command_lock = threading.Lock()
+        self._in_flight = False
+        self._pending: int | None = None
+        self._pending_status: Status | None = None
+        self._acknowledged: int | None = None
+
+        def callback(future: Future[SerialEngine]) -> None:
+            exc = future.exception()
+            if exc is not None:
+                self.logger.error(f"Serial port is not available: {exc}")
+                return
+            self._engine = future.result()
             self.logger.debug("Serial port ready.")
 
-        serial_or_future: Serial | Future[Serial] = MimirSerialDevice.get()
+        engine_or_future: SerialEngine | Future[SerialEngine] = MimirSerialDevice.get()
 
-        if isinstance(serial_or_future, Future):
-            serial_or_future.add_done_callback(callback)
+        if isinstance(engine_or_future, Future):
+            engine_or_future.add_done_callback(callback)
         else:
-            self._serial = serial_or_future
+            self._engine = engine_or_future
             self.logger.debug("Serial port ready.")
 
     def set(self, value: Any, **kwargs: Any) -> Status:
         """Set the intensity of the laser source.
 
+        Intensity changes are coalesced: while a command is waiting
+        for the acknowledgement of the board, only the latest requested
+        value is kept, and sent once the board answers; the statuses of
+        the replaced requests finish together with it. A value equal to
+        the last acknowledged one is not sent again.
+
         .. note::
 
             `**kwargs` are ignored in this implementation.
@@ -231,18 +409,10 @@ class MimirLaserDevice(Device, LightProtocol, Loggable):
         # `trigger` is called to enable the laser
         self.intensity = value
         if self.enabled:
-            self._send_command(
-                LaserAction(
-                    id=self.id,
-                    qid=self.qid,
-                    value=self.intensity,
-                ),
-                s,
-            )
-        else:
-            # the laser is not enabled yet;
-            # return the status as finished
-            s.set_finished()
+            return self._request(self.intensity)
+        # the laser is not enabled yet;
+        # return the status as finished
+        s.set_finished()
         return s
 
     def trigger(self) -> Status:
@@ -253,65 +423,88 @@ class MimirLaserDevice(Device, LightProtocol, Loggable):
         `Status`
             Status of the command.
         """
-        s = Status()
         self.enabled = not self.enabled
-        if self.enabled:
-            action = LaserAction(
-                id=self.id,
-                qid=self.qid,
-                value=self.intensity,
-            )
+        return self._request(self.intensity if self.enabled else 0)
+
+    def _request(self, value: int) -> Status:
+        """Request a new laser value, coalescing it with the pending ones.
+
+        Parameters
+        ----------
+        value: `int`
+            Value to send to the laser source.
+
+        Returns
+        -------
+        `Status`
+            Status finished when the board acknowledges the value,
+            or a later one replacing it.
+        """
+        with self._command_lock:
+            if self._in_flight:
+                self._pending = value
+                if self._pending_status is None:
+                    self._pending_status = Status()
+                return self._pending_status
+            if value == self._acknowledged:
+                s = Status()
+                s.set_finished()
+                return s
+            self._in_flight = True
+        return self._dispatch(value)
+
+    def _dispatch(self, value: int) -> Status:
+        status = self._send_command(LaserAction(id=self.id, value=value))
+        status.add_callback(partial(self._acknowledge, value))
+        return status
+
+    def _acknowledge(self, value: int, status: Status) -> None:
+        """Send the latest pending value, if any, once a command completes."""
+        exc = status.exception()
+        with self._command_lock:
+            # on failure the state of the board is unknown
+            self._acknowledged = value if exc is None else None
+            pending, waiter = self._pending, self._pending_status
+            self._pending = self._pending_status = None
+            if pending is None or waiter is None:
+                self._in_flight = False
+                return
+            if pending == self._acknowledged:
+                self._in_flight = False
+                waiter.set_finished()
+                return
+        self._dispatch(pending).add_callback(partial(self._forward, waiter))
+
+    @staticmethod
+    def _forward(waiter: Status, status: Status) -> None:
+        exc = status.exception()
+        if exc is not None:
+            waiter.set_exception(exc)
         else:
-            action = LaserAction(
-                id=self.id,
-                qid=self.qid,
-                value=0,
-            )
-        self._send_command(action, s)
-        return s
+            waiter.set_finished()
 
-    def _send_command(self, command: LaserAction, status: Status) -> None:
+    def _send_command(self, command: LaserAction) -> Status:
         """Send a command to the laser source.
 
+        The command is queued on the serial engine;
+        the returned status is finished when the
+        device acknowledges the command.
+
         Parameters
         ----------
         command: `LaserAction`
             Command to send to the laser source.
-        status: `Status`
+
+        Returns
+        -------
+        `Status`
             Status object associated to the command.
         """
-        packet = msgspec.json.encode(command)
-        written = self._serial.write(packet)
-        self.logger.debug(f"Sent command: {packet.decode()}")
-        if written is None or written != len(packet):
-            status.set_exception(ValueError("Failed to write to serial port."))
-            return
-        # wait for the response
-        # and clean it up
-        # to remove unwanted characters
-        resp_str = (
-            str(self._serial.read_until(expected=b"}"))
-            .replace("+", "")
-            .replace("-", "")
-            .replace("\\r", "")
-            .replace("\\n", "")
-            .replace("b'", "")
-            .replace("'", "")
-        )
-        if not resp_str:
-            status.set_exception(ValueError("Failed to read from serial port."))
-            return
-
-        self.logger.debug(f"Received response: {resp_str}")
-        response = msgspec.json.decode(resp_str, type=Acknowledge)
-        if response.qid != command.qid:
-            status.set_exception(
-                ValueError(f"Invalid response from laser. Received: {response}")
-            )
-            return
-
-        self._serial.reset_input_buffer()
-        status.set_finished()
+        if self._engine is None:
+            s = Status()
+            s.set_exception(RuntimeError("Serial port is not ready."))
+            return s
+        return self._engine.submit(command)
 
     def shutdown(self) -> None:
         """Shutdown the laser source.
@@ -321,14 +514,11 @@ class MimirLaserDevice(Device, LightProtocol, Loggable):
         # if the laser is enabled, disable it
         # and set the intensity to 0
         if self.enabled:
-            self._send_command(
-                LaserAction(
-                    id=self.id,
-                    qid=self.qid,
-                    value=0,
-                ),
-                Status(),
-            )
+            status = self._request(0)
+            try:
+                status.wait(timeout=1.0)
+            except Exception as e:
+                self.logger.error(f"Failed to disable laser on shutdown: {e}")
 
     def prepare(self, value: PrepareInfo) -> Status:
         """Contribute laser metadata to the acquisition metadata registry."""
@@ -399,7 +589,7 @@ UM_TO_NM: Final[int] = 1_000
 MM_TO_NM: Final[int] = 1_000_000
 
 
-class MimirMotorDevice(Device, MotorProtocol, Loggable):
+class MimirMotorDevice(Device, MultiAxisMotor, TrajectoryMotor, Loggable):
     """Mimir interface for a motor stage.
 
     Parameters
@@ -413,6 +603,16 @@ class MimirMotorDevice(Device, MotorProtocol, Loggable):
         Step sizes for the motor stage for each axis. The keys of the dictionary should be
         the axis names (e.g. "X", "Y", "Z") and the values should be the step sizes in the specified
         engineering unit. Default is {"X": 100.0, "Y": 100.0, "Z": 100.0}.
+    settle_time: `float`
+        Time in seconds to wait after a movement for the stage to settle.
+        Default is 0.05.
+    poll_interval: `float`
+        Time in seconds between two requests of the stepper positions
+        to the board, made from a background thread; all axes are
+        queried with a single request, and `locate` returns the
+        latest reported positions as readback. If 0, the board is
+        never queried, and the readback of an axis is set to its
+        setpoint when a movement completes. Default is 0.0.
 
     Attributes
     ----------
@@ -451,6 +651,8 @@ class MimirMotorDevice(Device, MotorProtocol, Loggable):
         /,
         egu: str = "um",
         step_sizes: dict[str, float] = {"X": 100.0, "Y": 100.0, "Z": 100.0},
+        settle_time: float = 0.05,
+        poll_interval: float = 0.0,
     ) -> None:
         if egu not in self._conversion_map.keys():
             raise ValueError(
@@ -462,24 +664,34 @@ class MimirMotorDevice(Device, MotorProtocol, Loggable):
             name,
             egu=egu,
             step_sizes=step_sizes,
+            settle_time=settle_time,
+            poll_interval=poll_interval,
         )
 
         # protocol attributes
         self.egu = egu
         self.step_sizes = step_sizes
+        self.settle_time = settle_time
+        self.poll_interval = poll_interval
         self.axis: list[str] = ["X", "Y", "Z"]
         self._active_axis = self.axis[0]
 
-        def callback(future: Future[Serial]) -> None:
-            self._serial = future.result()
+        self._engine: SerialEngine | None = None
+
+        def callback(future: Future[SerialEngine]) -> None:
+            exc = future.exception()
+            if exc is not None:
+                self.logger.error(f"Serial port is not available: {exc}")
+                return
+            self._engine = future.result()
             self.logger.debug("Serial port ready.")
 
-        serial_or_future: Serial | Future[Serial] = MimirSerialDevice.get()
+        engine_or_future: SerialEngine | Future[SerialEngine] = MimirSerialDevice.get()
 
-        if isinstance(serial_or_future, Future):
-            serial_or_future.add_done_callback(callback)
+        if isinstance(engine_or_future, Future):
+            engine_or_future.add_done_callback(callback)
         else:
-            self._serial = serial_or_future
+            self._engine = engine_or_future
             self.logger.debug("Serial port ready.")
 
         # set the conversion factor from egu to steps;
@@ -494,6 +706,19 @@ class MimirMotorDevice(Device, MotorProtocol, Loggable):
         # set the current axis to the first axis
         self._active_axis = self.axis[0]
 
+        self._stepper_axis = {
+            stepper: axis
+            for axis, stepper in self._axis_id_map.items()
+            if axis in self.axis
+        }
+        self._stop_polling = threading.Event()
+        self._poller: threading.Thread | None = None
+        if poll_interval > 0:
+            self._poller = threading.Thread(
+                target=self._poll, name="uc2-motor-poller", daemon=True
+            )
+            self._poller.start()
+
     def set(self, value: Any, **kwargs: Any) -> Status:
         s = Status()
         propr = kwargs.get("prop", None) or kwargs.get("propr", None)
@@ -513,31 +738,115 @@ class MimirMotorDevice(Device, MotorProtocol, Loggable):
             else:
                 s.set_exception(ValueError(f"Invalid property: {propr}"))
                 return s
-        else:
-            if not isinstance(value, int | float):
-                s.set_exception(ValueError("Value must be a float or int."))
-                return s
+        elif isinstance(value, Mapping):
+            return self._move(dict(value))
+        elif not isinstance(value, int | float):
+            s.set_exception(ValueError("Value must be a float or int."))
+            return s
 
-        # update the setpoint position for the current axis
-        self._positions[self._active_axis]["setpoint"] = value
-        steps = int(value * self._factor) // self.motor_step
+        return self._move({self._active_axis: value})
 
-        self.logger.debug(f"Moving motor along {self._active_axis} of {steps} steps.")
+    def _move(self, targets: dict[str, Any]) -> Status:
+        """Move one or more axes to their targets with a single command.
 
-        action = MotorAction(
-            movement=MotorAction.generate_movement(
-                id=self._axis_id_map[self._active_axis], position=steps
-            ),
-            qid=self._axis_id_map[self._active_axis],
-        )
-        s.add_callback(self._update_readback)
-        self._send_command(action, s)
+        All the steppers are carried by the same `MotorAction`;
+        the firmware acknowledges the command once, then reports
+        each stepper when it reaches its target.
+        """
+        unknown = [axis for axis in targets if axis not in self.axis]
+        invalid = [v for v in targets.values() if not isinstance(v, int | float)]
+        if unknown or invalid or not targets:
+            s = Status()
+            s.set_exception(
+                ValueError(
+                    f"Invalid targets: {targets}. "
+                    f"Expected float or int values for the axes {self.axis}."
+                )
+            )
+            return s
+
+        positions: dict[int, int] = {}
+        for axis, value in targets.items():
+            # update the setpoint position for each moved axis
+            self._positions[axis]["setpoint"] = value
+            positions[self._axis_id_map[axis]] = (
+                int(value * self._factor) // self.motor_step
+            )
+
+        self.logger.debug(f"Moving motor to {positions} steps.")
+
+        action = MotorAction(movement=MotorAction.generate_movements(positions))
+        s = self._send_command(action)
+        # the active axis may change while the motor is moving
+        s.add_callback(partial(self._update_readback, axes=list(targets)))
         return s
 
+    def upload_trajectory(
+        self,
+        moves: Sequence[Mapping[str, float]],
+        *,
+        dwell: float = 0.0,
+        window: int = 1,
+    ) -> Trajectory:
+        """Start moving along a trajectory of relative moves.
+
+        The moves are converted to absolute targets from the current
+        setpoints; each point is sent as a single `MotorAction` as soon
+        as the previous one is reported done by the firmware, from the
+        serial engine thread.
+
+        Parameters
+        ----------
+        moves: `Sequence[Mapping[str, float]]`
+            The displacement of each move, by axis name.
+        dwell: `float`
+            Time in seconds to hold each point before the next move.
+            Default is 0.0.
+        window: `int`
+            Maximum number of moves sent ahead to the firmware.
+            The firmware replaces a running movement with a new one,
+            so values above 1 are only valid with firmware builds
+            that queue motor commands. Default is 1.
+
+        Returns
+        -------
+        `Trajectory`
+            Handle reporting the completion of each point.
+
+        Raises
+        ------
+        `ValueError`
+            If a move refers to an unknown axis.
+        """
+        position = {axis: loc["setpoint"] for axis, loc in self._positions.items()}
+        targets: list[dict[str, float]] = []
+        for move in moves:
+            unknown = [axis for axis in move if axis not in self.axis]
+            if unknown:
+                raise ValueError(f"Unknown axes {unknown}; available: {self.axis}")
+            for axis, delta in move.items():
+                position[axis] += delta
+            targets.append({axis: position[axis] for axis in move})
+
+        def submit(index: int) -> Status:
+            return self._move(targets[index])
+
+        return Trajectory(len(targets), submit, dwell=dwell, window=window).start()
+
     def locate(self) -> Location[float]:
         """Locate mock model."""
         return self._positions[self._active_axis]
 
+    def locate_axes(self) -> dict[str, Location[float]]:
+        """Return the location of every axis."""
+        return {
+            axis: {
+                "setpoint": location["setpoint"],
+                "readback": location["readback"],
+            }
+            for axis, location in self._positions.items()
+        }
+
     def read_configuration(self) -> dict[str, Reading[Any]]:
         timestamp = time.time()
         config: dict[str, Reading[Any]] = {
@@ -564,7 +873,11 @@ class MimirMotorDevice(Device, MotorProtocol, Loggable):
             descriptors[key] = make_descriptor("settings", "number")
         return descriptors
 
-    def shutdown(self) -> None: ...
+    def shutdown(self) -> None:
+        """Stop polling the stepper positions."""
+        self._stop_polling.set()
+        if self._poller is not None:
+            self._poller.join()
 
     def prepare(self, _: PrepareInfo) -> Status:
         """Contribute motor metadata to the acquisition metadata registry."""
@@ -578,96 +891,86 @@ class MimirMotorDevice(Device, MotorProtocol, Loggable):
         s.set_finished()
         return s
 
-    def _send_command(self, command: MotorAction, status: Status) -> None:
+    def _send_command(self, command: MotorAction) -> Status:
         """Send a command to the motor stage.
 
+        The command is queued on the serial engine; the returned
+        status is finished when the device reports that the
+        movement of every stepper is done, after acknowledging the command.
+
         Parameters
         ----------
         command: `MotorAction`
             Command to send to the motor stage.
-        status: `Status`
+
+        Returns
+        -------
+        `Status`
             Status object associated to the command.
         """
-        packet = msgspec.json.encode(command)
-        written = self._serial.write(packet)
-        self.logger.debug(f"Sent command: {packet.decode()}")
-        if written is None or written != len(packet):
-            status.set_exception(ValueError("Failed to write to serial port."))
-            return
-        # wait for the acknowledge response
-        # and clean it up
-        # to remove unwanted characters
-        resp_str = (
-            str(self._serial.read_until(expected=b"--"))
-            .replace("+", "")
-            .replace("-", "")
-            .replace("\\r", "")
-            .replace("\\n", "")
-            .replace("b'", "")
-            .replace("'", "")
+        if self._engine is None:
+            s = Status()
+            s.set_exception(RuntimeError("Serial port is not ready."))
+            return s
+        # one acknowledgement, then one response per stepper;
+        # when polling, the positions reported by the
+        # firmware on completion are real readbacks too
+        return self._engine.submit(
+            command,
+            responses=1 + len(command.movement.steppers),
+            on_response=self._record_positions if self._poller else None,
         )
-        if not resp_str:
-            status.set_exception(ValueError("Failed to read from serial port."))
-            return
 
-        self.logger.debug(f"Received response: {resp_str}")
-        try:
-            response = msgspec.json.decode(resp_str, type=Acknowledge)
-        except msgspec.DecodeError as e:
-            status.set_exception(e)
-            return
-        if response.qid != command.qid:
-            status.set_exception(
-                ValueError(f"Invalid response from motor. Received: {response}")
+    def _poll(self) -> None:
+        """Request the stepper positions until the device is shut down."""
+        while not self._stop_polling.wait(self.poll_interval):
+            if self._engine is None:
+                continue
+            # wait for each answer before the next
+            # request, not to flood the serial link
+            status = self._engine.submit(
+                PositionRequest(),
+                timeout=max(self.poll_interval, 1.0),
+                on_response=self._record_positions,
             )
+            try:
+                status.wait()
+            except Exception as e:
+                self.logger.debug(f"Position request failed: {e}")
+
+    def _record_positions(
+        self, message: Acknowledge | MotorResponse | PositionResponse
+    ) -> None:
+        """Update the readback of the axes reported by the firmware."""
+        steppers: Sequence[StepperPosition | MovementResponseInfo]
+        if isinstance(message, PositionResponse):
+            steppers = message.state.steppers
+        elif isinstance(message, MotorResponse):
+            steppers = message.steppers
+        else:
             return
-        # wait for the motor response
-        # and clean it up
-        # to remove unwanted characters
-        motor_resp_str = (
-            str(self._serial.read_until(expected=b"--"))
-            .replace("+", "")
-            .replace("-", "")
-            .replace("\\r", "")
-            .replace("\\n", "")
-            .replace("b'", "")
-            .replace("'", "")
-        )
-        self.logger.debug(f"Received motor response: {motor_resp_str}")
-        if not motor_resp_str:
-            status.set_exception(
-                ValueError("Failed to read motor response from serial port.")
-            )
-            return
-        try:
-            motor_response = msgspec.json.decode(motor_resp_str, type=MotorResponse)
-        except msgspec.DecodeError as e:
-            status.set_exception(e)
-            return
-        if motor_response.qid != command.qid:
-            status.set_exception(
-                ValueError(
-                    f"Invalid response from motor. Expected qid {command.qid}, "
-                    f"but received {motor_response.qid}."
+        for stepper in steppers:
+            axis = self._stepper_axis.get(stepper.id)
+            if axis is not None:
+                self._positions[axis]["readback"] = (
+                    stepper.position * self.motor_step / self._factor
                 )
-            )
-            return
-        self._serial.reset_input_buffer()
-        status.set_finished()
 
-    def _update_readback(self, status: Status) -> None:
-        """Update the currently active axis readback position.
+    def _update_readback(self, status: Status, *, axes: list[str]) -> None:
+        """Update the readback position of the moved axes.
 
         When the status object is set as finished successfully,
-        the readback position is updated to match the setpoint.
+        the readback positions are updated to match the setpoints,
+        unless they are polled from the firmware.
 
         Parameters
         ----------
         status : Status
             The status object associated with the callback.
+        axes : list[str]
+            The axes that were moved.
 
         """
-        if status.success:
-            self._positions[self._active_axis]["readback"] = self._positions[
-                self._active_axis
-            ]["setpoint"]
+        if status.success and self._poller is None:
+            for axis in axes:
+                self._positions[axis]["readback"] = self._positions[axis]["setpoint"]
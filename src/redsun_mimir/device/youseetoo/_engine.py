@@ -0,0 +1,284 @@
+from __future__ import annotations
+
+import itertools
+import threading
+import time
+from dataclasses import dataclass, field
+from queue import Queue
+from typing import TYPE_CHECKING
+
+import msgspec
+from redsun.engine import Status
+from redsun.log import Loggable
+
+from ._actions import Acknowledge, MotorResponse, PositionResponse, decode_response
+from ._framing import JSONFramer
+from ._stats import SerialStatistics
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from serial import Serial
+
+    from ._actions import LaserAction, MotorAction, PositionRequest
+
+
+@dataclass
+class _Pending:
+    """A command waiting for its responses."""
+
+    status: Status
+    remaining: int
+    task: str
+    # perf_counter timestamps of the command phases
+    submitted: float
+    written: float = 0.0
+    acknowledged: float = 0.0
+    on_response: (
+        Callable[[Acknowledge | MotorResponse | PositionResponse], None] | None
+    ) = None
+    responses: list[Acknowledge | MotorResponse | PositionResponse] = field(
+        default_factory=list
+    )
+
+
+class SerialEngine(Loggable):
+    """Serial I/O engine shared by the Mimir devices.
+
+    Commands are encoded and handed to a writer thread through a queue;
+    a reader thread parses the incoming responses and routes them by
+    ``qid`` to the status of the command that requested them.
+    Several commands can be in flight at the same time, and commands
+    from different devices never read each other's responses.
+
+    Each submitted command is given a new, unique ``qid``.
+
+    The duration of each phase of the commands and the serial traffic
+    are recorded in `statistics`; a summary is logged periodically
+    if ``stats_interval`` is given.
+
+    Parameters
+    ----------
+    serial: `Serial`
+        The open serial port. The engine owns it from now on;
+        no one else should read from or write to it.
+    timeout: `float | None`
+        Default time in seconds to wait for the responses of a command
+        before its status fails. Default is 10.0 s.
+    stats_interval: `float | None`
+        Time in seconds between two logs of the statistics
+        summary. Default is ``None`` (no logging).
+    """
+
+    name = "serial-engine"
+
+    def __init__(
+        self,
+        serial: Serial,
+        *,
+        timeout: float | None = 10.0,
+        stats_interval: float | None = None,
+    ) -> None:
+        self._serial = serial
+        self._timeout = timeout
+        self._stats_interval = stats_interval
+        self._statistics = SerialStatistics()
+        self._qids = itertools.count(1)
+        self._pending: dict[int, _Pending] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        # None wakes up the writer on close
+        self._queue: Queue[tuple[int, bytes] | None] = Queue()
+        self._framer = JSONFramer()
+        self._writer = threading.Thread(
+            target=self._write_loop, name="uc2-serial-writer", daemon=True
+        )
+        self._reader = threading.Thread(
+            target=self._read_loop, name="uc2-serial-reader", daemon=True
+        )
+        self._writer.start()
+        self._reader.start()
+
+    def submit(
+        self,
+        action: LaserAction | MotorAction | PositionRequest,
+        *,
+        responses: int = 1,
+        timeout: float | None = None,
+        on_response: (
+            Callable[[Acknowledge | MotorResponse | PositionResponse], None] | None
+        ) = None,
+    ) -> Status:
+        """Send a command without waiting for its responses.
+
+        Parameters
+        ----------
+        action: `LaserAction | MotorAction | PositionRequest`
+            The command to send; its ``qid`` is overwritten.
+        responses: `int`
+            Number of responses the command produces; the status
+            is finished when the last one is received. Default is 1.
+        timeout: `float | None`
+            Time in seconds to wait for the responses;
+            if not given, the engine default is used.
+        on_response: `Callable[[Acknowledge | MotorResponse | PositionResponse], None] | None`
+            Called on the reader thread with each response of the command,
+            before its status is finished. It must not block.
+
+        Returns
+        -------
+        `Status`
+            Status of the command. It fails if the device reports
+            a failure, if the command cannot be written, or on timeout.
+        """
+        status = Status(timeout=timeout if timeout is not None else self._timeout)
+        if self._stop.is_set():
+            status.set_exception(RuntimeError("Serial engine is closed."))
+            return status
+        qid = next(self._qids)
+        action.qid = qid
+        packet = msgspec.json.encode(action)
+        task = type(action).__struct_config__.tag
+        with self._lock:
+            self._pending[qid] = _Pending(
+                status,
+                responses,
+                str(task),
+                time.perf_counter(),
+                on_response=on_response,
+            )
+        # drop the pending command if the status
+        # fails on its own, i.e. on timeout
+        status.add_callback(lambda _: self._discard(qid))
+        self._queue.put((qid, packet))
+        return status
+
+    def close(self) -> None:
+        """Stop the engine threads and fail all pending commands."""
+        self._stop.set()
+        self._queue.put(None)
+        self._writer.join()
+        self._reader.join()
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for entry in pending.values():
+            if not entry.status.done:
+                entry.status.set_exception(RuntimeError("Serial engine is closed."))
+
+    @property
+    def statistics(self) -> SerialStatistics:
+        """Timing and traffic statistics of the commands sent so far."""
+        return self._statistics
+
+    @property
+    def in_flight(self) -> int:
+        """Number of commands waiting for their responses."""
+        with self._lock:
+            return len(self._pending)
+
+    def _discard(self, qid: int) -> None:
+        with self._lock:
+            entry = self._pending.pop(qid, None)
+        if entry is not None:
+            # the status failed on its own, i.e. on timeout
+            self._statistics.fail(entry.task)
+
+    def _fail(self, qid: int, exc: Exception) -> None:
+        with self._lock:
+            entry = self._pending.pop(qid, None)
+        if entry is not None and not entry.status.done:
+            self._statistics.fail(entry.task)
+            entry.status.set_exception(exc)
+
+    def _write_loop(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            qid, packet = item
+            start = time.perf_counter()
+            try:
+                written = self._serial.write(packet)
+            except Exception as e:
+                self._fail(qid, RuntimeError(f"Failed to write to serial port: {e}"))
+                continue
+            end = time.perf_counter()
+            self._statistics.sent(written or 0)
+            if written is None or written != len(packet):
+                self._fail(qid, ValueError("Failed to write to serial port."))
+                continue
+            with self._lock:
+                entry = self._pending.get(qid)
+                if entry is not None:
+                    entry.written = end
+            if entry is not None:
+                self._statistics.record(entry.task, "queue", start - entry.submitted)
+                self._statistics.record(entry.task, "write", end - start)
+            self.logger.debug(f"Sent command: {packet.decode()}")
+
+    def _read_loop(self) -> None:
+        next_log = time.monotonic() + (self._stats_interval or 0.0)
+        while not self._stop.is_set():
+            if self._stats_interval and time.monotonic() >= next_log:
+                next_log += self._stats_interval
+                self.logger.info(f"Serial statistics:\n{self._statistics.summary()}")
+            try:
+                # blocks up to the serial timeout if nothing is available
+                chunk = self._serial.read(max(1, self._serial.in_waiting))
+            except Exception as e:
+                if not self._stop.is_set():
+                    self.logger.error(f"Failed to read from serial port: {e}")
+                    time.sleep(0.1)
+                continue
+            self._statistics.received(len(chunk))
+            for frame in self._framer.feed(chunk):
+                try:
+                    response = decode_response(frame)
+                except msgspec.DecodeError:
+                    # i.e. firmware log lines in braces
+                    self.logger.debug(f"Discarding unknown frame: {frame!r}")
+                    continue
+                self._route(response)
+
+    def _route(self, message: Acknowledge | MotorResponse | PositionResponse) -> None:
+        """Hand a response over to the command that requested it."""
+        qid = message.qid
+        self.logger.debug(f"Received response: {message}")
+        if not isinstance(qid, int):
+            return
+        now = time.perf_counter()
+        with self._lock:
+            entry = self._pending.get(qid)
+            if entry is None:
+                self.logger.debug(f"Discarding response for unknown qid {qid}.")
+                return
+            entry.responses.append(message)
+            entry.remaining -= 1
+            first = len(entry.responses) == 1
+            if first:
+                entry.acknowledged = now
+            failed = isinstance(message, Acknowledge) and message.success < 0
+            done = failed or entry.remaining <= 0
+            if done:
+                del self._pending[qid]
+        if entry.on_response is not None:
+            try:
+                entry.on_response(message)
+            except Exception as e:
+                self.logger.error(f"Response callback of command {qid} failed: {e}")
+        if first:
+            # the response may be parsed before the writer marks the command
+            written = entry.written or entry.submitted
+            self._statistics.record(entry.task, "ack", now - written)
+        if not done:
+            return
+        if failed:
+            self._statistics.fail(entry.task)
+            entry.status.set_exception(
+                RuntimeError(f"Command {qid} failed on the device: {message}")
+            )
+        else:
+            if len(entry.responses) > 1:
+                self._statistics.record(entry.task, "motion", now - entry.acknowledged)
+            self._statistics.record(entry.task, "total", now - entry.submitted)
+            entry.status.set_finished()
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import re
+from typing import Final
+
+import msgspec
+
+# structural bytes outside of strings; a brace at the start of a line
+# and the ``++`` delimiter can only appear between objects
+_STRUCTURE: Final = re.compile(rb'\n\{|\+\+|[{}"]')
+# body of a string, up to (not including) its closing quote;
+# strings cannot contain raw line breaks
+_STRING_BODY: Final = re.compile(rb'(?:[^"\\\n]|\\[^\n])*')
+# validates a candidate object without building it
+_VALIDATOR: Final = msgspec.json.Decoder(msgspec.Raw)
+
+
+class JSONFramer:
+    """Incremental extractor of JSON objects from a byte stream.
+
+    Bytes are fed as they arrive from the serial port; complete top-level
+    objects are returned as soon as their closing brace is received,
+    regardless of how the stream is split across reads. Braces inside
+    strings (including escaped quotes) are not counted. Bytes outside of
+    objects, i.e. the ``++``/``--`` delimiters and firmware log lines,
+    are discarded.
+
+    A brace or a quote in a log line may start an object that is never
+    completed. Such a candidate is dropped as soon as a line break
+    appears inside one of its strings, or a ``++`` delimiter or a line
+    starting with a brace appears inside it; the framer then resumes
+    looking for an object right after.
+
+    Parameters
+    ----------
+    max_size: `int`
+        Maximum size in bytes of a single object. A longer object
+        (i.e. an unbalanced brace in the log output) is dropped,
+        and the framer starts looking for a new object.
+        Default is 65536.
+    """
+
+    def __init__(self, max_size: int = 65536) -> None:
+        self.max_size = max_size
+        # last byte of the previous chunk, to detect delimiters split across reads
+        self._last = 0
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop any partially received object."""
+        self._partial = bytearray()
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+
+    def feed(self, data: bytes) -> list[bytes]:
+        """Consume a chunk of the stream.
+
+        Parameters
+        ----------
+        data: `bytes`
+            The bytes received since the last call.
+
+        Returns
+        -------
+        `list[bytes]`
+            The objects completed by this chunk, in order.
+        """
+        frames: list[bytes] = []
+        size = len(data)
+        # start of the object in progress within this chunk, if any
+        start: int | None = 0 if self._depth > 0 else None
+        # a backslash at the end of the previous chunk escapes the first byte
+        pos = 1 if self._escape else 0
+        self._escape = False
+        if (
+            size
+            and self._depth > 0
+            and not self._in_string
+            and (self._last, data[0]) in ((0x0A, 0x7B), (0x2B, 0x2B))
+        ):
+            # a delimiter split across reads; the object in progress was noise
+            self.reset()
+            start = None
+        self._last = data[-1] if size else self._last
+        while pos < size:
+            if self._in_string:
+                end = _STRING_BODY.match(data, pos).end()  # type: ignore[union-attr]
+                if end == size:
+                    break
+                if data[end] == 0x22:  # closing quote
+                    self._in_string = False
+                    pos = end + 1
+                    continue
+                if data[end] == 0x5C and end + 1 == size:  # backslash as the last byte
+                    self._escape = True
+                    break
+                # a line break inside a string: the object in progress was noise
+                self.reset()
+                start = None
+                pos = end
+            elif self._depth == 0:
+                # skip the noise between objects
+                pos = data.find(b"{", pos)
+                if pos < 0:
+                    break
+                end = self._complete(data, pos)
+                if end > 0:
+                    frames.append(data[pos:end])
+                    pos = end
+                    continue
+                start = pos
+                self._depth = 1
+                pos += 1
+            else:
+                match = _STRUCTURE.search(data, pos)
+                if match is None:
+                    break
+                pos = match.end()
+                token = data[pos - 1]
+                if match.end() - match.start() == 2:
+                    # a delimiter, or a brace at the start of a line:
+                    # the object in progress was noise, look for a new one
+                    self.reset()
+                    start = None
+                    if token == 0x7B:
+                        pos -= 1
+                elif token == 0x22:  # quote
+                    self._in_string = True
+                elif token == 0x7B:  # {
+                    self._depth += 1
+                else:
+                    self._depth -= 1
+                    if self._depth == 0:
+                        assert start is not None
+                        self._partial += data[start:pos]
+                        frames.append(bytes(self._partial))
+                        self._partial.clear()
+                        start = None
+        if start is not None:
+            self._partial += data[start:]
+            if len(self._partial) > self.max_size:
+                self.reset()
+        return frames
+
+    @staticmethod
+    def _complete(data: bytes, start: int) -> int:
+        """Find the end of an object fully contained in ``data``.
+
+        Fast path for the common case of a response received in one read:
+        the first closing brace that balances the braces opened since
+        ``start`` is taken as the end of the object, and the candidate is
+        validated by the JSON decoder. Since a valid JSON object cannot
+        be the prefix of another one, a valid candidate is the object.
+
+        Returns the index past the closing brace, or -1 if the object is
+        incomplete, or if braces or escapes inside strings require a full scan.
+        """
+        end = start
+        closed = 0
+        while True:
+            end = data.find(b"}", end + 1)
+            if end < 0:
+                return -1
+            closed += 1
+            if data.count(b"{", start, end) == closed:
+                break
+        end += 1
+        try:
+            _VALIDATOR.decode(data[start:end])
+        except msgspec.DecodeError:
+            return -1
+        return end
@@ -0,0 +1,388 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import math
+import os
+import random
+import select
+import threading
+import time
+from functools import partial
+from typing import TYPE_CHECKING
+
+import msgspec
+
+from ._framing import JSONFramer
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any, Final
+
+    from typing_extensions import Self
+
+# log lines printed by the firmware between responses;
+# the braced ones are not valid JSON and must be discarded by the reader
+_NOISE: Final = (
+    b"[4521][I][SerialProcess.cpp:43] loop(): Received command\r\n",
+    b"[4522][I][FocusMotor.cpp:88] act(): motor_act\r\n",
+    b"{'setup': 'done'}\r\n",
+    b"{log: stepper busy}\r\n",
+    b"[4523][W][LaserController.cpp:61] act(): unbalanced {payload\r\n",
+    b'[4524][E][JsonParser.cpp:17] parse(): bad input {"LASERid\r\n',
+)
+
+_BOOT_LOG: Final = (
+    b"ets Jul 29 2019 12:21:46\r\n\r\nrst:0x1 (POWERON_RESET),boot:0x13\r\n"
+    b"[1012][I][main.cpp:71] setup(): Start setup\r\n"
+    b"{'setup': 'done'}\r\n"
+)
+
+
+def travel_time(steps: int, speed: int, accel: int, ramp: bool) -> float:
+    """Compute the time for a stepper to travel a given distance.
+
+    Without ramping the stepper moves at constant ``speed``; otherwise
+    it follows a trapezoidal profile, accelerating and decelerating
+    at ``accel`` (a triangular one if the top speed is never reached).
+
+    Parameters
+    ----------
+    steps: `int`
+        Distance to travel, in steps.
+    speed: `int`
+        Maximum speed, in steps/s.
+    accel: `int`
+        Acceleration, in steps/s².
+    ramp: `bool`
+        Whether acceleration ramping is applied.
+
+    Returns
+    -------
+    `float`
+        The travel time, in seconds.
+    """
+    steps = abs(steps)
+    if steps == 0 or speed <= 0:
+        return 0.0
+    if not ramp or accel <= 0:
+        return steps / speed
+    if steps < speed * speed / accel:
+        return 2.0 * math.sqrt(steps / accel)
+    return steps / speed + speed / accel
+
+
+class UC2Simulator:
+    """Emulator of the UC2 firmware over a pseudo-terminal.
+
+    Answers ``/state_get``, ``/laser_act``, ``/motor_act`` and ``/motor_get``
+    commands written on the pty like the firmware does: each command is
+    acknowledged with its ``qid``, and motor commands are followed by a
+    completion message for each stepper, once it reaches its target.
+    Position requests report the steppers while they move, too. Responses are wrapped in the
+    ``++``/``--`` delimiters of the firmware.
+
+    The transfer time of each message at the configured baud rate is
+    modeled in both directions, as is the travel time of the steppers
+    (see `travel_time`); noise and faults can be injected to exercise
+    the error paths of the reader.
+
+    The simulator is POSIX-only. Use it as a context manager, and connect
+    the devices to `port`.
+
+    Parameters
+    ----------
+    baudrate: `int`
+        Baud rate of the modeled link; each byte takes 10 bits.
+        Default is 115200.
+    noise: `float`
+        Probability of printing a firmware log line before a response.
+        Default is 0.0.
+    fault_rate: `float`
+        Probability of a command being rejected with ``success: -1``.
+        Default is 0.0.
+    drop_rate: `float`
+        Probability of a response being lost. Default is 0.0.
+    chunk_size: `int | None`
+        If given, responses are written on the pty in chunks of at most
+        this many bytes, to exercise the reassembly of split reads.
+        Default is ``None``.
+    seed: `int | None`
+        Seed of the random generator driving noise and faults.
+    queue_moves: `bool`
+        If ``True``, motor commands are queued and executed one after
+        the other, instead of starting as soon as they are received.
+        Default is ``False``.
+    booted: `bool`
+        Whether the board is up when the simulator starts;
+        if not, commands are ignored until `boot` is called.
+        Default is ``True``.
+
+    Attributes
+    ----------
+    positions: `dict[int, int]`
+        Position in steps of each stepper at the end of its last
+        movement, by stepper ID. Changing it emulates missed steps.
+    lasers: `dict[int, int]`
+        Current value of each laser, by laser ID.
+    received: `int`
+        Number of commands received.
+    """
+
+    def __init__(
+        self,
+        *,
+        baudrate: int = 115200,
+        noise: float = 0.0,
+        fault_rate: float = 0.0,
+        drop_rate: float = 0.0,
+        chunk_size: int | None = None,
+        seed: int | None = None,
+        queue_moves: bool = False,
+        booted: bool = True,
+    ) -> None:
+        self.baudrate = baudrate
+        self.noise = noise
+        self.fault_rate = fault_rate
+        self.drop_rate = drop_rate
+        self.chunk_size = chunk_size
+        self.positions: dict[int, int] = {}
+        self.lasers: dict[int, int] = {}
+        self.received = 0
+        self.booted = booted
+        self.queue_moves = queue_moves
+
+        self._random = random.Random(seed)
+        self._framer = JSONFramer()
+        self._byte_time = 10.0 / baudrate
+        # time at which the last byte in each direction is transferred
+        self._rx_free = 0.0
+        self._tx_free = 0.0
+        # time at which the last queued movement is done,
+        # and target of each stepper at that time
+        self._motion_free = 0.0
+        self._planned: dict[int, int] = {}
+        # last movement of each stepper: start time, start, target, duration
+        self._motions: dict[int, tuple[float, int, int, float]] = {}
+        # scheduled actions, executed in order of due time
+        self._events: list[tuple[float, int, Callable[[], None]]] = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._stop = threading.Event()
+        self._master = -1
+        self._slave = -1
+        self._threads: list[threading.Thread] = []
+
+    @property
+    def port(self) -> str:
+        """Path of the pty to connect to, i.e. ``/dev/pts/3``."""
+        return os.ttyname(self._slave)
+
+    def start(self) -> None:
+        """Open the pty and start answering commands."""
+        if os.name != "posix":
+            raise RuntimeError("The UC2 simulator requires a POSIX system.")
+        # not available on Windows
+        import tty
+
+        self._master, self._slave = os.openpty()
+        # no echo nor newline translation, as on a real serial line
+        tty.setraw(self._slave)
+        self._stop.clear()
+        self._threads = [
+            threading.Thread(target=self._read_loop, name="uc2-sim-rx", daemon=True),
+            threading.Thread(target=self._run_loop, name="uc2-sim-run", daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def close(self) -> None:
+        """Stop the simulator and close the pty."""
+        self._stop.set()
+        with self._cond:
+            self._cond.notify_all()
+        for thread in self._threads:
+            thread.join()
+        for fd in (self._master, self._slave):
+            if fd >= 0:
+                os.close(fd)
+        self._master = self._slave = -1
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def boot(self, delay: float = 0.0) -> None:
+        """Boot the board, as after a reset.
+
+        After ``delay`` seconds, the boot log and the
+        setup marker are printed and commands are answered.
+        """
+
+        def done() -> None:
+            self.booted = True
+            self._transmit(_BOOT_LOG)
+
+        self._schedule(time.monotonic() + delay, done)
+
+    def _schedule(self, due: float, action: Callable[[], None]) -> None:
+        with self._cond:
+            heapq.heappush(self._events, (due, next(self._seq), action))
+            self._cond.notify()
+
+    def _read_loop(self) -> None:
+        while not self._stop.is_set():
+            ready, _, _ = select.select([self._master], [], [], 0.05)
+            if not ready:
+                continue
+            try:
+                chunk = os.read(self._master, 4096)
+            except OSError:
+                break
+            for frame in self._framer.feed(chunk):
+                # the command is available once its last byte is transferred
+                now = time.monotonic()
+                self._rx_free = max(now, self._rx_free) + len(frame) * self._byte_time
+                self._schedule(self._rx_free, partial(self._handle, frame))
+
+    def _run_loop(self) -> None:
+        while True:
+            with self._cond:
+                while not self._stop.is_set():
+                    if self._events:
+                        delay = self._events[0][0] - time.monotonic()
+                        if delay <= 0:
+                            break
+                    else:
+                        delay = None
+                    self._cond.wait(delay)
+                if self._stop.is_set():
+                    return
+                _, _, action = heapq.heappop(self._events)
+            action()
+
+    def _handle(self, frame: bytes) -> None:
+        try:
+            command: dict[str, Any] = msgspec.json.decode(frame)
+        except msgspec.DecodeError:
+            return
+        if not self.booted:
+            return
+        self.received += 1
+        qid = command.get("qid")
+        if self._random.random() < self.fault_rate:
+            self._emit({"qid": qid, "success": -1})
+            return
+        task = command.get("task")
+        if task == "/state_get":
+            self._emit({"qid": qid, "state": {"identifier_name": "UC2_SIMULATOR"}})
+        elif task == "/laser_act":
+            self.lasers[command["LASERid"]] = command["LASERval"]
+            self._emit({"qid": qid, "success": 1})
+        elif task == "/motor_act":
+            self._emit({"qid": qid, "success": 1})
+            self._move(qid, command["motor"]["steppers"])
+        elif task == "/motor_get":
+            steppers = [
+                {"stepperid": stepper_id, "position": self._position(stepper_id)}
+                for stepper_id in range(4)
+            ]
+            self._emit({"qid": qid, "motor": {"steppers": steppers}})
+        else:
+            self._emit({"qid": qid, "success": -1})
+
+    def _move(self, qid: int | None, steppers: list[dict[str, Any]]) -> None:
+        # steppers move concurrently, and each
+        # is reported when it reaches its target
+        start = time.monotonic()
+        if self.queue_moves:
+            start = max(start, self._motion_free)
+        for stepper in steppers:
+            stepper_id = stepper["stepperid"]
+            current = self._planned.get(stepper_id, 0)
+            target = stepper["position"]
+            if not stepper.get("isabs", 1):
+                target += current
+            self._planned[stepper_id] = target
+            duration = travel_time(
+                target - current,
+                stepper.get("speed", 10_000),
+                stepper.get("accel", 10_000),
+                bool(stepper.get("isaccel", 0)),
+            )
+            self._motion_free = max(self._motion_free, start + duration)
+            self._motions[stepper_id] = (start, current, target, duration)
+            self._schedule(
+                start + duration, partial(self._arrive, qid, stepper_id, target)
+            )
+
+    def _position(self, stepper_id: int) -> int:
+        """Return the current position of a stepper, interpolated while it moves."""
+        motion = self._motions.get(stepper_id)
+        if motion is not None:
+            start, origin, target, duration = motion
+            progress = (time.monotonic() - start) / duration if duration else 1.0
+            if progress < 1.0:
+                return origin + int((target - origin) * max(progress, 0.0))
+        return self.positions.get(stepper_id, 0)
+
+    def _arrive(self, qid: int | None, stepper_id: int, position: int) -> None:
+        self.positions[stepper_id] = position
+        self._emit(
+            {
+                "qid": qid,
+                "steppers": [
+                    {"stepperid": stepper_id, "position": position, "isDone": 1}
+                ],
+            }
+        )
+
+    def _emit(self, message: dict[str, Any]) -> None:
+        """Queue a response for transmission, after the previous ones."""
+        if self._random.random() < self.drop_rate:
+            return
+        data = b"++\r\n" + msgspec.json.encode(message) + b"\r\n--\r\n"
+        if self._random.random() < self.noise:
+            data = self._random.choice(_NOISE) + data
+        self._transmit(data)
+
+    def _transmit(self, data: bytes) -> None:
+        self._tx_free = (
+            max(time.monotonic(), self._tx_free) + len(data) * self._byte_time
+        )
+        self._schedule(self._tx_free, lambda: self._write(data))
+
+    def _write(self, data: bytes) -> None:
+        size = self.chunk_size or len(data)
+        for start in range(0, len(data), size):
+            os.write(self._master, data[start : start + size])
+
+
+def main() -> None:
+    """Run the simulator until interrupted, printing the pty to connect to."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="UC2 firmware simulator.")
+    parser.add_argument("--baudrate", type=int, default=115200)
+    parser.add_argument("--noise", type=float, default=0.0)
+    parser.add_argument("--fault-rate", type=float, default=0.0)
+    parser.add_argument("--drop-rate", type=float, default=0.0)
+    args = parser.parse_args()
+    with UC2Simulator(
+        baudrate=args.baudrate,
+        noise=args.noise,
+        fault_rate=args.fault_rate,
+        drop_rate=args.drop_rate,
+    ) as simulator:
+        print(f"UC2 simulator listening on {simulator.port}")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import math
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, Final
+
+# upper bound of the first bucket, in seconds;
+# each following bucket doubles the previous one
+_BASE: Final = 1e-5
+# the last bucket starts at ~84 s and collects everything above
+_BUCKETS: Final = 24
+
+# phases of a command, in order
+PHASES: Final = ("queue", "write", "ack", "motion", "total")
+
+
+class LatencyHistogram:
+    """Histogram of durations with logarithmic buckets.
+
+    Bucket ``k`` collects the durations up to ``10 µs * 2**k``; recording
+    a sample is a constant-time operation, so that it can be done on
+    the serial threads for every command. Quantiles are estimated
+    as the upper bound of the bucket they fall in, which gives them
+    a relative error of at most a factor 2.
+    """
+
+    def __init__(self) -> None:
+        self.counts = [0] * _BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Add a duration, in seconds."""
+        seconds = max(seconds, 0.0)
+        # frexp returns e such that seconds / _BASE is in [2**(e-1), 2**e)
+        index = math.frexp(seconds / _BASE)[1]
+        self.counts[min(max(index, 0), _BUCKETS - 1)] += 1
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+    @property
+    def mean(self) -> float:
+        """Mean of the recorded durations; 0.0 if there are none."""
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile of the recorded durations.
+
+        Parameters
+        ----------
+        q: `float`
+            The quantile to estimate, between 0 and 1.
+
+        Returns
+        -------
+        `float`
+            The estimate, in seconds; 0.0 if there are no samples.
+        """
+        if self.count == 0:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count > 0:
+                return min(_BASE * 2.0**index, self.max)
+        return self.max
+
+    def snapshot(self) -> dict[str, float]:
+        """Return the summary statistics of the histogram, in seconds."""
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "min": self.min if self.count else 0.0,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+        }
+
+
+class SerialStatistics:
+    """Timing and traffic statistics of the commands sent to a UC2 board.
+
+    The duration of each command is split into phases, recorded
+    separately for each kind of command (``/laser_act``, ``/motor_act``):
+
+    - ``queue``: from the submission to the start of the write;
+    - ``write``: the write to the serial port;
+    - ``ack``: from the end of the write to the first response;
+    - ``motion``: from the first response to the last one,
+      i.e. the travel of the motors;
+    - ``total``: from the submission to the last response.
+
+    All methods are thread-safe.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear all statistics."""
+        with self._lock:
+            self._histograms: dict[tuple[str, str], LatencyHistogram] = {}
+            self._failures: dict[str, int] = {}
+            self.bytes_sent = 0
+            self.bytes_received = 0
+
+    def record(self, task: str, phase: str, seconds: float) -> None:
+        """Record the duration of a phase of a command."""
+        with self._lock:
+            histogram = self._histograms.get((task, phase))
+            if histogram is None:
+                histogram = self._histograms[task, phase] = LatencyHistogram()
+            histogram.record(seconds)
+
+    def fail(self, task: str) -> None:
+        """Count a failed command."""
+        with self._lock:
+            self._failures[task] = self._failures.get(task, 0) + 1
+
+    def sent(self, size: int) -> None:
+        """Count bytes written to the serial port."""
+        with self._lock:
+            self.bytes_sent += size
+
+    def received(self, size: int) -> None:
+        """Count bytes read from the serial port."""
+        with self._lock:
+            self.bytes_received += size
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return a copy of the statistics.
+
+        Returns
+        -------
+        `dict[str, Any]`
+            ``bytes_sent`` and ``bytes_received``, and under ``tasks``
+            the ``failures`` of each kind of command and the
+            summary of each of its phases (see `LatencyHistogram.snapshot`).
+        """
+        with self._lock:
+            tasks: dict[str, dict[str, Any]] = {}
+            for (task, phase), histogram in sorted(self._histograms.items()):
+                entry = tasks.setdefault(task, {"failures": 0})
+                entry[phase] = histogram.snapshot()
+            for task, failures in self._failures.items():
+                tasks.setdefault(task, {})["failures"] = failures
+            return {
+                "bytes_sent": self.bytes_sent,
+                "bytes_received": self.bytes_received,
+                "tasks": tasks,
+            }
+
+    def summary(self) -> str:
+        """Format the statistics for logging, one line per phase."""
+        snapshot = self.snapshot()
+        lines = [
+            f"sent {snapshot['bytes_sent']} B, received {snapshot['bytes_received']} B"
+        ]
+        for task, entry in snapshot["tasks"].items():
+            lines.append(f"{task}: {entry['failures']} failed")
+            for phase in PHASES:
+                if phase not in entry:
+                    continue
+                stats = entry[phase]
+                lines.append(
+                    f"  {phase:<6} n={stats['count']} "
+                    f"mean={stats['mean'] * 1e3:.3f} ms "
+                    f"p50={stats['p50'] * 1e3:.3f} ms "
+                    f"p95={stats['p95'] * 1e3:.3f} ms "
+                    f"max={stats['max'] * 1e3:.3f} ms"
+                )
+        return "\n".join(lines)
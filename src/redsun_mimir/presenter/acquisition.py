@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 from collections.abc import Mapping, Sequence  # noqa: TC003
 from dataclasses import dataclass
+from functools import partial
 from typing import TYPE_CHECKING, Literal
 
 import bluesky.plan_stubs as bps
+import numpy as np
 import redsun.engine.plan_stubs as rps
-from bluesky.utils import MsgGenerator, RequestAbort  # noqa: TC002
+from bluesky.protocols import Triggerable
+from bluesky.utils import Msg, MsgGenerator, RequestAbort, maybe_await, short_uid
 from dependency_injector import providers
 from redsun.engine import RunEngine
 from redsun.engine.actions import Action, continous
@@ -22,22 +27,37 @@ from redsun.presenter.plan_spec import (
 )
 from redsun.storage import PrepareInfo
 from redsun.utils import find_signals
+from redsun.utils.descriptors import make_key, make_reading
 from redsun.virtual import Signal
 
-from redsun_mimir.device.pseudo import MedianPseudoDevice
-from redsun_mimir.protocols import (  # noqa: TC001
+from redsun_mimir.device.pseudo import (
+    MedianCache,
+    MedianPseudoDevice,
+    PositionPseudoDevice,
+    ReducerKind,
+    TilePseudoDevice,
+    make_reducer,
+)
+from redsun_mimir.protocols import (
     DetectorProtocol,
+    HasFrameTimestamps,
     MotorProtocol,
+    MultiAxisMotor,
     ReadableFlyer,
+    SequenceableMotor,
+    TrajectoryMotor,
 )
+from redsun_mimir.utils.geometry import order_positions, path_length, snake_grid
 
 if TYPE_CHECKING:
     from collections.abc import MutableSequence
     from concurrent.futures import Future
     from typing import Any, Callable, Mapping
 
-    from bluesky.protocols import Readable
+    import numpy.typing as npt
+    from bluesky.protocols import Configurable, Location, Readable, Reading
     from redsun.device import Device
+    from redsun.device.protocols import HasCache
     from redsun.engine.actions import SRLatch
     from redsun.virtual import VirtualContainer
 
@@ -74,17 +94,208 @@ class StreamAction(Action):
     toggle_states: tuple[str, str] = ("start", "stop")
 
 
+def _settle_frames(
+    readings: Mapping[str, Reading[Any]], stride: int
+) -> list[npt.NDArray[np.float32]]:
+    """Extract subsampled copies of the image readings in ``readings``."""
+    frames: list[npt.NDArray[np.float32]] = []
+    for reading in readings.values():
+        value = reading["value"]
+        if isinstance(value, np.ndarray) and value.ndim >= 2:
+            # astype copies, so reused read buffers are safe
+            frames.append(value[::stride, ::stride].astype(np.float32))
+    return frames
+
+
+def frame_motion(
+    previous: npt.NDArray[np.float32], current: npt.NDArray[np.float32]
+) -> float:
+    """Compute the relative change between two (subsampled) frames.
+
+    The metric is the mean absolute difference of the frames,
+    normalized by the mean intensity of ``previous``.
+
+    Parameters
+    ----------
+    previous : ``numpy.ndarray``
+        The reference frame.
+    current : ``numpy.ndarray``
+        The frame to compare against ``previous``.
+
+    Returns
+    -------
+    ``float``
+        The relative change; ``0.0`` for identical frames.
+    """
+    diff = float(np.abs(current - previous).mean())
+    scale = float(np.abs(previous).mean())
+    if scale == 0.0:
+        return 0.0 if diff == 0.0 else float("inf")
+    return diff / scale
+
+
+def wait_for_settle(
+    detectors: Sequence[Readable[Any]],
+    *,
+    tolerance: float = 0.01,
+    timeout: float = 1.0,
+    stride: int = 8,
+) -> MsgGenerator[bool]:
+    """Wait until the image seen by the detectors stops changing.
+
+    Frames are repeatedly acquired from ``detectors`` and compared to the
+    previous ones on a subsampled grid (see ``frame_motion``); the stub
+    returns as soon as the relative change of all detectors is below
+    ``tolerance``, or when ``timeout`` expires. The frames acquired
+    while waiting are not emitted in any stream.
+
+    Parameters
+    ----------
+    detectors : ``Sequence[Readable[Any]]``
+        The detectors to acquire from.
+    tolerance : ``float``, optional
+        The relative change below which the image is considered still.
+        Default is 0.01.
+    timeout : ``float``, optional
+        The maximum time to wait, in seconds. Default is 1.0.
+    stride : ``int``, optional
+        The subsampling step along each frame axis. Default is 8.
+
+    Returns
+    -------
+    ``bool``
+        True if the image settled before ``timeout``, False otherwise.
+    """
+    start = time.monotonic()
+    previous: list[npt.NDArray[np.float32]] | None = None
+    while True:
+        group = short_uid("settle")
+        triggered = False
+        for det in detectors:
+            if isinstance(det, Triggerable):
+                triggered = True
+                yield from bps.trigger(det, group=group)
+        if triggered:
+            yield from bps.wait(group=group)
+        current: list[npt.NDArray[np.float32]] = []
+        for det in detectors:
+            reading = yield from bps.read(det)
+            current.extend(_settle_frames(reading, stride))
+        if previous is not None and all(
+            frame_motion(prev, cur) <= tolerance for prev, cur in zip(previous, current)
+        ):
+            return True
+        if time.monotonic() - start >= timeout:
+            return False
+        previous = current
+
+
+def pipelined_step(
+    detectors: Sequence[Readable[Any]],
+    motor: MotorProtocol,
+    delta: float,
+    *,
+    stream: str,
+    cache: Sequence[HasCache] | None = None,
+    readables: Sequence[Readable[Any]] = (),
+    settle_tolerance: float | None = None,
+    settle_timeout: float = 1.0,
+) -> MsgGenerator[dict[str, Reading[Any]]]:
+    """Acquire one frame per detector while moving the motor to the next position.
+
+    The detectors are triggered first; as soon as the exposures are done,
+    the relative motor movement is started without waiting for it, and the
+    readings are collected into an event of ``stream`` (and optionally stashed
+    into ``cache``) while the motor travels. The stub then waits for the
+    movement to complete and for the stage to settle, so that
+    the next frame is acquired at the new, settled position.
+
+    By default the stage is considered settled after the motor ``settle_time``;
+    if ``settle_tolerance`` is given, the stub instead waits until the image
+    stops changing (see ``wait_for_settle``). If ``delta`` is zero,
+    the frames are acquired without moving.
+
+    Parameters
+    ----------
+    detectors : ``Sequence[Readable[Any]]``
+        The detectors to acquire from.
+    motor : ``MotorProtocol``
+        The motor to move along its active axis.
+    delta : ``float``
+        The relative movement, in the motor engineering units.
+    stream : ``str``
+        The name of the stream to emit the event into.
+    cache : ``Sequence[HasCache] | None``, optional
+        Cache objects, paired with ``detectors``, to stash the readings into.
+    readables : ``Sequence[Readable[Any]]``, optional
+        Additional objects read (but not triggered) into the same event.
+    settle_tolerance : ``float | None``, optional
+        If given, the tolerance of the image-based settle detection.
+        Default is None (wait for the motor ``settle_time``).
+    settle_timeout : ``float``, optional
+        Maximum time to wait for the image to settle, in seconds.
+        Ignored if ``settle_tolerance`` is None. Default is 1.0.
+
+    Returns
+    -------
+    ``dict[str, Reading[Any]]``
+        Combined readings from all detectors and readables.
+    """
+    trigger_group = short_uid("trigger")
+    triggered = False
+    for det in detectors:
+        if isinstance(det, Triggerable):
+            triggered = True
+            yield from bps.trigger(det, group=trigger_group)
+    if triggered:
+        yield from bps.wait(group=trigger_group)
+
+    # exposure is over; start moving while the frames are read out
+    move_group = short_uid("move")
+    if delta:
+        yield from bps.rel_set(motor, delta, group=move_group)
+
+    ret: dict[str, Reading[Any]] = {}
+    yield from bps.create(stream)
+    stash_group = short_uid("stash")
+    for idx, det in enumerate(detectors):
+        reading = yield from bps.read(det)
+        if cache is not None:
+            yield from rps.stash(cache[idx], reading, group=stash_group, wait=False)
+        ret.update(reading)
+    for obj in readables:
+        reading = yield from bps.read(obj)
+        ret.update(reading)
+    yield from bps.save()
+    if cache is not None:
+        yield from bps.wait(group=stash_group)
+
+    if not delta:
+        return ret
+    yield from bps.wait(group=move_group)
+    if settle_tolerance is not None:
+        yield from wait_for_settle(
+            detectors, tolerance=settle_tolerance, timeout=settle_timeout
+        )
+    elif motor.settle_time > 0:
+        yield from bps.sleep(motor.settle_time)
+    return ret
+
+
 def square_scan(
     detectors: Sequence[DetectorProtocol],
     motor: MotorProtocol,
     step: float,
     frames_per_side: int,
     axis: tuple[str, str],
+    settle_tolerance: float | None = None,
+    settle_timeout: float = 1.0,
 ) -> MsgGenerator[None]:
     """Perform a square scan movement with the specified motor and detectors.
 
-    Performs a square scan by moving the motor in a square pattern; before
-    each movement step, a reading is taken from the specified detectors.
+    Performs a square scan by moving the motor in a square pattern; at
+    each step, a reading is taken from the specified detectors while
+    the motor moves to the next position (see ``pipelined_step``).
 
     Parameters
     ----------
@@ -98,34 +309,32 @@ def square_scan(
         The number of frames to collect for each side of the square.
     axis : ``tuple[str, str]``
         The order of motor movement axes.
+    settle_tolerance : ``float | None``, optional
+        Tolerance of the image-based settle detection after each step.
+        If ``None`` (default), wait for the motor ``settle_time`` instead.
+    settle_timeout : ``float``, optional
+        Maximum time to wait for the image to settle, in seconds.
+        Default is 1.0.
 
     Yields
     ------
     ``MsgGenerator[None]``
         A generator yielding Bluesky messages for the square scan.
     """
-    # scan on the positive direction...
-    for idx in range(2):
-        ax = axis[idx]
+    # positive direction along both axes, then back
+    sides = [(axis[0], step), (axis[1], step), (axis[1], -step), (axis[0], -step)]
+    for ax, delta in sides:
         # set the axis direction
         yield from rps.set_property(motor, ax, propr="axis")
         for _ in range(frames_per_side):
-            yield from bps.trigger_and_read(detectors, "square_scan")
-            yield from bps.mvr(motor, step)
-            # add a short delay to stabilize the readings
-            # after motor movement
-            yield from bps.sleep(0.05)
-    # scan on the negative direction
-    for idx in range(2):
-        ax = axis[1 - idx]
-        # set the axis direction
-        yield from rps.set_property(motor, ax, propr="axis")
-        for _ in range(frames_per_side):
-            yield from bps.trigger_and_read(detectors, "square_scan")
-            yield from bps.mvr(motor, -step)
-            # add a short delay to stabilize the readings
-            # after motor movement
-            yield from bps.sleep(0.05)
+            yield from pipelined_step(
+                detectors,
+                motor,
+                delta,
+                stream="square_scan",
+                settle_tolerance=settle_tolerance,
+                settle_timeout=settle_timeout,
+            )
 
 
 def scan_and_stash(
@@ -135,12 +344,25 @@ def scan_and_stash(
     step: float,
     frames_per_side: int,
     axis: tuple[str, str],
-) -> MsgGenerator[None]:
+    tolerance: float | None = None,
+    min_frames: int = 0,
+    settle_tolerance: float | None = None,
+    settle_timeout: float = 1.0,
+    dwell: float | None = None,
+) -> MsgGenerator[int]:
     """Perform a square scan movement with the specified motor and detectors.
 
-    Performs a square scan by moving the motor in a square pattern; before
-    each movement step, a reading is taken from the specified detectors
-    and stashed into the cache model.
+    Performs a square scan by moving the motor in a square pattern; at
+    each step, a reading is taken from the specified detectors and
+    stashed into the cache model, while the motor moves to the next
+    position (see ``pipelined_step``).
+
+    If a ``tolerance`` is given, the scan stops as soon as at least
+    ``min_frames`` frames have been stashed and the
+    [`convergence`][redsun_mimir.device.pseudo.MedianPseudoDevice.convergence]
+    of every cache model is below ``tolerance``; the motor is then moved
+    back to the starting position. The cache models must be created
+    with a ``convergence_window`` for the scan to stop early.
 
     Parameters
     ----------
@@ -156,38 +378,467 @@ def scan_and_stash(
         The number of frames to collect for each side of the square.
     axis : ``tuple[str, str]``
         The order of motor movement axes.
+    tolerance : ``float | None``, optional
+        Convergence tolerance for stopping the scan early.
+        If ``None`` (default), the full square is always scanned.
+    min_frames : ``int``, optional
+        Minimum number of frames to stash before stopping early.
+        Default is 0.
+    settle_tolerance : ``float | None``, optional
+        Tolerance of the image-based settle detection after each step.
+        If ``None`` (default), wait for the motor ``settle_time`` instead.
+    settle_timeout : ``float``, optional
+        Maximum time to wait for the image to settle, in seconds.
+        Default is 1.0.
+    dwell : ``float | None``, optional
+        If given, and the motor implements
+        [`TrajectoryMotor`][redsun_mimir.protocols.TrajectoryMotor],
+        the whole square is uploaded to the motor at once and the stage
+        holds each position for ``dwell`` seconds (see ``stream_and_stash``);
+        ``settle_tolerance`` is then ignored. Default is None.
 
     Yields
     ------
-    ``MsgGenerator[None]``
-        A generator yielding Bluesky messages for the square scan.
+    ``MsgGenerator[int]``
+        A generator yielding Bluesky messages for the square scan;
+        returns the number of stashed frames.
     """
-    # scan on the positive direction
-    for idx in range(2):
-        ax = axis[idx]
+    # positive direction along both axes, then back
+    sides = [(axis[0], step), (axis[1], step), (axis[1], -step), (axis[0], -step)]
+    if dwell is not None and isinstance(motor, TrajectoryMotor):
+        moves = [{ax: delta} for ax, delta in sides for _ in range(frames_per_side)]
+        return (
+            yield from stream_and_stash(
+                detectors,
+                motor,
+                cache,
+                moves,
+                dwell=dwell,
+                tolerance=tolerance,
+                min_frames=min_frames,
+            )
+        )
+    displacement = dict.fromkeys(axis, 0.0)
+    frames = 0
+    for ax, delta in sides:
         # set the axis direction
         yield from rps.set_property(motor, ax, propr="axis")
         for _ in range(frames_per_side):
-            yield from rps.read_and_stash(
-                detectors, cache, group="stash", stream="square_scan", wait=True
+            yield from pipelined_step(
+                detectors,
+                motor,
+                delta,
+                stream="square_scan",
+                cache=cache,
+                settle_tolerance=settle_tolerance,
+                settle_timeout=settle_timeout,
             )
-            yield from bps.mvr(motor, step)
-            # add a short delay to stabilize the readings
-            # after motor movement
-            yield from bps.sleep(0.05)
-    # scan on the negative direction
-    for idx in range(2):
-        ax = axis[1 - idx]
-        # set the axis direction
+            displacement[ax] += delta
+            frames += 1
+            if (
+                tolerance is not None
+                and frames >= min_frames
+                and all(c.convergence <= tolerance for c in cache)
+            ):
+                # the estimate is stable; go back to where we started
+                yield from move_by(motor, displacement, sign=-1.0)
+                return frames
+    return frames
+
+
+def locate(motor: MotorProtocol) -> MsgGenerator[Location[Any]]:
+    """Locate the active axis of a motor.
+
+    Same as ``bps.locate`` for a single device, with a typed result.
+
+    Parameters
+    ----------
+    motor : ``MotorProtocol``
+        The motor to locate.
+
+    Returns
+    -------
+    ``Location[Any]``
+        The setpoint and readback of the active axis.
+    """
+    location: Location[Any] = yield Msg("locate", motor, squeeze=True)
+    return location
+
+
+def read_configuration(obj: Configurable[Any]) -> MsgGenerator[dict[str, Reading[Any]]]:
+    """Gather the configuration readings of a device.
+
+    Parameters
+    ----------
+    obj : ``Configurable[Any]``
+        The device to read the configuration of.
+
+    Returns
+    -------
+    ``dict[str, Reading[Any]]``
+        The readings returned by ``obj.read_configuration()``.
+    """
+
+    async def _read_configuration() -> dict[str, Reading[Any]]:
+        return await maybe_await(obj.read_configuration())
+
+    task: list[asyncio.Task[dict[str, Reading[Any]]]] = yield from bps.wait_for(
+        [_read_configuration]
+    )
+    return task[0].result()
+
+
+def locate_axes(motor: MultiAxisMotor) -> MsgGenerator[dict[str, Location[float]]]:
+    """Locate every axis of a motor, without changing the active axis.
+
+    Parameters
+    ----------
+    motor : ``MultiAxisMotor``
+        The motor to locate.
+
+    Returns
+    -------
+    ``dict[str, Location[float]]``
+        The setpoint and readback of each axis, by axis name.
+    """
+
+    async def _locate_axes() -> dict[str, Location[float]]:
+        return await maybe_await(motor.locate_axes())
+
+    task: list[asyncio.Task[dict[str, Location[float]]]] = yield from bps.wait_for(
+        [_locate_axes]
+    )
+    return task[0].result()
+
+
+def wait_future(future: Future[Any]) -> MsgGenerator[BaseException | None]:
+    """Wait for a concurrent future without blocking the run engine.
+
+    Returns the exception of the future, if any, instead of raising it.
+    """
+    yield from bps.wait_for([partial(asyncio.wrap_future, future)])
+    return future.exception()
+
+
+def stream_and_stash(
+    detectors: Sequence[ReadableFlyer],
+    motor: TrajectoryMotor,
+    cache: Sequence[MedianPseudoDevice],
+    moves: Sequence[Mapping[str, float]],
+    *,
+    dwell: float,
+    tolerance: float | None = None,
+    min_frames: int = 0,
+) -> MsgGenerator[int]:
+    """Acquire frames along a trajectory streamed to the motor, stashing them into the cache.
+
+    A frame is acquired from each detector at the starting position; then
+    the whole trajectory is uploaded to the motor, which moves to each
+    point as soon as the previous one is reached and held for ``dwell``
+    seconds. A frame is acquired at each point as soon as the motor reports
+    it reached, after the motor ``settle_time``; no frame is acquired at
+    the last point, which is where the next step would start.
+
+    ``dwell`` must therefore cover the settle time and the exposure of the
+    detectors; the scan itself does not wait on the host for each move.
+    If the motor leaves a point before its frames are acquired, the
+    trajectory is cancelled, the motor is moved back to the starting
+    position and the scan fails.
+
+    If a ``tolerance`` is given, the scan stops as soon as at least
+    ``min_frames`` frames have been stashed and the
+    [`convergence`][redsun_mimir.device.pseudo.MedianPseudoDevice.convergence]
+    of every cache model is below ``tolerance``; the trajectory is
+    cancelled and the motor is moved back to the starting position.
+    The cache models must be created with a ``convergence_window``
+    for the scan to stop early.
+
+    Parameters
+    ----------
+    detectors : ``Sequence[ReadableFlyer]``
+        The detectors to acquire from.
+    motor : ``TrajectoryMotor``
+        The motor to move.
+    cache : ``Sequence[MedianPseudoDevice]``
+        The cache models to stash readings into, paired with ``detectors``.
+    moves : ``Sequence[Mapping[str, float]]``
+        The relative moves of the trajectory, by axis name.
+    dwell : ``float``
+        Time in seconds the motor holds each point.
+    tolerance : ``float | None``, optional
+        Convergence tolerance for stopping the scan early.
+        If ``None`` (default), the full trajectory is always scanned.
+    min_frames : ``int``, optional
+        Minimum number of frames to stash before stopping early.
+        Default is 0.
+
+    Returns
+    -------
+    ``int``
+        The number of stashed frames.
+
+    Raises
+    ------
+    ``RuntimeError``
+        If the motor leaves a point before its frames are acquired,
+        i.e. if ``dwell`` is too short.
+    """
+
+    def rewind() -> MsgGenerator[None]:
+        # let the moves already sent complete,
+        # then go back to where we started
+        trajectory.cancel()
+        sent = trajectory.sent
+        yield from wait_future(trajectory.point(sent - 1))
+        displacement: dict[str, float] = {}
+        for move in moves[:sent]:
+            for ax, delta in move.items():
+                displacement[ax] = displacement.get(ax, 0.0) + delta
+        yield from move_by(motor, displacement, sign=-1.0)
+
+    # a step without movement acquires and stashes a frame from each detector
+    yield from pipelined_step(detectors, motor, 0.0, stream="square_scan", cache=cache)
+    frames = 1
+    trajectory = motor.upload_trajectory(moves, dwell=dwell)
+    for index in range(len(moves) - 1):
+        exc = yield from wait_future(trajectory.point(index))
+        if exc is not None:
+            raise exc
+        if motor.settle_time > 0:
+            yield from bps.sleep(motor.settle_time)
+        yield from pipelined_step(
+            detectors, motor, 0.0, stream="square_scan", cache=cache
+        )
+        frames += 1
+        # the next point is only sent once the dwell time is over;
+        # if it already was, the motor may have moved during the exposure
+        if trajectory.sent > index + 1:
+            yield from rewind()
+            raise RuntimeError(
+                f"The motor left point {index} of the trajectory before "
+                f"the frames were acquired; the dwell time ({dwell} s) must "
+                "cover the settle time and the exposure of the detectors."
+            )
+        if (
+            tolerance is not None
+            and frames >= min_frames
+            and all(c.convergence <= tolerance for c in cache)
+        ):
+            yield from rewind()
+            return frames
+    exc = yield from wait_future(trajectory.point(len(moves) - 1))
+    if exc is not None:
+        raise exc
+    return frames
+
+
+def move_by(
+    motor: MotorProtocol,
+    displacement: Mapping[str, float],
+    sign: float = 1.0,
+) -> MsgGenerator[None]:
+    """Move the motor by a displacement along one or more axes.
+
+    Motors implementing [`MultiAxisMotor`][redsun_mimir.protocols.MultiAxisMotor]
+    move all the axes with a single command; other motors
+    move one axis at a time. Axes with no displacement are not moved.
+
+    Parameters
+    ----------
+    motor : ``MotorProtocol``
+        The motor to move.
+    displacement : ``Mapping[str, float]``
+        The displacement along each axis, in the motor engineering units.
+    sign : ``float``, optional
+        Multiplier of the displacement; i.e. -1.0 to move back. Default is 1.0.
+    """
+    moves = {ax: sign * delta for ax, delta in displacement.items() if delta != 0.0}
+    if not moves:
+        return
+    if isinstance(motor, MultiAxisMotor):
+        locations = yield from locate_axes(motor)
+        targets = {ax: locations[ax]["setpoint"] + delta for ax, delta in moves.items()}
+        yield from bps.abs_set(motor, targets, wait=True)
+        return
+    for ax, delta in moves.items():
         yield from rps.set_property(motor, ax, propr="axis")
-        for _ in range(frames_per_side):
-            yield from rps.read_and_stash(
-                detectors, cache, group="stash", stream="square_scan", wait=True
+        yield from bps.mvr(motor, delta)
+
+
+def fly_path(
+    motor: MotorProtocol,
+    legs: Sequence[tuple[str, float]],
+) -> MsgGenerator[tuple[list[float], dict[str, list[float]]]]:
+    """Move the motor along a path, recording when each movement starts and ends.
+
+    The motor positions are only known when the motor is still; the returned
+    knots can be used to interpolate the stage position of frames acquired
+    while moving (see [`PositionPseudoDevice`][redsun_mimir.device.pseudo.PositionPseudoDevice]).
+
+    Parameters
+    ----------
+    motor : ``MotorProtocol``
+        The motor to move.
+    legs : ``Sequence[tuple[str, float]]``
+        The path, as a sequence of ``(axis, displacement)`` movements,
+        in the motor engineering units.
+
+    Returns
+    -------
+    ``tuple[list[float], dict[str, list[float]]]``
+        The knot timestamps, and the motor position along
+        each axis of the path at each knot.
+    """
+    axes = list(dict.fromkeys(ax for ax, _ in legs))
+    position: dict[str, float] = {}
+    for ax in axes:
+        yield from rps.set_property(motor, ax, propr="axis")
+        location = yield from locate(motor)
+        position[ax] = location["readback"]
+
+    times = [time.time()]
+    knots = {ax: [position[ax]] for ax in axes}
+    for ax, delta in legs:
+        yield from rps.set_property(motor, ax, propr="axis")
+        group = short_uid("fly")
+        start = time.time()
+        yield from bps.abs_set(motor, position[ax] + delta, group=group)
+        yield from bps.wait(group=group)
+        stop = time.time()
+        # the motor leaves the previous position when the movement
+        # starts and reaches the new one when the movement is done
+        times.append(start)
+        for knot_ax in axes:
+            knots[knot_ax].append(position[knot_ax])
+        position[ax] += delta
+        times.append(stop)
+        for knot_ax in axes:
+            knots[knot_ax].append(position[knot_ax])
+    return times, knots
+
+
+def median_cache_keys(
+    detectors: Sequence[ReadableFlyer],
+    motor: MotorProtocol,
+    bucket: float,
+    **extra: Any,
+) -> MsgGenerator[list[tuple[str, dict[str, Any]]]]:
+    """Compute the median cache keys for the current acquisition context.
+
+    Reads the current "X" and "Y" position of the motor and a frame from
+    each detector to determine the region of interest and pixel type.
+    The active axis of motors implementing
+    [`MultiAxisMotor`][redsun_mimir.protocols.MultiAxisMotor] is not changed;
+    other motors are left with their first axis active.
+
+    Parameters
+    ----------
+    detectors : ``Sequence[ReadableFlyer]``
+        The detectors to compute the keys for.
+    motor : ``MotorProtocol``
+        The motor providing the stage position.
+    bucket : ``float``
+        The size of the stage-position bucket, in the motor engineering units.
+    **extra : ``Any``
+        Additional parameters affecting the median computation.
+
+    Returns
+    -------
+    ``list[tuple[str, dict[str, Any]]]``
+        The key and acquisition context of each detector, in order.
+    """
+    position: list[float] = []
+    if isinstance(motor, MultiAxisMotor):
+        locations = yield from locate_axes(motor)
+        position = [locations[ax]["readback"] for ax in ("X", "Y")]
+    else:
+        for ax in ("X", "Y"):
+            yield from rps.set_property(motor, ax, propr="axis")
+            location = yield from locate(motor)
+            position.append(location["readback"])
+        yield from rps.set_property(motor, motor.axis[0], propr="axis")
+    keys: list[tuple[str, dict[str, Any]]] = []
+    for det in detectors:
+        reading = yield from bps.read(det)
+        frame = reading[make_key(det.name, "buffer")]["value"]
+        roi_key = make_key(det.name, "roi")
+        roi = reading[roi_key]["value"] if roi_key in reading else det.sensor_shape
+        config = yield from read_configuration(det)
+        exposure_key = make_key(det.name, "exposure")
+        exposure = config[exposure_key]["value"] if exposure_key in config else None
+        keys.append(
+            MedianCache.make_key(
+                det.name,
+                exposure=exposure,
+                roi=roi,
+                pixel_type=frame.dtype,
+                position=position,
+                bucket=bucket,
+                **extra,
             )
-            yield from bps.mvr(motor, -step)
-            # add a short delay to stabilize the readings
-            # after motor movement
-            yield from bps.sleep(0.05)
+        )
+    return keys
+
+
+def parse_roi(text: str) -> tuple[int, int, int, int] | None:
+    """Parse a region of interest from a comma-separated string.
+
+    Parameters
+    ----------
+    text : ``str``
+        The region as ``"x, y, w, h"``. An empty string
+        or ``"full"`` (case-insensitive) means no region.
+
+    Returns
+    -------
+    ``tuple[int, int, int, int] | None``
+        The parsed region, or ``None`` for the full frame.
+
+    Raises
+    ------
+    ``ValueError``
+        If ``text`` does not contain exactly four non-negative integers.
+    """
+    if text.strip().lower() in ("", "full"):
+        return None
+    values = [int(v) for v in text.split(",")]
+    if len(values) != 4 or any(v < 0 for v in values):
+        raise ValueError(f"Expected 'x, y, w, h' with non-negative integers: {text!r}")
+    return values[0], values[1], values[2], values[3]
+
+
+def parse_positions(text: str) -> list[tuple[float, ...]]:
+    """Parse a list of stage positions from a string.
+
+    Parameters
+    ----------
+    text : ``str``
+        Positions separated by semicolons, each as comma-separated
+        coordinates (i.e. ``"0, 0; 100, 0; 100, 50"``).
+
+    Returns
+    -------
+    ``list[tuple[float, ...]]``
+        The parsed positions.
+
+    Raises
+    ------
+    ``ValueError``
+        If no position is given, if a coordinate is not a number,
+        or if the positions do not all have the same number of coordinates.
+    """
+    positions = [
+        tuple(float(v) for v in item.split(","))
+        for item in text.split(";")
+        if item.strip()
+    ]
+    if not positions:
+        raise ValueError("At least one position is required.")
+    if len({len(p) for p in positions}) != 1:
+        raise ValueError(
+            f"All positions must have the same number of coordinates: {text!r}"
+        )
+    return positions
 
 
 # TODO: move this somewhere else
@@ -242,6 +893,9 @@ class AcquisitionPresenter(Presenter, Loggable):
         Callback names to subscribe to on the run engine, if any.
         If not provided, no callbacks will be subscribed to.
         Defaults to None.
+    median_cache: str | None, keyword-only, optional
+        Directory of the on-disk median cache used by `live_median_scan`.
+        Defaults to ``~/redsun-storage/.median-cache``.
 
     Attributes
     ----------
@@ -267,10 +921,12 @@ class AcquisitionPresenter(Presenter, Loggable):
         devices: Mapping[str, Device],
         /,
         callbacks: list[str] | None = None,
+        median_cache: str | None = None,
     ) -> None:
         super().__init__(name, devices)
         self.models = devices
         self.engine = RunEngine()
+        self.median_cache = MedianCache(median_cache)
 
         self.futures: set[Future[Any]] = set()
         self.event_map: dict[str, SRLatch] = {}
@@ -283,6 +939,10 @@ class AcquisitionPresenter(Presenter, Loggable):
             "live_count": self.live_count,
             "live_stream": self.live_stream,
             "live_median_scan": self.live_median_scan,
+            "fly_scan": self.fly_scan,
+            "multi_position": self.multi_position,
+            "mosaic": self.mosaic,
+            "z_stack": self.z_stack,
         }
         self.plan_specs: dict[str, PlanSpec] = {}
         for name, plan in self.plans.items():
@@ -400,6 +1060,19 @@ class AcquisitionPresenter(Presenter, Loggable):
         scan_frames: int = 20,
         direction: Literal["xy", "yx"] = "xy",
         stream_frames: int = 10,
+        reducer: ReducerKind = "median",
+        reducer_percent: float | None = None,
+        median_dtype: Literal["float32", "float64"] = "float32",
+        use_cache: bool = False,
+        cache_max_age: float = 600.0,
+        cache_bucket: float = 100.0,
+        scan_tolerance: float = 0.0,
+        scan_min_frames: int = 8,
+        median_roi: str = "full",
+        median_binning: int = 1,
+        settle_tolerance: float = 0.0,
+        settle_timeout: float = 1.0,
+        scan_dwell: float = 0.0,
         /,
         scan: Action = ScanAction(),
         stream: Action = StreamAction(togglable=False),
@@ -448,11 +1121,79 @@ class AcquisitionPresenter(Presenter, Loggable):
         - stream_frames: ``int``, optional
             - The number of frames to stream to disk when the stream action is triggered.
             - Default is 10.
+        - reducer: ``Literal["median", "mean", "trimmed_mean", "percentile", "min", "max"]``, optional
+            - The per-pixel statistic used to compute the background frame.
+            - "mean", "min" and "max" are updated for each frame
+            without keeping the scan frames in memory.
+            - Default is "median".
+        - reducer_percent: ``float | None``, optional
+            - Parameter of the "trimmed_mean" (percentage of frames cut from
+            each end of the distribution) and "percentile" (percentile to compute) reducers.
+            - Ignored by the other reducers.
+            - Default is None, which cuts 20% from each end for "trimmed_mean"
+            and computes the 50th percentile for "percentile".
+        - median_dtype: ``Literal["float32", "float64"]``, optional
+            - The floating point precision of the computed median frames,
+            both in memory and when streamed to disk.
+            - Default is "float32".
+        - use_cache: ``bool``, optional
+            - If True, when the "scan" action is triggered, look for medians
+            previously computed with the same detector exposure, ROI,
+            pixel type, reducer and scan geometry, near the current stage position.
+            If all detectors have a valid cached median, it is reused
+            and the scan is skipped; otherwise, the scan is performed
+            and the new medians are stored in the cache.
+            - Default is False.
+        - cache_max_age: ``float``, optional
+            - Maximum age in seconds of a cached median to be reused.
+            - Default is 600.0.
+        - cache_bucket: ``float``, optional
+            - Size of the stage-position bucket used to match cached medians,
+            expressed in `step_egu`.
+            - Default is 100.0.
+        - scan_tolerance: ``float``, optional
+            - If positive, the scan stops early once the relative change of a
+            subsampled running median between two consecutive frames
+            drops below this value for all detectors.
+            `scan_frames` is then the maximum number of frames to collect.
+            - Default is 0.0 (always collect `scan_frames` frames).
+        - scan_min_frames: ``int``, optional
+            - Minimum number of frames to collect before stopping early.
+            - Default is 8.
+        - median_roi: ``str``, optional
+            - Region of the frames over which the median is computed,
+            as comma-separated "x, y, w, h" pixel values.
+            - "full" (or an empty string) uses the full frame.
+            - Default is "full".
+        - median_binning: ``int``, optional
+            - Binning factor (1, 2 or 4) applied to the frames before
+            computing the median; the median is upsampled back to the
+            frame size before being used for correction.
+            - Default is 1 (no binning).
+        - settle_tolerance: ``float``, optional
+            - If positive, after each scan step wait until the relative change
+            between consecutive subsampled frames drops below this value,
+            instead of waiting for the fixed motor settle time.
+            - Default is 0.0 (use the motor settle time).
+        - settle_timeout: ``float``, optional
+            - Maximum time in seconds to wait for the image to settle.
+            - Default is 1.0.
+        - scan_dwell: ``float``, optional
+            - If positive, and the motor can stream trajectories, the scan
+            path is uploaded to the motor at once, and the stage holds each
+            position for this time in seconds; frames are acquired as soon
+            as each position is reached, instead of waiting for each move.
+            Must cover the motor settle time and the detector exposure,
+            otherwise the scan fails.
+            - Default is 0.0 (move step by step).
 
         Raises
         ------
         - ``TypeError``
             - If `motor` does not provide both "X" and "Y" axis of movement.
+        - ``ValueError``
+            - If `median_roi` is not "full" and does not contain four integers.
+            - If `median_binning` is not 1, 2 or 4.
         """
         if len(motor.axis) < 2 or not all(ax in motor.axis for ax in ["X", "Y"]):
             raise TypeError(
@@ -464,7 +1205,19 @@ class AcquisitionPresenter(Presenter, Loggable):
         for det in detectors:
             describe = yield from rps.describe(det)
             collect = yield from rps.describe_collect(det)
-            medians.append(MedianPseudoDevice(det, describe, collect))
+            medians.append(
+                MedianPseudoDevice(
+                    det,
+                    describe,
+                    collect,
+                    reducer=make_reducer(reducer, reducer_percent),
+                    dtype=median_dtype,
+                    # the convergence is only needed to stop the scan early
+                    convergence_window=scan_frames if scan_tolerance > 0 else None,
+                    roi=parse_roi(median_roi),
+                    binning=median_binning,
+                )
+            )
 
         axis = ("X", "Y") if direction == "xy" else ("Y", "X")
         self.event_map.update(**scan.event_map, **stream.event_map)
@@ -473,6 +1226,11 @@ class AcquisitionPresenter(Presenter, Loggable):
             from_egu=step_egu,
             to_egu=motor.egu,
         )
+        _, bucket = convert_to_target_egu(
+            cache_bucket,
+            from_egu=step_egu,
+            to_egu=motor.egu,
+        )
 
         live_stream = "live"
         stream_name = "stream"
@@ -507,20 +1265,67 @@ class AcquisitionPresenter(Presenter, Loggable):
                 # make sure to clear the cache at each scan, to avoid stale data
                 for median in medians:
                     yield from rps.clear_cache(median, wait=True)
+                if use_cache:
+                    cache_keys = yield from median_cache_keys(
+                        detectors,
+                        motor,
+                        bucket,
+                        reducer=reducer,
+                        reducer_percent=reducer_percent,
+                        dtype=median_dtype,
+                        scan={
+                            "step": step,
+                            "points_per_side": scan_frames // 4,
+                            "axes": list(axis),
+                        },
+                        median_roi=median_roi,
+                        binning=median_binning,
+                    )
+                    cached = [
+                        self.median_cache.get(key, max_age=cache_max_age)
+                        for key, _ in cache_keys
+                    ]
+                    if all(frame is not None for frame in cached):
+                        self.logger.info("Reusing cached medians; skipping scan")
+                        for det, median, frame in zip(detectors, medians, cached):
+                            # a single stashed frame reduces to itself
+                            reading = {
+                                make_key(det.name, "buffer"): make_reading(
+                                    frame, time.time()
+                                )
+                            }
+                            yield from rps.stash(median, reading, group=None, wait=True)
+                            yield from bps.trigger(median, group="median")
+                        yield from bps.wait(group="median")
+                        self.clear_and_notify(name, event)
+                        continue
                 if motor.egu != step_egu:
                     yield from rps.set_property(motor, step, propr="step_size")
-                yield from scan_and_stash(
+                frames = yield from scan_and_stash(
                     detectors,
                     motor,
                     medians,
                     step,
                     scan_frames // 4,
                     axis,
+                    tolerance=scan_tolerance if scan_tolerance > 0 else None,
+                    min_frames=scan_min_frames,
+                    settle_tolerance=settle_tolerance if settle_tolerance > 0 else None,
+                    settle_timeout=settle_timeout,
+                    dwell=scan_dwell if scan_dwell > 0 else None,
                 )
+                self.logger.debug(f"Scan completed with {frames} frames")
+                # we have a stash of collected frames;
+                # trigger all medians together so that
+                # they are computed in parallel
                 for median in medians:
-                    # we have a stash of collected frames;
-                    # call trigger to perform median calculation
-                    yield from bps.trigger(median)
+                    yield from bps.trigger(median, group="median")
+                yield from bps.wait(group="median")
+                if use_cache:
+                    for median, (key, context) in zip(medians, cache_keys):
+                        reading = yield from bps.read(median)
+                        frame = reading[make_key(median.name, "buffer")]["value"]
+                        self.median_cache.put(key, frame, context)
                 if step != old_step:
                     yield from rps.set_property(motor, old_step, propr="step_size")
 
@@ -540,6 +1345,471 @@ class AcquisitionPresenter(Presenter, Loggable):
                 yield from bps.collect(*objs, name=stream_name)
             self.clear_and_notify(name, event)
 
+    def multi_position(
+        self,
+        detectors: Sequence[DetectorProtocol],
+        motor: MotorProtocol,
+        positions: str = "0, 0",
+        positions_egu: Literal["um", "mm", "nm"] = "um",
+        frames: int = 1,
+        optimize_order: bool = True,
+    ) -> MsgGenerator[None]:
+        """Take snapshots from the detectors at a list of stage positions.
+
+        All positions are acquired in a single run, keeping the detectors
+        staged; at each position, the stage position is emitted in
+        a ``positions`` stream, followed by ``frames`` snapshots
+        in the ``multi_position`` stream.
+
+        Parameters
+        ----------
+        - detectors: ``Sequence[DetectorProtocol]``
+            - The detectors to take snapshots from.
+        - motor: ``MotorProtocol``
+            - The motor to move; coordinates are assigned
+            to the motor axes in order (i.e. X, Y, Z).
+        - positions: ``str``
+            - The absolute positions to visit, separated by semicolons,
+            each as comma-separated coordinates (i.e. "0, 0; 100, 0; 100, 50").
+            - Default is "0, 0".
+        - positions_egu: ``Literal["um", "mm", "nm"]``, optional
+            - The engineering unit of `positions`.
+            - Default is "um".
+        - frames: ``int``, optional
+            - The number of snapshots to take at each position.
+            Must be a non-zero, positive integer.
+            - Default is 1.
+        - optimize_order: ``bool``, optional
+            - If True, visit the positions in the order that reduces the
+            total stage travel from the current position; otherwise,
+            visit them as given.
+            - Default is True.
+
+        Raises
+        ------
+        - ``ValueError``
+            - If `positions` cannot be parsed, or has more
+            coordinates than the motor axes.
+        """
+        if frames <= 0:
+            # safeguard against invalid input
+            frames = 1
+        targets = [
+            tuple(
+                convert_to_target_egu(v, from_egu=positions_egu, to_egu=motor.egu)[1]
+                for v in position
+            )
+            for position in parse_positions(positions)
+        ]
+        if len(targets[0]) > len(motor.axis):
+            raise ValueError(
+                f"Positions have {len(targets[0])} coordinates,"
+                f" but the motor only has {motor.axis} axes."
+            )
+        axis = motor.axis[: len(targets[0])]
+
+        if isinstance(motor, MultiAxisMotor):
+            locations = yield from locate_axes(motor)
+            current = [locations[ax]["readback"] for ax in axis]
+        else:
+            current = []
+            for ax in axis:
+                yield from rps.set_property(motor, ax, propr="axis")
+                location = yield from locate(motor)
+                current.append(location["readback"])
+        if optimize_order:
+            order = order_positions(targets, start=current)
+        else:
+            order = list(range(len(targets)))
+        self.logger.debug(
+            f"Visiting {len(order)} positions; travel: "
+            f"{path_length(targets, order, current):.2f} {motor.egu} "
+            f"(as given: {path_length(targets, None, current):.2f} {motor.egu})"
+        )
+
+        position = PositionPseudoDevice(f"{motor.name}_position", axis, egu=motor.egu)
+
+        yield from bps.open_run()
+        yield from bps.stage_all(*detectors)
+        for idx in order:
+            moves = {
+                ax: target
+                for ax, target, now in zip(axis, targets[idx], current)
+                if target != now
+            }
+            if isinstance(motor, MultiAxisMotor) and moves:
+                # all axes move together, with a single command
+                yield from bps.abs_set(motor, moves, wait=True)
+            else:
+                for ax, target in moves.items():
+                    yield from rps.set_property(motor, ax, propr="axis")
+                    yield from bps.abs_set(motor, target, wait=True)
+            current = list(targets[idx])
+            if motor.settle_time > 0:
+                yield from bps.sleep(motor.settle_time)
+
+            position.record(dict(zip(axis, current)))
+            yield from bps.create("positions")
+            yield from bps.read(position)
+            yield from bps.save()
+            for _ in range(frames):
+                yield from bps.trigger_and_read(detectors, name="multi_position")
+        yield from bps.unstage_all(*detectors)
+        yield from bps.close_run(exit_status="success")
+
+    def mosaic(
+        self,
+        detectors: Sequence[ReadableFlyer],
+        motor: MotorProtocol,
+        rows: int = 3,
+        cols: int = 3,
+        overlap: float = 0.1,
+        pixel_size: float = 1.0,
+        pixel_egu: Literal["um", "mm", "nm"] = "um",
+    ) -> MsgGenerator[None]:
+        """Acquire a grid of overlapping tiles, starting from the current stage position.
+
+        Tiles are acquired in serpentine order (left to right on even rows,
+        right to left on odd rows), so that the stage only moves by one tile
+        between frames; each move is started as soon as the exposure is over,
+        while the previous tile is read out.
+
+        Each tile is emitted in the ``mosaic`` stream together with its stage
+        position, and written at full resolution to disk; the tile positions
+        are stored as metadata of the store. The grid geometry is stored in the
+        ``mosaic`` key of the run metadata, so that a preview can be
+        stitched while the tiles arrive.
+
+        Parameters
+        ----------
+        - detectors: ``Sequence[ReadableFlyer]``
+            - The detectors to acquire tiles from.
+            - The tile size is taken from the first detector.
+        - motor: ``MotorProtocol``
+            - The motor to move; it must provide both "X" and "Y" axes.
+        - rows: ``int``, optional
+            - Number of rows of tiles (along Y). Default is 3.
+        - cols: ``int``, optional
+            - Number of columns of tiles (along X). Default is 3.
+        - overlap: ``float``, optional
+            - Fraction of each tile overlapping with its neighbours,
+            in the range [0, 1). Default is 0.1.
+        - pixel_size: ``float``, optional
+            - Size of a detector pixel at the sample plane. Default is 1.0.
+        - pixel_egu: ``Literal["um", "mm", "nm"]``, optional
+            - The engineering unit of `pixel_size`. Default is "um".
+
+        Raises
+        ------
+        - ``TypeError``
+            - If `motor` does not provide both "X" and "Y" axis of movement.
+        - ``ValueError``
+            - If `rows` or `cols` are not positive, or `overlap` is not in [0, 1).
+        """
+        if not all(ax in motor.axis for ax in ["X", "Y"]):
+            raise TypeError(
+                "The provided motor must have both 'X' and 'Y' axes of movement."
+                f" Available axes: {motor.axis}"
+            )
+        if rows < 1 or cols < 1:
+            raise ValueError(f"Invalid grid size: {rows} x {cols}.")
+        if not 0.0 <= overlap < 1.0:
+            raise ValueError(f"Overlap must be in [0, 1), got {overlap}.")
+        _, pixel = convert_to_target_egu(
+            pixel_size, from_egu=pixel_egu, to_egu=motor.egu
+        )
+        axis = ("X", "Y")
+
+        origin: list[float] = []
+        for ax in axis:
+            yield from rps.set_property(motor, ax, propr="axis")
+            location = yield from locate(motor)
+            origin.append(location["readback"])
+
+        # frames are indexed as frame[x, y]
+        shapes: list[tuple[int, ...]] = []
+        dtypes: list[np.dtype[Any]] = []
+        for det in detectors:
+            reading = yield from bps.read(det)
+            frame = np.asarray(reading[make_key(det.name, "buffer")]["value"])
+            shapes.append(frame.shape)
+            dtypes.append(frame.dtype)
+        step = (
+            shapes[0][0] * pixel * (1.0 - overlap),
+            shapes[0][1] * pixel * (1.0 - overlap),
+        )
+        cells = snake_grid(rows, cols)
+        positions = [
+            (origin[0] + col * step[0], origin[1] + row * step[1]) for row, col in cells
+        ]
+
+        tiles = [
+            TilePseudoDevice(det, shape, dtype, positions, axis, egu=motor.egu)
+            for det, shape, dtype in zip(detectors, shapes, dtypes)
+        ]
+        position = PositionPseudoDevice(f"{motor.name}_position", axis, egu=motor.egu)
+
+        md = {
+            "mosaic": {
+                "rows": rows,
+                "cols": cols,
+                "origin": origin,
+                "step": list(step),
+                "pixel_size": pixel,
+                "egu": motor.egu,
+                "tile_shape": list(shapes[0]),
+                "position_keys": [make_key(position.name, ax.lower()) for ax in axis],
+            }
+        }
+        yield from bps.open_run(md=md)
+        yield from bps.stage_all(*detectors)
+
+        prepare_info = PrepareInfo(capacity=len(cells), write_forever=False)
+        yield from bps.prepare(motor, prepare_info, wait=True)
+        for tile in tiles:
+            yield from bps.prepare(tile, prepare_info, wait=True)
+        yield from bps.declare_stream(*tiles, name="mosaic_tiles", collect=True)
+        yield from bps.kickoff_all(*tiles, wait=True)
+
+        for k, (row, col) in enumerate(cells):
+            position.record(dict(zip(axis, positions[k])))
+            ax, delta = axis[0], 0.0
+            if k + 1 < len(cells):
+                next_row, next_col = cells[k + 1]
+                if next_row != row:
+                    ax, delta = axis[1], (next_row - row) * step[1]
+                else:
+                    delta = (next_col - col) * step[0]
+                yield from rps.set_property(motor, ax, propr="axis")
+            yield from pipelined_step(
+                detectors,
+                motor,
+                delta,
+                stream="mosaic",
+                cache=tiles,
+                readables=[position],
+            )
+
+        yield from bps.complete_all(*tiles, wait=True)
+        yield from bps.collect(*tiles, name="mosaic_tiles")
+        yield from bps.unstage_all(*detectors)
+        yield from bps.close_run(exit_status="success")
+
+    def z_stack(
+        self,
+        detectors: Sequence[ReadableFlyer],
+        motor: MotorProtocol,
+        planes: int = 11,
+        step: float = 1.0,
+        step_egu: Literal["um", "mm", "nm"] = "um",
+        axis: str = "Z",
+        centered: bool = True,
+        hardware: bool = True,
+    ) -> MsgGenerator[None]:
+        """Acquire a stack of planes along one motor axis.
+
+        If the motor can load a hardware sequence of positions for
+        `axis` (see [`SequenceableMotor`][redsun_mimir.protocols.SequenceableMotor]),
+        the stack positions are loaded once and the detectors stream all
+        planes at once, with the stage advancing on each camera trigger;
+        the acquisition time approaches ``planes`` × exposure.
+        Otherwise, the stage is stepped in software, starting each move
+        as soon as the exposure of the previous plane is over.
+
+        The stage goes back to the starting position after the stack.
+        The plane positions are stored in the ``z_stack`` key of the run metadata.
+
+        Parameters
+        ----------
+        - detectors: ``Sequence[ReadableFlyer]``
+            - The detectors to acquire the stack from.
+        - motor: ``MotorProtocol``
+            - The motor to move.
+        - planes: ``int``, optional
+            - Number of planes of the stack. Default is 11.
+        - step: ``float``, optional
+            - Distance between consecutive planes. Default is 1.0.
+        - step_egu: ``Literal["um", "mm", "nm"]``, optional
+            - The engineering unit of `step`. Default is "um".
+        - axis: ``str``, optional
+            - The motor axis to move along. Default is "Z".
+        - centered: ``bool``, optional
+            - If ``True``, the stack is centered on the current position;
+            otherwise, it starts from the current position. Default is ``True``.
+        - hardware: ``bool``, optional
+            - Use a hardware sequence when the motor supports it.
+            - Default is ``True``.
+
+        Raises
+        ------
+        - ``TypeError``
+            - If `motor` does not provide `axis`.
+        - ``ValueError``
+            - If `planes` is not positive.
+        """
+        if axis not in motor.axis:
+            raise TypeError(
+                f"The provided motor has no '{axis}' axis of movement."
+                f" Available axes: {motor.axis}"
+            )
+        if planes < 1:
+            raise ValueError(f"Invalid number of planes: {planes}.")
+        _, step = convert_to_target_egu(step, from_egu=step_egu, to_egu=motor.egu)
+
+        yield from rps.set_property(motor, axis, propr="axis")
+        location = yield from locate(motor)
+        start = location["readback"]
+        first = start - step * (planes - 1) / 2 if centered else start
+        positions = [first + k * step for k in range(planes)]
+
+        sequenced = (
+            hardware
+            and planes > 1
+            and isinstance(motor, SequenceableMotor)
+            and planes <= motor.sequence_max_length(axis)
+        )
+        if hardware and not sequenced:
+            self.logger.info(
+                f"{motor.name} cannot sequence {planes} positions on {axis}; "
+                "stepping in software."
+            )
+
+        stream_name = "z_stack"
+        md = {
+            "z_stack": {
+                "axis": axis,
+                "positions": positions,
+                "egu": motor.egu,
+                "sequenced": sequenced,
+            }
+        }
+        yield from bps.open_run(md=md)
+        yield from bps.stage_all(*detectors)
+
+        yield from bps.abs_set(motor, first, wait=True)
+        yield from bps.sleep(motor.settle_time)
+
+        if sequenced:
+            prepare_info = PrepareInfo(capacity=planes, write_forever=False)
+            yield from rps.set_property(motor, positions, propr="sequence")
+            yield from bps.prepare(motor, prepare_info, wait=True)
+            for det in detectors:
+                yield from bps.prepare(det, prepare_info, wait=True)
+            yield from bps.declare_stream(*detectors, name=stream_name, collect=True)
+
+            # arm the stage first, so that it follows the first camera trigger
+            yield from bps.kickoff(motor, wait=True)
+            yield from bps.kickoff_all(*detectors, wait=True)
+            yield from bps.complete_all(*detectors, wait=True)
+            yield from bps.complete(motor, wait=True)
+            yield from bps.collect(*detectors, name=stream_name)
+        else:
+            for k in range(planes):
+                delta = step if k + 1 < planes else 0.0
+                yield from pipelined_step(detectors, motor, delta, stream=stream_name)
+
+        yield from bps.abs_set(motor, start, wait=True)
+        yield from bps.unstage_all(*detectors)
+        yield from bps.close_run(exit_status="success")
+
+    def fly_scan(
+        self,
+        detectors: Sequence[ReadableFlyer],
+        motor: MotorProtocol,
+        length: float = 100.0,
+        length_egu: Literal["um", "mm", "nm"] = "um",
+        path: Literal["line", "square"] = "square",
+        direction: Literal["xy", "yx"] = "xy",
+    ) -> MsgGenerator[None]:
+        """Stream frames to disk while the stage moves continuously along a path.
+
+        The detectors stream frames at their own rate for the whole
+        duration of the movement, so that the number of acquired frames
+        is limited by the camera rather than by the motor round trips.
+        The stage position of each frame is interpolated from the start
+        and stop times of the motor movements and the frame timestamps,
+        and emitted in a ``{detector}_positions`` stream.
+
+        Parameters
+        ----------
+        - detectors: ``Sequence[ReadableFlyer]``
+            - The detectors to stream from.
+            - Positions are only emitted for detectors reporting
+            the acquisition timestamps of their frames.
+        - motor: ``MotorProtocol``
+            - The motor to move.
+            - It must provide the axes of movement used by the path.
+        - length: ``float``, optional
+            - The length of the path (or of each side of the square).
+            - Default is 100.0.
+        - length_egu: ``Literal["um", "mm", "nm"]``, optional
+            - The engineering unit of `length`.
+            - Default is "um".
+        - path: ``Literal["line", "square"]``, optional
+            - `line`: move along the first axis only.
+            - `square`: move along a square, going back to the start position.
+            - Default is "square".
+        - direction: ``Literal["xy", "yx"]``, optional
+            - The order of motor movement.
+            - `xy`: move along X axis first, then Y axis.
+            - `yx`: move along Y axis first, then X axis.
+            - Default is "xy".
+
+        Raises
+        ------
+        - ``TypeError``
+            - If `motor` does not provide the axes of movement used by the path.
+        """
+        axis = ("X", "Y") if direction == "xy" else ("Y", "X")
+        required = axis if path == "square" else axis[:1]
+        if not all(ax in motor.axis for ax in required):
+            raise TypeError(
+                f"The provided motor must have {list(required)} axes of movement."
+                f" Available axes: {motor.axis}"
+            )
+        _, length = convert_to_target_egu(length, from_egu=length_egu, to_egu=motor.egu)
+        legs = [(axis[0], length)]
+        if path == "square":
+            legs += [(axis[1], length), (axis[0], -length), (axis[1], -length)]
+
+        stream_name = "fly"
+        positions = [
+            PositionPseudoDevice(f"{det.name}_position", required, egu=motor.egu)
+            for det in detectors
+        ]
+
+        yield from bps.open_run()
+        yield from bps.stage_all(*detectors)
+
+        # stream until the movement is done
+        prepare_info = PrepareInfo(capacity=0, write_forever=True)
+        yield from bps.prepare(motor, prepare_info, wait=True)
+        for det in detectors:
+            yield from bps.prepare(det, prepare_info, wait=True)
+        yield from bps.declare_stream(*detectors, name=stream_name, collect=True)
+
+        yield from bps.kickoff_all(*detectors, wait=True)
+        times, knots = yield from fly_path(motor, legs)
+        yield from bps.complete_all(*detectors, wait=True)
+        yield from bps.collect(*detectors, name=stream_name)
+
+        for det, position in zip(detectors, positions):
+            if not isinstance(det, HasFrameTimestamps):
+                self.logger.warning(
+                    f"{det.name} does not report frame timestamps; "
+                    "frame positions are not available."
+                )
+                continue
+            position.load(det.frame_timestamps(), times, knots)
+            self.logger.debug(f"{det.name}: {len(position)} frames during flight.")
+            for _ in range(len(position)):
+                yield from bps.trigger_and_read(
+                    [position], name=f"{det.name}_positions"
+                )
+
+        yield from bps.unstage_all(*detectors)
+        yield from bps.close_run(exit_status="success")
+
     @continous(togglable=True)
     def live_stream(
         self,
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import partial
 from typing import TYPE_CHECKING
 
 from dependency_injector import providers
@@ -16,6 +17,7 @@ if TYPE_CHECKING:
 
     from bluesky.protocols import Descriptor, Reading
     from redsun.device import Device
+    from redsun.engine import Status
     from redsun.virtual import VirtualContainer
 
 
@@ -133,6 +135,10 @@ class LightPresenter(Presenter, Loggable):
     def set(self, name: str, intensity: int | float) -> None:
         """Set the intensity of the light.
 
+        Does not wait for the device: intensity requests arrive
+        for every change of the view slider, and devices coalesce
+        them on their side. Failures are logged when the device reports them.
+
         Parameters
         ----------
         name : ``str``
@@ -143,7 +149,9 @@ class LightPresenter(Presenter, Loggable):
         """
         light = self._lights[name]
         s = light.set(intensity)
-        try:
-            s.wait(self._timeout)
-        except Exception:
-            self.logger.exception(f"Timeout when setting {name} at {intensity}")
+        s.add_callback(partial(self._log_failure, name, intensity))
+
+    def _log_failure(self, name: str, intensity: float, status: Status) -> None:
+        exc = status.exception()
+        if exc is not None:
+            self.logger.error(f"Failed to set {name} at {intensity}: {exc}")
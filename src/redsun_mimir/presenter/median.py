@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from threading import Condition, Lock, Thread
+from typing import TYPE_CHECKING, Literal
 
 import numpy as np
 from event_model import DocumentRouter
@@ -10,6 +11,9 @@ from redsun.presenter import Presenter
 from redsun.utils.descriptors import parse_key
 from redsun.virtual import Signal
 
+from redsun_mimir.device.pseudo import RollingMedianReducer
+from redsun_mimir.utils.buffers import FramePool
+
 if TYPE_CHECKING:
     from collections.abc import Mapping
     from typing import Any
@@ -45,6 +49,18 @@ class MedianPresenter(Presenter, DocumentRouter, Loggable):
     hints: list[str] | None, keyword-only, optional
         List of data key suffixes to look for in event documents when applying
         the median correction. If `None`, no data will be processed.
+    dtype: Literal["float32", "float64"], keyword-only, optional
+        Floating point precision of the stored medians and of the
+        median-corrected images. Defaults to ``"float32"``.
+    mode: Literal["precomputed", "rolling"], keyword-only, optional
+        How the median applied to live frames is obtained.
+        ``"precomputed"`` uses the medians received from `median_streams`;
+        ``"rolling"`` maintains a per-pixel temporal median over the last
+        `window` live frames of each detector, i.e. for iSCAT-style
+        background removal. Defaults to ``"precomputed"``.
+    window: int, keyword-only, optional
+        Number of live frames in the rolling median window.
+        Only used when `mode` is ``"rolling"``. Defaults to 15.
 
     Attributes
     ----------
@@ -57,12 +73,26 @@ class MedianPresenter(Presenter, DocumentRouter, Loggable):
     -----
     The presenter expects both `*_streams` and `hints` to be configured.
     If either is missing, the presenter will be inactive.
+    In ``"rolling"`` mode, only `live_streams` and `hints` are required.
 
     When `hints` are provided, the presenter will look for data keys matching the pattern
     `{object_name}-{hint}` in the event documents, as well as `{object_name}_median-{hint}`
     when processing median streams. The `MedianPseudoDevice` is designed to produce
     the median data by building it directly inside a plan. It will create a
     data key with the `_median` suffix for each hint, e.g. `camera_median-buffer`.
+    Median keys are also accepted when they are read alongside the live frames.
+
+    The reciprocal of each stored median is cached, and the correction is
+    applied as an in-place multiplication into output frames taken from a
+    [`FramePool`][redsun_mimir.utils.buffers.FramePool]; an emitted frame is
+    reused only after the consumer has released it.
+
+    Live events are handed over to a background worker thread through a
+    single "latest-wins" slot: `event` returns immediately, and if the
+    worker is still busy when a new live event arrives, the pending one is
+    replaced. The correction and the `sigNewData` emission both happen on
+    the worker thread, so the plan cadence does not depend on them.
+    In ``"rolling"`` mode, replaced events are not added to the rolling window.
     """
 
     sigNewData = Signal(object)
@@ -75,8 +105,14 @@ class MedianPresenter(Presenter, DocumentRouter, Loggable):
         live_streams: list[str] | None = None,
         median_streams: list[str] | None = None,
         hints: list[str] | None = None,
+        dtype: Literal["float32", "float64"] = "float32",
+        mode: Literal["precomputed", "rolling"] = "precomputed",
+        window: int = 15,
     ) -> None:
         super().__init__(name, devices)
+        self.dtype = np.dtype(dtype)
+        self.mode = mode
+        self.window = window
         self.median_streams = frozenset(median_streams or [])
         self.live_streams = frozenset(live_streams or [])
 
@@ -88,15 +124,48 @@ class MedianPresenter(Presenter, DocumentRouter, Loggable):
             )
         self.hints = frozenset(hints or [])
         self.medians: dict[str, dict[str, npt.NDArray[Any]]] = {}
+        # reciprocal of each stored median, paired with the median it was computed from
+        self._reciprocals: dict[
+            str, dict[str, tuple[npt.NDArray[Any], npt.NDArray[Any]]]
+        ] = {}
+        # output frames, per object and hint
+        self._frames = FramePool()
+        # last received median value per data key
+        self._sources: dict[str, Any] = {}
+        # rolling median reducers, per object and hint
+        self._rolling: dict[tuple[str, str], RollingMedianReducer] = {}
         self.packet: dict[str, dict[str, npt.NDArray[Any]]] = {}
         self.uid_to_stream: dict[str, str] = {}
         self.previous_stream: str = ""
 
-        active = (
-            len(self.median_streams) > 0 and len(self.live_streams) > 0
-        ) and self.hints
+        # guards the stored medians, shared between
+        # the RunEngine thread and the worker thread
+        self._lock = Lock()
+        # latest-wins slot for live events
+        self._slot: Event | None = None
+        self._stopped = False
+        self._cond = Condition()
+        self._daemon = Thread(target=self._run_loop, daemon=True)
+        self._daemon.start()
 
-        if active:
+        if self.mode == "rolling":
+            self._active = len(self.live_streams) > 0 and len(self.hints) > 0
+        else:
+            self._active = (
+                len(self.median_streams) > 0
+                and len(self.live_streams) > 0
+                and len(self.hints) > 0
+            )
+
+        if self._active and self.mode == "rolling":
+            live_streams_msg = ", ".join(self.live_streams)
+            hints_msg = ", ".join(self.hints)
+            self.logger.info(
+                f"Initialized: rolling median over {self.window} frames, "
+                f"live streams '{live_streams_msg}', "
+                f"hints '{hints_msg}'"
+            )
+        elif self._active:
             scan_streams_msg = ", ".join(self.median_streams)
             live_streams_msg = ", ".join(self.live_streams)
             hints_msg = ", ".join(self.hints)
@@ -127,10 +196,15 @@ class MedianPresenter(Presenter, DocumentRouter, Loggable):
     def start(self, doc: RunStart) -> RunStart | None:
         """Process a new start document.
 
-        Clear the local cache.
+        Clear the local cache and drop any pending live event.
         """
-        self.medians.clear()
-        self.packet.clear()
+        with self._cond:
+            self._slot = None
+        with self._lock:
+            self.medians.clear()
+            self._reciprocals.clear()
+            self._sources.clear()
+            self._rolling.clear()
         self.previous_stream = ""
         return doc
 
@@ -164,25 +238,67 @@ class MedianPresenter(Presenter, DocumentRouter, Loggable):
         Returns
         -------
         doc : ``Event``
-            Processed event document with median calculated.
+            Unmodified event document; live events are
+            corrected asynchronously on the worker thread.
         """
-        if not (self.median_streams and self.live_streams and self.hints):
+        if not self._active:
             return doc
 
         stream_name = self.uid_to_stream[doc["descriptor"]]
-        if stream_name in self.median_streams:
-            if self.previous_stream != stream_name:
-                self.medians.clear()
-                self.previous_stream = stream_name
-            doc = self._store_precomputed(doc)
+        if stream_name in self.median_streams and self.mode == "precomputed":
+            with self._lock:
+                if self.previous_stream != stream_name:
+                    self.medians.clear()
+                    self._sources.clear()
+                    self.previous_stream = stream_name
+                doc = self._store_precomputed(doc)
         elif stream_name in self.live_streams:
-            doc = self._apply_median(doc)
+            with self._cond:
+                if self._slot is not None:
+                    self.logger.debug("Worker busy, dropping pending live event")
+                self._slot = doc
+                self._cond.notify()
         return doc
 
+    def shutdown(self) -> None:
+        """Shutdown the presenter.
+
+        Stop the worker thread and wait for it to exit.
+        """
+        with self._cond:
+            self._stopped = True
+            self._slot = None
+            self._cond.notify()
+        self._daemon.join()
+
+    def _run_loop(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._slot is not None or self._stopped)
+                if self._stopped:
+                    break
+                doc, self._slot = self._slot, None
+            if doc is None:
+                continue
+            try:
+                with self._lock:
+                    if self.mode == "rolling":
+                        self._apply_rolling_median(doc)
+                    else:
+                        self._apply_median(doc)
+            except Exception:
+                self.logger.exception("Failed to apply median correction")
+
     def _apply_median(self, doc: Event) -> Event:
+        # medians read alongside the live frames (i.e. from a MedianPseudoDevice
+        # included in the live stream) are picked up here; unchanged medians
+        # are recognized by identity and skipped
+        self._store_precomputed(doc)
         if len(self.medians) == 0:
             return doc
-        self.packet.clear()
+        # a new packet per event; the previous one may
+        # still be queued for delivery to the view
+        self.packet = {}
         for key, value in doc["data"].items():
             try:
                 obj_name, hint = parse_key(key)
@@ -192,14 +308,56 @@ class MedianPresenter(Presenter, DocumentRouter, Loggable):
                 continue
             if obj_name not in self.medians or hint not in self.medians[obj_name]:
                 continue
-            median_applied: npt.NDArray[Any] = value / self.medians[obj_name][hint]
+            reciprocal = self._reciprocal(obj_name, hint)
+            out = self._frames.get((obj_name, hint), reciprocal.shape, self.dtype)
+            np.multiply(value, reciprocal, out=out, casting="unsafe")
             suffixed = f"{obj_name}_median"
             self.packet.setdefault(suffixed, {})
-            self.packet[suffixed][hint] = median_applied
+            self.packet[suffixed][hint] = out
         if self.packet:
             self.sigNewData.emit(self.packet)
         return doc
 
+    def _apply_rolling_median(self, doc: Event) -> Event:
+        self.packet = {}
+        for key, value in doc["data"].items():
+            try:
+                obj_name, hint = parse_key(key)
+            except ValueError:
+                continue
+            if hint not in self.hints or obj_name.endswith("_median"):
+                continue
+            reducer = self._rolling.get((obj_name, hint))
+            if reducer is None:
+                reducer = RollingMedianReducer(self.window, dtype=self.dtype)
+                self._rolling[(obj_name, hint)] = reducer
+            reducer.push(value)
+            median = reducer.result()
+            out = self._frames.get((obj_name, hint), median.shape, self.dtype)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                np.divide(value, median, out=out, casting="unsafe")
+            suffixed = f"{obj_name}_median"
+            self.packet.setdefault(suffixed, {})
+            self.packet[suffixed][hint] = out
+        if self.packet:
+            self.sigNewData.emit(self.packet)
+        return doc
+
+    def _reciprocal(self, obj_name: str, hint: str) -> npt.NDArray[Any]:
+        """Return the cached reciprocal of the stored median.
+
+        The reciprocal is recomputed only if the stored median
+        has been replaced since the last call.
+        """
+        median = self.medians[obj_name][hint]
+        cached = self._reciprocals.get(obj_name, {}).get(hint)
+        if cached is not None and cached[0] is median:
+            return cached[1]
+        with np.errstate(divide="ignore"):
+            reciprocal: npt.NDArray[Any] = np.reciprocal(median, dtype=self.dtype)
+        self._reciprocals.setdefault(obj_name, {})[hint] = (median, reciprocal)
+        return reciprocal
+
     def _store_precomputed(self, doc: Event) -> Event:
         for key, value in doc["data"].items():
             try:
@@ -208,10 +366,20 @@ class MedianPresenter(Presenter, DocumentRouter, Loggable):
                 continue
             if hint not in self.hints:
                 continue
-            if not key.endswith("_median"):
+            if not obj_name.endswith("_median"):
                 continue
             # strip the _median suffix to match the obj_name used in _apply_median
             base_name = obj_name.removesuffix("_median")
+            previous = self._sources.get(key)
+            if previous is not None and previous is value:
+                continue
+            self._sources[key] = value
+            median = np.asarray(value, dtype=self.dtype)
+            if not median.any():
+                # a pseudo-device without valid readings
+                # returns an all-zero frame; nothing to apply
+                continue
             self.medians.setdefault(base_name, {})
-            self.medians[base_name][hint] = np.asarray(value)
+            self.medians[base_name][hint] = median
+            self._reciprocal(base_name, hint)
         return doc
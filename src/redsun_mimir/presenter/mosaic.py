@@ -0,0 +1,327 @@
+from __future__ import annotations
+
+from queue import Queue
+from threading import Thread
+from typing import TYPE_CHECKING
+
+import numpy as np
+from event_model import DocumentRouter
+from redsun.log import Loggable
+from redsun.presenter import Presenter
+from redsun.utils.descriptors import parse_key
+from redsun.virtual import Signal
+
+from redsun_mimir.utils.buffers import FramePool
+from redsun_mimir.utils.geometry import phase_correlation
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from typing import Any
+
+    import numpy.typing as npt
+    from event_model.documents import Event, EventDescriptor, RunStart
+    from redsun.device import Device
+    from redsun.virtual import VirtualContainer
+
+
+class MosaicPresenter(Presenter, DocumentRouter, Loggable):
+    """Presenter that stitches a downsampled preview of a tiled acquisition.
+
+    Implements [`DocumentRouter`][event_model.DocumentRouter] to receive
+    the tiles emitted by the
+    [`mosaic`][redsun_mimir.presenter.AcquisitionPresenter.mosaic] plan.
+    The grid geometry is read from the ``mosaic`` key of the start document;
+    each tile is downsampled and placed on a per-detector canvas at the
+    position read alongside it, and the canvas is forwarded to
+    [`ImageView`][redsun_mimir.view.ImageView].
+
+    Parameters
+    ----------
+    name :
+        Identity key of the presenter.
+    devices :
+        Mapping of device names to device instances. Unused by this presenter.
+    streams: list[str] | None, keyword-only, optional
+        List of stream names carrying the tiles.
+        If `None`, no data will be processed.
+    hints: list[str] | None, keyword-only, optional
+        List of data key suffixes of the tiles in event documents.
+        If `None`, no data will be processed.
+    downsample: int, keyword-only, optional
+        Downsampling factor of the preview along each image axis;
+        tiles are reduced by averaging blocks of pixels. Defaults to 4.
+    refine: bool, keyword-only, optional
+        Whether to refine the position of each tile by phase correlation
+        with the overlapping region of the already placed tiles.
+        Defaults to ``True``.
+    min_peak: float, keyword-only, optional
+        Minimum height of the correlation peak for a refined
+        position to be accepted. Defaults to 0.2.
+
+    Attributes
+    ----------
+    sigNewData: Signal[dict[str, dict[str, numpy.ndarray]]]
+        Emitted with the stitched preview after each tile.
+        Carries the object name corrected with the suffix "mosaic",
+        i.e. "camera_mosaic".
+
+    Notes
+    -----
+    Tiles are handed over to a background worker thread through a queue:
+    `event` returns immediately, and no tile is ever dropped.
+    The stitched canvas is copied into a pooled output frame before
+    emission; a frame is only reused once the consumer has dropped it.
+
+    A refined position is only accepted if the correlation peak exceeds
+    `min_peak` and the shift is smaller than half the overlap; otherwise
+    the tile is placed at its nominal stage position.
+    """
+
+    sigNewData = Signal(object)
+
+    def __init__(
+        self,
+        name: str,
+        devices: Mapping[str, Device],
+        /,
+        streams: list[str] | None = None,
+        hints: list[str] | None = None,
+        downsample: int = 4,
+        refine: bool = True,
+        min_peak: float = 0.2,
+    ) -> None:
+        super().__init__(name, devices)
+        self.streams = frozenset(streams or [])
+        self.hints = frozenset(hints or [])
+        self.downsample = max(int(downsample), 1)
+        self.refine = refine
+        self.min_peak = min_peak
+        self.uid_to_stream: dict[str, str] = {}
+
+        # geometry of the current run; None outside a mosaic run
+        self.geometry: dict[str, Any] | None = None
+        self.canvases: dict[str, npt.NDArray[np.float32]] = {}
+        # canvas offset of each placed tile, per object
+        self.offsets: dict[str, list[tuple[int, int]]] = {}
+        self._filled: dict[str, npt.NDArray[np.bool_]] = {}
+        self._frames = FramePool()
+
+        # documents are processed in order on the worker thread;
+        # None stops the worker
+        self._queue: Queue[tuple[str, Any] | None] = Queue()
+        self._daemon = Thread(target=self._run_loop, daemon=True)
+        self._daemon.start()
+
+        self._active = len(self.streams) > 0 and len(self.hints) > 0
+        if self._active:
+            streams_msg = ", ".join(self.streams)
+            hints_msg = ", ".join(self.hints)
+            self.logger.info(
+                f"Initialized: streams '{streams_msg}', hints '{hints_msg}'"
+            )
+        else:
+            self.logger.warning(
+                "Initialized: with no streams or hints declared; presenter will be inactive"
+            )
+
+    def register_providers(self, container: VirtualContainer) -> None:
+        """Register this presenter as a callback in the virtual container."""
+        container.register_signals(self)
+        container.register_callbacks(self)
+
+    def start(self, doc: RunStart) -> RunStart | None:
+        """Process a new start document.
+
+        Read the mosaic geometry, if any, and reset the canvases.
+        """
+        if self._active:
+            self._queue.put(("start", doc.get("mosaic")))
+        return doc
+
+    def descriptor(self, doc: EventDescriptor) -> EventDescriptor | None:
+        """Process new descriptor documents.
+
+        Store the stream name and its UID to identify
+        future incoming events.
+
+        Parameters
+        ----------
+        doc : ``EventDescriptor``
+            Descriptor document.
+
+        Returns
+        -------
+        doc : ``EventDescriptor | None``
+            Unmodified descriptor document.
+        """
+        self.uid_to_stream.setdefault(doc["uid"], doc["name"])
+        return doc
+
+    def event(self, doc: Event) -> Event:
+        """Process new event documents.
+
+        Parameters
+        ----------
+        doc : ``Event``
+            Event document.
+
+        Returns
+        -------
+        doc : ``Event``
+            Unmodified event document; tiles are
+            placed asynchronously on the worker thread.
+        """
+        if not self._active:
+            return doc
+        if self.uid_to_stream.get(doc["descriptor"]) in self.streams:
+            self._queue.put(("event", doc))
+        return doc
+
+    def shutdown(self) -> None:
+        """Shutdown the presenter.
+
+        Stop the worker thread, after the queued tiles are placed.
+        """
+        self._queue.put(None)
+        self._daemon.join()
+
+    def _run_loop(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    break
+                kind, payload = item
+                if kind == "start":
+                    self._reset(payload)
+                else:
+                    self._place(payload)
+            except Exception:
+                self.logger.exception("Failed to place tile")
+            finally:
+                self._queue.task_done()
+
+    def _reset(self, geometry: dict[str, Any] | None) -> None:
+        self.geometry = geometry
+        self.canvases.clear()
+        self._filled.clear()
+        self.offsets.clear()
+        self._frames.clear()
+
+    def _tile_size(self) -> tuple[int, int]:
+        assert self.geometry is not None
+        shape = self.geometry["tile_shape"]
+        return shape[0] // self.downsample, shape[1] // self.downsample
+
+    def _canvas(self, obj_name: str) -> npt.NDArray[np.float32]:
+        """Return the canvas of an object, allocating it on the first tile."""
+        canvas = self.canvases.get(obj_name)
+        if canvas is None:
+            assert self.geometry is not None
+            tx, ty = self._tile_size()
+            scale = self.geometry["pixel_size"] * self.downsample
+            step_x, step_y = (step / scale for step in self.geometry["step"])
+            shape = (
+                int(np.ceil(step_x * (self.geometry["cols"] - 1))) + tx,
+                int(np.ceil(step_y * (self.geometry["rows"] - 1))) + ty,
+            )
+            canvas = np.zeros(shape, dtype=np.float32)
+            self.canvases[obj_name] = canvas
+            self._filled[obj_name] = np.zeros(shape, dtype=bool)
+            self.offsets[obj_name] = []
+        return canvas
+
+    def _reduce(self, frame: npt.NDArray[Any]) -> npt.NDArray[np.float32]:
+        """Downsample a frame by averaging blocks of pixels."""
+        ds = self.downsample
+        tx, ty = frame.shape[0] // ds, frame.shape[1] // ds
+        blocks = np.asarray(frame[: tx * ds, : ty * ds], dtype=np.float32)
+        reduced: npt.NDArray[np.float32] = blocks.reshape(tx, ds, ty, ds).mean(
+            axis=(1, 3)
+        )
+        return reduced
+
+    def _place(self, doc: Event) -> None:
+        if self.geometry is None:
+            return
+        data = doc["data"]
+        origin = self.geometry["origin"]
+        scale = self.geometry["pixel_size"] * self.downsample
+        nominal = tuple(
+            round((data[key] - start) / scale)
+            for key, start in zip(self.geometry["position_keys"], origin)
+        )
+        packet: dict[str, dict[str, npt.NDArray[Any]]] = {}
+        for key, value in data.items():
+            try:
+                obj_name, hint = parse_key(key)
+            except ValueError:
+                continue
+            if hint not in self.hints:
+                continue
+            tile = self._reduce(np.asarray(value))
+            canvas = self._canvas(obj_name)
+            offset = (int(nominal[0]), int(nominal[1]))
+            if self.refine:
+                offset = self._refine(obj_name, tile, offset)
+            self._paste(obj_name, tile, offset)
+            self.offsets[obj_name].append(offset)
+            out = self._frames.get((obj_name, hint), canvas.shape, canvas.dtype)
+            np.copyto(out, canvas)
+            packet[f"{obj_name}_mosaic"] = {hint: out}
+        if packet:
+            self.sigNewData.emit(packet)
+
+    def _region(
+        self, obj_name: str, shape: tuple[int, ...], offset: tuple[int, int]
+    ) -> tuple[tuple[slice, slice], tuple[slice, slice]]:
+        """Return the overlapping slices of the canvas and of a tile placed at ``offset``."""
+        canvas = self.canvases[obj_name]
+        canvas_slices: list[slice] = []
+        tile_slices: list[slice] = []
+        for start, size, bound in zip(offset, shape, canvas.shape):
+            lo, hi = max(start, 0), min(start + size, bound)
+            hi = max(hi, lo)
+            canvas_slices.append(slice(lo, hi))
+            tile_slices.append(slice(lo - start, hi - start))
+        return (canvas_slices[0], canvas_slices[1]), (tile_slices[0], tile_slices[1])
+
+    def _paste(
+        self, obj_name: str, tile: npt.NDArray[np.float32], offset: tuple[int, int]
+    ) -> None:
+        canvas_region, tile_region = self._region(obj_name, tile.shape, offset)
+        self.canvases[obj_name][canvas_region] = tile[tile_region]
+        self._filled[obj_name][canvas_region] = True
+
+    def _refine(
+        self, obj_name: str, tile: npt.NDArray[np.float32], offset: tuple[int, int]
+    ) -> tuple[int, int]:
+        """Refine the offset of a tile against the already placed tiles.
+
+        The correlation is restricted to the bounding box of the overlap;
+        the nominal offset is returned if the overlap is too small,
+        or if the match is not reliable.
+        """
+        canvas_region, tile_region = self._region(obj_name, tile.shape, offset)
+        filled = self._filled[obj_name][canvas_region]
+        rows = np.flatnonzero(filled.any(axis=1))
+        cols = np.flatnonzero(filled.any(axis=0))
+        if rows.size < 8 or cols.size < 8:
+            return offset
+        box = (
+            slice(int(rows[0]), int(rows[-1]) + 1),
+            slice(int(cols[0]), int(cols[-1]) + 1),
+        )
+        mask = filled[box]
+        reference = self.canvases[obj_name][canvas_region][box]
+        moving = tile[tile_region][box]
+        reference = np.where(mask, reference, reference[mask].mean())
+        moving = np.where(mask, moving, moving[mask].mean())
+        (dx, dy), peak = phase_correlation(reference, moving)
+        if peak < self.min_peak or 2 * abs(dx) >= mask.shape[0]:
+            return offset
+        if 2 * abs(dy) >= mask.shape[1]:
+            return offset
+        # the tile content is displaced by (dx, dy) from where
+        # the stage position puts it; move the tile back by the same amount
+        return offset[0] - dx, offset[1] - dy
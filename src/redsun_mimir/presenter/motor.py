@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Awaitable
 from queue import SimpleQueue
 from threading import Thread
 from typing import TYPE_CHECKING
@@ -27,7 +28,8 @@ class MotorPresenter(Presenter, Loggable):
     Allows manual stage positioning by forwarding movement requests from
     [`MotorView`][redsun_mimir.view.MotorView] to the underlying motor
     devices via a background thread. Emits position updates back to the
-    view once each move completes.
+    view once each move completes, with the readback position
+    reported by the device.
 
     Parameters
     ----------
@@ -42,7 +44,8 @@ class MotorPresenter(Presenter, Loggable):
     ----------
     sigNewPosition :
         Emitted from the background move thread when a move completes.
-        Carries motor name (`str`), axis (`str`), and new position (`float`).
+        Carries motor name (`str`), axis (`str`), and new position (`float`),
+        as read back from the device; it may differ from the requested one.
 
         !!! warning
             This signal is emitted from a background thread. Connect with
@@ -227,7 +230,9 @@ class MotorPresenter(Presenter, Loggable):
         """Move a motor to a given position.
 
         Wait on the status object to complete in a background thread.
-        When the movement is completed, emit the ``sigNewPosition`` signal.
+        When the movement is completed, emit the ``sigNewPosition`` signal
+        with the readback of the motor; devices report it from
+        their cached state, so this does not block on the hardware.
 
         Parameters
         ----------
@@ -259,7 +264,14 @@ class MotorPresenter(Presenter, Loggable):
         except Exception as e:
             self.logger.exception(f"Failed to move {motor.name} to {position}: {e}")
         else:
-            self.sigNewPosition.emit(motor.name, axis, position)
+            location = motor.locate()
+            # asynchronous devices are not awaited here;
+            # report the requested position for them
+            if isinstance(location, Awaitable):
+                readback = position
+            else:
+                readback = location["readback"]
+            self.sigNewPosition.emit(motor.name, axis, readback)
 
     def _update_axis(self, motor: MotorProtocol, axis: str) -> bool:
         """Update the active axis of a motor.
@@ -18,9 +18,13 @@ from redsun.device.protocols import HasCache
 from redsun.storage.protocols import HasWriter
 
 if TYPE_CHECKING:
-    from bluesky.protocols import Descriptor, Reading
+    from collections.abc import Mapping, Sequence
+
+    from bluesky.protocols import Descriptor, Location, Reading
     from redsun.engine import Status
 
+    from redsun_mimir.utils.trajectory import Trajectory
+
 
 @runtime_checkable
 class Settable(Movable[Any], Protocol):
@@ -94,11 +98,109 @@ class MotorProtocol(PDevice, Settable, Locatable[Any], Protocol):
 
     egu : ``str``
         Engineering units for the motor position.
+
+    step_sizes : ``dict[str, float]``
+        Step sizes for each axis, in engineering units.
+
+    settle_time : ``float``
+        Time in seconds to wait after a movement
+        is completed before the stage can be considered stable.
     """
 
     axis: list[str]
     egu: str
     step_sizes: dict[str, float]
+    settle_time: float
+
+
+@runtime_checkable
+class MultiAxisMotor(MotorProtocol, Protocol):
+    """Protocol for motors that can move several axes with one command.
+
+    ``set`` also accepts a mapping of axis names to absolute targets;
+    all the axes in the mapping are moved together, regardless
+    of the active axis, and the returned status is finished when
+    every axis has reached its target:
+
+    .. code-block:: python
+
+        status = motor.set({"X": 100.0, "Y": 50.0})
+    """
+
+    def locate_axes(self) -> dict[str, Location[float]]:
+        """Return the location of every axis, without changing the active axis.
+
+        Returns
+        -------
+        ``dict[str, Location[float]]``
+            The setpoint and readback of each axis, by axis name.
+        """
+        ...
+
+
+@runtime_checkable
+class TrajectoryMotor(MotorProtocol, Protocol):
+    """Protocol for motors that can stream a trajectory of moves.
+
+    The whole trajectory is handed to the motor at once; each move
+    is sent to the controller as soon as the previous one is done,
+    so that a scan does not pay a host round trip for every step.
+    """
+
+    def upload_trajectory(
+        self,
+        moves: Sequence[Mapping[str, float]],
+        *,
+        dwell: float = 0.0,
+        window: int = 1,
+    ) -> Trajectory:
+        """Start moving along a trajectory of relative moves.
+
+        Parameters
+        ----------
+        moves : ``Sequence[Mapping[str, float]]``
+            The displacement of each move, by axis name,
+            in the motor engineering units.
+        dwell : ``float``, optional
+            Time in seconds to hold each point before the next move.
+            Default is 0.0.
+        window : ``int``, optional
+            Maximum number of moves sent ahead to the controller.
+            Default is 1.
+
+        Returns
+        -------
+        ``Trajectory``
+            Handle reporting the completion of each point.
+        """
+        ...
+
+
+@runtime_checkable
+class SequenceableMotor(MotorProtocol, Flyable, Protocol):
+    """Protocol for motors that can step through positions in hardware.
+
+    A sequence of absolute positions for the active axis is loaded
+    with ``set(positions, prop="sequence")``; ``kickoff()`` starts
+    the sequence, so that the motor advances to the next position on
+    every hardware trigger (i.e. the exposure output of a camera),
+    and ``complete()`` stops it.
+    """
+
+    def sequence_max_length(self, axis: str) -> int:
+        """Return the maximum length of a position sequence for ``axis``.
+
+        Parameters
+        ----------
+        axis : ``str``
+            The axis to sequence.
+
+        Returns
+        -------
+        ``int``
+            Maximum number of positions; 0 if the axis cannot be sequenced.
+        """
+        ...
 
 
 @runtime_checkable
@@ -215,6 +317,26 @@ class ReadableFlyer(
     sensor_shape: tuple[int, int]
 
 
+@runtime_checkable
+class HasFrameTimestamps(Protocol):
+    """Protocol for flyers reporting when each streamed frame was acquired.
+
+    Used by fly scans to match the frames acquired
+    during a continuous movement with the stage position.
+    """
+
+    def frame_timestamps(self) -> Sequence[float]:
+        """Return the acquisition timestamps of the frames of the last flight.
+
+        Returns
+        -------
+        ``Sequence[float]``
+            One UNIX timestamp for each frame written
+            since the last ``prepare()``, in acquisition order.
+        """
+        ...
+
+
 @runtime_checkable
 class PseudoCacheFlyer(
     Readable[Any],
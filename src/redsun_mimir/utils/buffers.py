@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+    from typing import Any
+
+    import numpy.typing as npt
+
+
+class FramePool:
+    """Pool of reusable output frames for presenters emitting images.
+
+    A frame is handed out again only once nothing outside the pool
+    references it, i.e. after the consumer of the emitted data has dropped
+    it; a frame that is still queued for delivery or displayed is never
+    overwritten. The pool grows as needed, up to ``max_frames`` frames per
+    key; beyond that, new frames are allocated outside the pool.
+
+    Parameters
+    ----------
+    max_frames : ``int``, optional
+        Maximum number of pooled frames per key. Default is 4.
+    """
+
+    def __init__(self, max_frames: int = 4) -> None:
+        self.max_frames = max_frames
+        self._frames: dict[Hashable, list[npt.NDArray[Any]]] = {}
+        # references held by the pool itself while checking a frame,
+        # measured once as they depend on the interpreter
+        probe = [np.empty(0)]
+        for frame in probe:
+            self._own_refs = sys.getrefcount(frame)
+
+    def get(
+        self, key: Hashable, shape: tuple[int, ...], dtype: npt.DTypeLike
+    ) -> npt.NDArray[Any]:
+        """Return a frame that is not referenced outside the pool.
+
+        Parameters
+        ----------
+        key : ``Hashable``
+            Identifier of the output stream, i.e. ``(obj_name, hint)``.
+        shape : ``tuple[int, ...]``
+            Shape of the frame.
+        dtype : ``npt.DTypeLike``
+            Data type of the frame.
+
+        Returns
+        -------
+        ``npt.NDArray[Any]``
+            An uninitialized frame.
+        """
+        dtype = np.dtype(dtype)
+        frames = self._frames.get(key)
+        if frames is None or frames[0].shape != shape or frames[0].dtype != dtype:
+            frames = []
+            self._frames[key] = frames
+        for frame in frames:
+            if sys.getrefcount(frame) <= self._own_refs:
+                return frame
+        frame = np.empty(shape, dtype=dtype)
+        if len(frames) < self.max_frames:
+            frames.append(frame)
+        return frame
+
+    def clear(self) -> None:
+        """Release all pooled frames."""
+        self._frames.clear()
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import numpy.typing as npt
+
+
+def _distances(points: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+    """Return the matrix of euclidean distances between ``points``."""
+    deltas = points[:, np.newaxis, :] - points[np.newaxis, :, :]
+    dist: npt.NDArray[np.float64] = np.sqrt(np.einsum("ijk,ijk->ij", deltas, deltas))
+    return dist
+
+
+def _nearest_neighbour(dist: npt.NDArray[np.float64]) -> npt.NDArray[np.intp]:
+    """Build an open route starting from node 0, always visiting the closest node."""
+    n = dist.shape[0]
+    route = np.empty(n, dtype=np.intp)
+    route[0] = 0
+    visited = np.zeros(n, dtype=bool)
+    visited[0] = True
+    for k in range(1, n):
+        candidates = np.where(visited, np.inf, dist[route[k - 1]])
+        route[k] = int(np.argmin(candidates))
+        visited[route[k]] = True
+    return route
+
+
+def _two_opt(
+    route: npt.NDArray[np.intp], dist: npt.NDArray[np.float64], max_passes: int
+) -> npt.NDArray[np.intp]:
+    """Improve an open route by reversing segments, keeping the first node fixed."""
+    n = route.size
+    for _ in range(max_passes):
+        improved = False
+        for i in range(1, n - 1):
+            a, b = route[i - 1], route[i]
+            # reversing route[i : j + 1] replaces the edges (a, b) and
+            # (c, d) with (a, c) and (b, d); the last node has no outgoing edge
+            c = route[i + 1 :]
+            d = route[i + 2 :]
+            gain = dist[a, c] - dist[a, b]
+            gain[:-1] += dist[b, d] - dist[c[:-1], d]
+            j = int(np.argmin(gain))
+            if gain[j] < -1e-9:
+                route[i : i + j + 2] = route[i : i + j + 2][::-1]
+                improved = True
+        if not improved:
+            break
+    return route
+
+
+def order_positions(
+    positions: Sequence[Sequence[float]],
+    start: Sequence[float] | None = None,
+    *,
+    max_passes: int = 50,
+) -> list[int]:
+    """Order positions to reduce the total travel of the stage visiting them.
+
+    The visiting order is built with a nearest-neighbour heuristic,
+    then refined with 2-opt moves until no reversal of a sub-path
+    shortens the route (or ``max_passes`` passes are done).
+    The route is open: the stage does not go back to the start.
+
+    Parameters
+    ----------
+    positions : ``Sequence[Sequence[float]]``
+        The positions to visit, all with the same number of coordinates.
+    start : ``Sequence[float] | None``, optional
+        The current position of the stage. If ``None`` (default),
+        the route starts from the first of ``positions``.
+    max_passes : ``int``, optional
+        Maximum number of 2-opt passes over the route. Default is 50.
+
+    Returns
+    -------
+    ``list[int]``
+        The indices of ``positions``, in visiting order.
+    """
+    n = len(positions)
+    if n <= 1:
+        return list(range(n))
+    points = np.asarray(positions, dtype=np.float64).reshape(n, -1)
+    if start is not None:
+        origin = np.asarray(start, dtype=np.float64).reshape(1, -1)
+        points = np.concatenate([origin, points])
+    dist = _distances(points)
+    route = _two_opt(_nearest_neighbour(dist), dist, max_passes)
+    if start is not None:
+        return [int(node) - 1 for node in route[1:]]
+    return [int(node) for node in route]
+
+
+def path_length(
+    positions: Sequence[Sequence[float]],
+    order: Sequence[int] | None = None,
+    start: Sequence[float] | None = None,
+) -> float:
+    """Compute the total travel to visit ``positions`` in the given order.
+
+    Parameters
+    ----------
+    positions : ``Sequence[Sequence[float]]``
+        The positions to visit.
+    order : ``Sequence[int] | None``, optional
+        The visiting order; if ``None`` (default), the positions are visited as given.
+    start : ``Sequence[float] | None``, optional
+        The position the stage starts from; if ``None`` (default),
+        the travel is measured from the first visited position.
+
+    Returns
+    -------
+    ``float``
+        The total euclidean distance travelled.
+    """
+    if len(positions) == 0:
+        return 0.0
+    points = np.asarray(positions, dtype=np.float64).reshape(len(positions), -1)
+    if order is not None:
+        points = points[np.asarray(order, dtype=np.intp)]
+    if start is not None:
+        origin = np.asarray(start, dtype=np.float64).reshape(1, -1)
+        points = np.concatenate([origin, points])
+    return float(np.linalg.norm(np.diff(points, axis=0), axis=1).sum())
+
+
+def snake_grid(rows: int, cols: int) -> list[tuple[int, int]]:
+    """Return the cells of a grid in serpentine (boustrophedon) order.
+
+    Even rows are visited from the first to the last column,
+    odd rows in reverse, so that consecutive cells are always adjacent.
+
+    Parameters
+    ----------
+    rows : ``int``
+        Number of rows of the grid.
+    cols : ``int``
+        Number of columns of the grid.
+
+    Returns
+    -------
+    ``list[tuple[int, int]]``
+        The ``(row, column)`` indices of the cells, in visiting order.
+    """
+    cells: list[tuple[int, int]] = []
+    for row in range(rows):
+        columns = range(cols) if row % 2 == 0 else range(cols - 1, -1, -1)
+        cells.extend((row, col) for col in columns)
+    return cells
+
+
+def phase_correlation(
+    reference: npt.NDArray[Any], moving: npt.NDArray[Any]
+) -> tuple[tuple[int, int], float]:
+    """Estimate the translation between two images of the same shape.
+
+    The images are windowed to reduce edge effects, and the translation
+    is the peak of the inverse transform of their normalized cross-power spectrum.
+
+    Parameters
+    ----------
+    reference : ``numpy.ndarray``
+        The reference image.
+    moving : ``numpy.ndarray``
+        The translated image.
+
+    Returns
+    -------
+    ``tuple[tuple[int, int], float]``
+        The integer shift ``(rows, columns)`` such that ``moving`` is
+        ``reference`` rolled by the shift, and the height of the
+        correlation peak (1.0 for a perfect match, near 0 for no match).
+    """
+    shape = reference.shape
+    window = np.outer(np.hanning(shape[0]), np.hanning(shape[1])).astype(np.float32)
+    ref = (reference - reference.mean()) * window
+    mov = (moving - moving.mean()) * window
+    cross = np.fft.rfft2(mov) * np.conj(np.fft.rfft2(ref))
+    cross /= np.abs(cross) + np.finfo(np.float32).eps
+    correlation = np.fft.irfft2(cross, s=shape)
+    peak = np.unravel_index(int(np.argmax(correlation)), shape)
+    shift = tuple(int(p) - n if p > n // 2 else int(p) for p, n in zip(peak, shape))
+    return (shift[0], shift[1]), float(correlation[peak])
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Future
+from functools import partial
+from typing import TYPE_CHECKING
+
+from redsun.engine import Status
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+
+class Trajectory:
+    """A sequence of moves streamed to a motor controller.
+
+    Each point of the trajectory is sent by calling ``submit`` with its
+    index; the next point is sent from the completion callback of the
+    previous one, without going through the caller, so that no host
+    round trip is paid between consecutive moves. Up to ``window``
+    points are in flight at the same time, for controllers that queue
+    the commands they receive.
+
+    Completion of each point is reported through `point`, through the
+    callbacks registered with `add_callback`, or by iterating over the
+    trajectory; `done` is finished when the last point is reached.
+
+    Parameters
+    ----------
+    size: ``int``
+        Number of points of the trajectory.
+    submit: ``Callable[[int], Status]``
+        Sends the given point to the controller; the returned
+        status is finished when the point is reached.
+    dwell: ``float``, optional
+        Time in seconds to hold each point before sending the next.
+        Default is 0.0.
+    window: ``int``, optional
+        Maximum number of points in flight. Default is 1, for controllers
+        where a new command replaces the running one.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        submit: Callable[[int], Status],
+        *,
+        dwell: float = 0.0,
+        window: int = 1,
+    ) -> None:
+        self.dwell = dwell
+        self.window = max(int(window), 1)
+        self.done = Status()
+        self._size = size
+        self._submit = submit
+        self._points: list[Future[float]] = [Future() for _ in range(size)]
+        self._callbacks: list[Callable[[int], None]] = []
+        # held while a point is submitted, so that `sent`
+        # only counts points already handed to the controller
+        self._lock = threading.Lock()
+        self._next = 0
+        self._reached = 0
+        self._cancelled = False
+
+    def __len__(self) -> int:
+        """Return the number of points of the trajectory."""
+        return self._size
+
+    def __iter__(self) -> Iterator[int]:
+        """Yield the index of each point, in order, as soon as it is reached.
+
+        Raises the exception of the first point that fails.
+        """
+        for index, point in enumerate(self._points):
+            point.result()
+            yield index
+
+    @property
+    def sent(self) -> int:
+        """Number of points sent to the controller so far."""
+        with self._lock:
+            return self._next
+
+    def point(self, index: int) -> Future[float]:
+        """Return the future of a point.
+
+        The future result is the time at which the point was reached
+        (from `time.monotonic`); its exception is set if the point
+        fails, or if the trajectory is cancelled before reaching it.
+        """
+        return self._points[index]
+
+    def add_callback(self, callback: Callable[[int], None]) -> None:
+        """Register a callback, called with the index of each reached point.
+
+        Callbacks run on the thread completing the point, and must not block.
+        """
+        with self._lock:
+            self._callbacks.append(callback)
+
+    def start(self) -> Trajectory:
+        """Send the first points; return the trajectory itself."""
+        if self._size == 0:
+            self.done.set_finished()
+            return self
+        for _ in range(min(self.window, self._size)):
+            self._send_next()
+        return self
+
+    def cancel(self) -> None:
+        """Stop sending new points.
+
+        The points already sent are still completed;
+        the others fail with `RuntimeError`.
+        """
+        self._abort(RuntimeError("Trajectory cancelled."))
+
+    def _abort(self, error: BaseException) -> None:
+        with self._lock:
+            if self._cancelled:
+                return
+            self._cancelled = True
+            pending = self._points[self._next :]
+        for point in pending:
+            point.set_exception(error)
+        if not self.done.done:
+            self.done.set_exception(error)
+
+    def _send_next(self) -> None:
+        with self._lock:
+            if self._cancelled or self._next >= self._size:
+                return
+            index = self._next
+            status = self._submit(index)
+            self._next += 1
+        status.add_callback(partial(self._reached_point, index))
+
+    def _reached_point(self, index: int, status: Status) -> None:
+        exc = status.exception()
+        if exc is not None:
+            # the points not sent yet fail with the same error
+            self._points[index].set_exception(exc)
+            self._abort(exc)
+            return
+        self._points[index].set_result(time.monotonic())
+        with self._lock:
+            self._reached += 1
+            finished = self._reached == self._size
+            callbacks = list(self._callbacks)
+        for callback in callbacks:
+            callback(index)
+        if finished:
+            self.done.set_finished()
+            return
+        # the status callbacks run on their own thread,
+        # so the dwell time does not block anything else
+        if self.dwell > 0:
+            time.sleep(self.dwell)
+        self._send_next()
@@ -12,7 +12,7 @@ from qtpy.QtWidgets import QApplication
 from redsun.virtual import VirtualContainer
 
 from redsun_mimir.device._mocks import MockLightDevice
-from redsun_mimir.device.mmcore import MMCoreStageDevice
+from redsun_mimir.device.mmcore import MMCoreCameraDevice, MMCoreStageDevice
 
 if TYPE_CHECKING:
     from collections.abc import Generator, Iterator
@@ -47,6 +47,27 @@ def xy_mock_motor(name: str = "xystage") -> Iterator[MMCoreStageDevice]:
         core.unloadDevice(name)
 
 
+@pytest.fixture(scope="function")
+def z_mock_motor(name: str = "zstage") -> Iterator[MMCoreStageDevice]:
+    """Sequenceable Z mock motor device."""
+    core = Core.instance()
+    yield MMCoreStageDevice(
+        name,
+        config="demoz",
+    )
+    if name in core.getLoadedDevices():
+        core.unloadDevice(name)
+
+
+@pytest.fixture(scope="session")
+def mmcore_camera() -> MMCoreCameraDevice:
+    """Demo camera device.
+
+    Session-scoped, since the camera can only be initialized once.
+    """
+    return MMCoreCameraDevice("camera", config="demo")
+
+
 @pytest.fixture
 def mock_led() -> MockLightDevice:
     """Binary mock LED device."""
@@ -2,11 +2,58 @@
 
 from __future__ import annotations
 
+import json
+import sys
+import threading
+import time
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
 import pytest
+from redsun.engine import Status
 
 from redsun_mimir.device._mocks import MockLightDevice
 from redsun_mimir.device.mmcore import MMCoreStageDevice
-from redsun_mimir.protocols import LightProtocol, MotorProtocol
+from redsun_mimir.device.pseudo import (
+    MeanReducer,
+    MedianCache,
+    MedianPseudoDevice,
+    MedianReducer,
+    PositionPseudoDevice,
+    RollingMedianReducer,
+    TilePseudoDevice,
+    TrimmedMeanReducer,
+    make_reducer,
+)
+from redsun_mimir.device.youseetoo import (
+    MimirLaserDevice,
+    MimirMotorDevice,
+    MimirSerialDevice,
+)
+from redsun_mimir.device.youseetoo._actions import (
+    Acknowledge,
+    LaserAction,
+    MotorAction,
+    MotorResponse,
+    PositionResponse,
+    decode_response,
+)
+from redsun_mimir.device.youseetoo._engine import SerialEngine
+from redsun_mimir.device.youseetoo._framing import JSONFramer
+from redsun_mimir.device.youseetoo._simulator import UC2Simulator, travel_time
+from redsun_mimir.device.youseetoo._stats import LatencyHistogram
+from redsun_mimir.protocols import (
+    LightProtocol,
+    MotorProtocol,
+    MultiAxisMotor,
+    SequenceableMotor,
+    TrajectoryMotor,
+)
+from redsun_mimir.utils.trajectory import Trajectory
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 
 class TestMMCoreStageDevice:
@@ -36,7 +83,45 @@ class TestMMCoreStageDevice:
         assert status.success
         loc = xy_mock_motor.locate()
         assert loc["setpoint"] == pytest.approx(5.0)
-        assert loc["readback"] == pytest.approx(5.0)
+        # the readback is the real position, quantized to the motor steps
+        assert loc["readback"] == pytest.approx(5.0, abs=0.015)
+
+    def test_set_position_is_absolute(self, xy_mock_motor: MMCoreStageDevice) -> None:
+        """Repeated set() calls move to the same position; other axes are kept."""
+        xy_mock_motor.set("Y", prop="axis").wait(timeout=1.0)
+        xy_mock_motor.set(3.0).wait(timeout=1.0)
+        xy_mock_motor.set("X", prop="axis").wait(timeout=1.0)
+        xy_mock_motor.set(5.0).wait(timeout=1.0)
+        xy_mock_motor.set(5.0).wait(timeout=1.0)
+        assert xy_mock_motor.locate()["readback"] == pytest.approx(5.0, abs=0.015)
+        xy_mock_motor.set("Y", prop="axis").wait(timeout=1.0)
+        assert xy_mock_motor.locate()["readback"] == pytest.approx(3.0, abs=0.015)
+
+    def test_set_multi_axis(self, xy_mock_motor: MMCoreStageDevice) -> None:
+        """A mapping of targets moves both axes, keeping the active axis."""
+        assert isinstance(xy_mock_motor, MultiAxisMotor)
+        xy_mock_motor.set({"X": 2.0, "Y": 4.0}).wait(timeout=1.0)
+        locations = xy_mock_motor.locate_axes()
+        assert locations["X"]["readback"] == pytest.approx(2.0, abs=0.015)
+        assert locations["Y"]["readback"] == pytest.approx(4.0, abs=0.015)
+        assert xy_mock_motor.locate() == xy_mock_motor._positions["X"]
+        with pytest.raises(ValueError):
+            xy_mock_motor.set({"Z": 1.0}).wait(timeout=1.0)
+
+    def test_concurrent_moves(self, xy_mock_motor: MMCoreStageDevice) -> None:
+        """Moves issued without waiting are completed in order."""
+        xy_mock_motor.set("X", prop="axis").wait(timeout=1.0)
+        first = xy_mock_motor.set(1.0)
+        xy_mock_motor.set("Y", prop="axis").wait(timeout=1.0)
+        second = xy_mock_motor.set(2.0)
+        second.wait(timeout=2.0)
+        assert first.done
+        assert xy_mock_motor._positions["X"]["readback"] == pytest.approx(
+            1.0, abs=0.015
+        )
+        assert xy_mock_motor._positions["Y"]["readback"] == pytest.approx(
+            2.0, abs=0.015
+        )
 
     def test_set_invalid_value_fails(self, xy_mock_motor: MMCoreStageDevice) -> None:
         """set() with a non-numeric value marks status as failed."""
@@ -90,6 +175,34 @@ class TestMMCoreStageDevice:
         for ax in ["X", "Y"]:
             assert f"xystage-{ax}_step_size" in desc
 
+    def test_sequence_max_length(
+        self, xy_mock_motor: MMCoreStageDevice, z_mock_motor: MMCoreStageDevice
+    ) -> None:
+        """Only stages reporting hardware sequencing accept position sequences."""
+        assert isinstance(z_mock_motor, SequenceableMotor)
+        assert z_mock_motor.sequence_max_length("Z") > 0
+        assert z_mock_motor.sequence_max_length("X") == 0
+        assert xy_mock_motor.sequence_max_length("X") == 0
+        status = xy_mock_motor.set([0.0, 1.0], prop="sequence")
+        with pytest.raises(RuntimeError):
+            status.wait(timeout=1.0)
+
+    def test_run_sequence(self, z_mock_motor: MMCoreStageDevice) -> None:
+        """A loaded sequence is started by kickoff() and stopped by complete()."""
+        with pytest.raises(RuntimeError):
+            z_mock_motor.kickoff().wait(timeout=1.0)
+        z_mock_motor.set([0.0, 1.0, 2.0], prop="sequence").wait(timeout=1.0)
+        z_mock_motor.kickoff().wait(timeout=1.0)
+        z_mock_motor.complete().wait(timeout=1.0)
+        assert z_mock_motor.locate()["setpoint"] == pytest.approx(2.0)
+
+    def test_sequence_too_long_fails(self, z_mock_motor: MMCoreStageDevice) -> None:
+        """Sequences longer than the hardware limit are rejected."""
+        length = z_mock_motor.sequence_max_length("Z") + 1
+        status = z_mock_motor.set([0.0] * length, prop="sequence")
+        with pytest.raises(ValueError):
+            status.wait(timeout=1.0)
+
 
 class TestMockLightDevice:
     """Tests for MockLightDevice."""
@@ -187,3 +300,867 @@ class TestMockLightDevice:
         assert "led-egu" in desc
         assert "led-intensity_range" in desc
         assert "led-step_size" in desc
+
+
+class TestReducers:
+    """Tests for the pseudo-device frame reducers."""
+
+    @pytest.fixture
+    def frames(self) -> list[np.ndarray]:
+        rng = np.random.default_rng(0)
+        return [rng.integers(0, 1000, (8, 6), dtype=np.uint16) for _ in range(9)]
+
+    @pytest.mark.parametrize(
+        "kind, expected",
+        [
+            ("median", lambda s: np.median(s, axis=0)),
+            ("mean", lambda s: s.mean(axis=0)),
+            ("percentile", lambda s: np.percentile(s, 20.0, axis=0)),
+            ("min", lambda s: s.min(axis=0)),
+            ("max", lambda s: s.max(axis=0)),
+        ],
+    )
+    def test_reducer_matches_numpy(
+        self, frames: list[np.ndarray], kind: str, expected: Any
+    ) -> None:
+        """Each reducer matches the equivalent numpy reduction."""
+        reducer = make_reducer(kind, 20.0)  # type: ignore[arg-type]
+        for frame in frames:
+            reducer.push(frame)
+        assert reducer.count == len(frames)
+        result = reducer.result()
+        assert result.dtype == np.float64
+        np.testing.assert_allclose(result, expected(np.stack(frames).astype(float)))
+
+    def test_trimmed_mean_discards_outliers(self) -> None:
+        """Trimmed mean ignores the extreme frames."""
+        reducer = TrimmedMeanReducer(0.2)
+        for value in [1000.0, 2.0, 2.0, 2.0, -1000.0]:
+            reducer.push(np.full((2, 2), value))
+        np.testing.assert_allclose(reducer.result(), 2.0)
+
+    def test_buffered_reducer_copies_frames(self) -> None:
+        """Buffered reducers are not affected by later writes to a pushed frame."""
+        reducer = MedianReducer()
+        buffer = np.ones((2, 2))
+        reducer.push(buffer)
+        buffer[:] = 5.0
+        np.testing.assert_allclose(reducer.result(), 1.0)
+
+    def test_reset_discards_frames(self) -> None:
+        """reset() clears the reducer state."""
+        reducer = MeanReducer()
+        reducer.push(np.full((2, 2), 4.0))
+        reducer.reset()
+        assert reducer.count == 0
+        with pytest.raises(RuntimeError):
+            reducer.result()
+        reducer.push(np.full((2, 2), 2.0))
+        np.testing.assert_allclose(reducer.result(), 2.0)
+
+    @pytest.mark.parametrize("window", [1, 4, 5])
+    def test_rolling_median_matches_window(
+        self, frames: list[np.ndarray], window: int
+    ) -> None:
+        """Rolling median equals the median of the last ``window`` frames."""
+        reducer = RollingMedianReducer(window, dtype=np.float64)
+        for i, frame in enumerate(frames):
+            reducer.push(frame)
+            expected = np.median(
+                np.stack(frames[max(0, i - window + 1) : i + 1]), axis=0
+            )
+            np.testing.assert_allclose(reducer.result(), expected)
+        assert reducer.count == window
+
+    def test_default_percent_depends_on_kind(self) -> None:
+        """Without a percentage, percentile is the median and trimmed_mean cuts 20%."""
+        rng = np.random.default_rng(2)
+        frames = [rng.normal(size=(4, 4)) for _ in range(10)]
+        stack = np.stack(frames)
+        percentile = make_reducer("percentile")
+        trimmed = make_reducer("trimmed_mean")
+        for frame in frames:
+            percentile.push(frame)
+            trimmed.push(frame)
+        np.testing.assert_allclose(percentile.result(), np.median(stack, axis=0))
+        np.testing.assert_allclose(
+            trimmed.result(), np.sort(stack, axis=0)[2:8].mean(axis=0)
+        )
+
+    def test_unknown_reducer_raises(self) -> None:
+        """make_reducer() rejects unknown names."""
+        with pytest.raises(ValueError):
+            make_reducer("mode")  # type: ignore[arg-type]
+
+
+class TestMedianCache:
+    """Tests for the on-disk median cache."""
+
+    def _key(self, position: tuple[float, float] = (0.0, 0.0)) -> tuple[str, Any]:
+        return MedianCache.make_key(
+            "cam",
+            exposure=10.0,
+            roi=(0, 0, 8, 6),
+            pixel_type="uint16",
+            position=position,
+            bucket=100.0,
+        )
+
+    def test_put_and_get(self, tmp_path: Path) -> None:
+        """A stored frame is returned for the same context, and survives a reload."""
+        cache = MedianCache(tmp_path)
+        key, context = self._key()
+        frame = np.arange(48, dtype=np.float32).reshape(8, 6)
+        cache.put(key, frame, context)
+        np.testing.assert_array_equal(cache.get(key), frame)
+        np.testing.assert_array_equal(MedianCache(tmp_path).get(key), frame)
+
+    def test_position_bucket(self) -> None:
+        """Nearby positions share a key; distant positions do not."""
+        assert self._key((10.0, 20.0))[0] == self._key((90.0, 60.0))[0]
+        assert self._key((10.0, 20.0))[0] != self._key((110.0, 20.0))[0]
+
+    def test_expired_entry_is_ignored(self, tmp_path: Path) -> None:
+        """Entries older than max_age are not returned."""
+        cache = MedianCache(tmp_path)
+        key, context = self._key()
+        cache.put(key, np.ones((2, 2)), context)
+        assert cache.get(key, max_age=0.0) is None
+
+    def test_lru_eviction(self, tmp_path: Path) -> None:
+        """The least recently used entry is evicted when the cache is full."""
+        cache = MedianCache(tmp_path, max_entries=2)
+        keys = [self._key((100.0 * i, 0.0)) for i in range(3)]
+        cache.put(keys[0][0], np.zeros((2, 2)), keys[0][1])
+        cache.put(keys[1][0], np.zeros((2, 2)), keys[1][1])
+        # touch the first entry so that the second becomes the oldest
+        assert cache.get(keys[0][0]) is not None
+        cache.put(keys[2][0], np.zeros((2, 2)), keys[2][1])
+        assert len(cache) == 2
+        assert cache.get(keys[0][0]) is not None
+        assert cache.get(keys[1][0]) is None
+        assert len(list(tmp_path.glob("*.npy"))) == 2
+
+
+class _FrameSource:
+    """Minimal reader providing what MedianPseudoDevice needs."""
+
+    name = "cam"
+    sensor_shape = (32, 24)
+
+    def get_writer(self) -> None:
+        return None
+
+
+class TestMedianPseudoDevice:
+    """Tests for MedianPseudoDevice."""
+
+    @pytest.fixture
+    def median(self) -> MedianPseudoDevice:
+        describe = {"cam-buffer": {"source": "data", "dtype": "array", "shape": []}}
+        collect = {
+            "cam-buffer_stream": {"source": "data", "dtype": "array", "shape": []}
+        }
+        return MedianPseudoDevice(_FrameSource(), describe, collect)  # type: ignore[arg-type]
+
+    def _stash(self, median: MedianPseudoDevice, frame: np.ndarray) -> None:
+        median.stash({"cam-buffer": {"value": frame, "timestamp": 0.0}}).wait(1.0)
+
+    def test_trigger_computes_float32_median(self, median: MedianPseudoDevice) -> None:
+        """trigger() stores the median of the stashed frames, as float32 by default."""
+        for value in (1, 3, 2):
+            self._stash(median, np.full((32, 24), value, dtype=np.uint16))
+        median.trigger().wait(1.0)
+        result = median.read()["cam_median-buffer"]["value"]
+        assert result.dtype == np.float32
+        np.testing.assert_allclose(result, 2.0)
+
+    def test_convergence_decreases(self) -> None:
+        """The convergence is inf at first and shrinks as the estimate stabilizes."""
+        describe = {"cam-buffer": {"source": "data", "dtype": "array", "shape": []}}
+        collect = {
+            "cam-buffer_stream": {"source": "data", "dtype": "array", "shape": []}
+        }
+        median = MedianPseudoDevice(
+            _FrameSource(),  # type: ignore[arg-type]
+            describe,
+            collect,
+            convergence_window=20,
+        )
+        rng = np.random.default_rng(0)
+        assert median.convergence == np.inf
+        values = []
+        for _ in range(20):
+            self._stash(median, 1000 + rng.normal(0, 10, (32, 24)))
+            values.append(median.convergence)
+        assert values[0] == np.inf
+        assert values[-1] < 0.005
+        median.clear().wait(1.0)
+        assert median.convergence == np.inf
+
+    def test_convergence_not_tracked_by_default(
+        self, median: MedianPseudoDevice
+    ) -> None:
+        """Without a convergence window, the convergence stays inf."""
+        for value in (1, 2, 3):
+            self._stash(median, np.full((32, 24), value, dtype=np.uint16))
+        assert median.convergence == np.inf
+
+    def test_trigger_reports_reduction_errors(self) -> None:
+        """A failing reduction marks the trigger status as failed."""
+
+        class _BrokenReducer(MedianReducer):
+            def result(self) -> np.ndarray:
+                raise RuntimeError("boom")
+
+        describe = {"cam-buffer": {"source": "data", "dtype": "array", "shape": []}}
+        collect = {
+            "cam-buffer_stream": {"source": "data", "dtype": "array", "shape": []}
+        }
+        median = MedianPseudoDevice(
+            _FrameSource(),  # type: ignore[arg-type]
+            describe,
+            collect,
+            reducer=_BrokenReducer(),
+        )
+        self._stash(median, np.ones((32, 24)))
+        status = median.trigger()
+        with pytest.raises(RuntimeError):
+            status.wait(timeout=1.0)
+        assert not status.success
+
+    def test_binning_upsamples_to_frame_size(self) -> None:
+        """A binned median is upsampled back to the full frame size."""
+        describe = {"cam-buffer": {"source": "data", "dtype": "array", "shape": []}}
+        collect = {
+            "cam-buffer_stream": {"source": "data", "dtype": "array", "shape": []}
+        }
+        median = MedianPseudoDevice(
+            _FrameSource(),  # type: ignore[arg-type]
+            describe,
+            collect,
+            binning=4,
+        )
+        frame = np.ones((30, 24))
+        frame[:8] = 3.0
+        self._stash(median, frame)
+        median.trigger().wait(1.0)
+        result = median.read()["cam_median-buffer"]["value"]
+        assert result.shape == (30, 24)
+        np.testing.assert_allclose(result[:8], 3.0)
+        np.testing.assert_allclose(result[8:], 1.0)
+
+    def test_roi_restricts_median(self) -> None:
+        """Only the region of interest is reduced; the rest is filled with its level."""
+        describe = {"cam-buffer": {"source": "data", "dtype": "array", "shape": []}}
+        collect = {
+            "cam-buffer_stream": {"source": "data", "dtype": "array", "shape": []}
+        }
+        median = MedianPseudoDevice(
+            _FrameSource(),  # type: ignore[arg-type]
+            describe,
+            collect,
+            roi=(4, 2, 8, 6),
+        )
+        frame = np.full((32, 24), 100.0)
+        frame[4:12, 2:8] = 5.0
+        self._stash(median, frame)
+        median.trigger().wait(1.0)
+        result = median.read()["cam_median-buffer"]["value"]
+        assert result.shape == (32, 24)
+        np.testing.assert_allclose(result, 5.0)
+
+    def test_invalid_binning_raises(self) -> None:
+        """Only 1, 2 and 4 binning factors are accepted."""
+        with pytest.raises(ValueError):
+            MedianPseudoDevice(
+                _FrameSource(),  # type: ignore[arg-type]
+                {},
+                {},
+                binning=3,
+            )
+
+
+class TestPositionPseudoDevice:
+    """Tests for PositionPseudoDevice."""
+
+    @pytest.fixture
+    def positions(self) -> PositionPseudoDevice:
+        device = PositionPseudoDevice("cam_position", ["X", "Y"])
+        # still, then moving along X from 0 to 10 between t=1 and t=2
+        device.load(
+            [0.5, 1.5, 2.0, 3.0],
+            [0.0, 1.0, 2.0],
+            {"X": [0.0, 0.0, 10.0], "Y": [5.0, 5.0, 5.0]},
+        )
+        return device
+
+    def test_interpolates_frame_positions(
+        self, positions: PositionPseudoDevice
+    ) -> None:
+        """Positions are interpolated at the frame timestamps and clamped after the last knot."""
+        np.testing.assert_allclose(positions.positions()["X"], [0.0, 5.0, 10.0, 10.0])
+        np.testing.assert_allclose(positions.positions()["Y"], 5.0)
+
+    def test_trigger_advances_frames(self, positions: PositionPseudoDevice) -> None:
+        """Each trigger advances to the next frame, timestamped at acquisition."""
+        positions.trigger().wait(1.0)
+        positions.trigger().wait(1.0)
+        reading = positions.read()
+        assert reading["cam_position-x"]["value"] == 5.0
+        assert reading["cam_position-x"]["timestamp"] == 1.5
+        assert reading["cam_position-frame"]["value"] == 1
+        assert set(reading) == set(positions.describe())
+        positions.trigger().wait(1.0)
+        positions.trigger().wait(1.0)
+        status = positions.trigger()
+        assert isinstance(status.exception(), IndexError)
+
+    def test_invalid_knots_raise(self) -> None:
+        """Knots must be given, ordered and match the positions."""
+        device = PositionPseudoDevice("cam_position", ["X"])
+        with pytest.raises(ValueError):
+            device.load([0.0], [], {"X": []})
+        with pytest.raises(ValueError):
+            device.load([0.0], [1.0, 0.0], {"X": [0.0, 1.0]})
+        with pytest.raises(ValueError):
+            device.load([0.0], [0.0, 1.0], {"X": [0.0]})
+
+
+class _FakeSink:
+    def __init__(self) -> None:
+        self.frames: list[np.ndarray] = []
+        self.closed = False
+
+    def write(self, frame: np.ndarray) -> None:
+        self.frames.append(frame)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _FakeWriter:
+    def __init__(self) -> None:
+        self.sinks: dict[str, tuple[_FakeSink, dict[str, Any]]] = {}
+        self.kicked_off = False
+
+    def prepare(self, name: str, data_key: str, **kwargs: Any) -> _FakeSink:
+        sink = _FakeSink()
+        self.sinks[name] = (sink, {"data_key": data_key, **kwargs})
+        return sink
+
+    def kickoff(self) -> None:
+        self.kicked_off = True
+
+    def get_indices_written(self, name: str) -> int:
+        return len(self.sinks[name][0].frames)
+
+
+class _FakeReader:
+    name = "cam"
+
+    def __init__(self) -> None:
+        self.writer = _FakeWriter()
+
+    def get_writer(self) -> _FakeWriter:
+        return self.writer
+
+
+class TestTilePseudoDevice:
+    """Tests for TilePseudoDevice."""
+
+    @pytest.fixture
+    def reader(self) -> _FakeReader:
+        return _FakeReader()
+
+    @pytest.fixture
+    def tiles(self, reader: _FakeReader) -> TilePseudoDevice:
+        return TilePseudoDevice(
+            reader,  # type: ignore[arg-type]
+            (4, 3),
+            "uint16",
+            [(0.0, 0.0), (10.0, 0.0)],
+            ["X", "Y"],
+        )
+
+    def test_stash_requires_prepare(self, tiles: TilePseudoDevice) -> None:
+        """Tiles cannot be written before the storage is prepared."""
+        status = tiles.stash(
+            {"cam-buffer": {"value": np.zeros((4, 3)), "timestamp": 0}}
+        )
+        assert isinstance(status.exception(), RuntimeError)
+
+    def test_writes_stashed_tiles(
+        self, tiles: TilePseudoDevice, reader: _FakeReader
+    ) -> None:
+        """Each stashed frame is written right away to a sink sized for the grid."""
+        tiles.prepare(None).wait(1.0)  # type: ignore[arg-type]
+        tiles.kickoff().wait(1.0)
+        sink, kwargs = reader.writer.sinks["cam_tiles"]
+        assert kwargs["data_key"] == "cam_tiles-buffer_stream"
+        assert kwargs["shape"] == (4, 3)
+        assert kwargs["capacity"] == 2
+        assert reader.writer.kicked_off
+
+        for value in range(2):
+            frame = np.full((4, 3), value, dtype=np.uint16)
+            tiles.stash({"cam-buffer": {"value": frame, "timestamp": 0}}).wait(1.0)
+        assert tiles.read()["cam_tiles-written"]["value"] == 2
+        assert [int(frame[0, 0]) for frame in sink.frames] == [0, 1]
+        assert tiles.get_index() == 2
+
+        tiles.complete().wait(1.0)
+        assert sink.closed
+
+
+class TestJSONFramer:
+    """Tests for the incremental framing of UC2 responses."""
+
+    stream = (
+        b"++\r\n"
+        b'{"qid":3,"steppers":[{"stepperid":1,"position":-1250,"isDone":1}]}'
+        b"\r\n--\r\n"
+        b"[motor] homing done {noise\r\n}"
+        b'++\r\n{"qid":4,"msg":"a \\"quoted\\" } brace","success":-1}\r\n--\r\n'
+    )
+
+    def test_extracts_objects_and_drops_noise(self) -> None:
+        """Delimiters and log lines between objects are discarded."""
+        frames = JSONFramer().feed(self.stream)
+        # the log line in braces is framed, and rejected by the decoder
+        assert len(frames) == 3
+        assert frames[0].startswith(b'{"qid":3')
+        assert frames[2].endswith(b'"success":-1}')
+
+    def test_split_reads(self) -> None:
+        """Objects split across reads, even inside strings and escapes, are reassembled."""
+        framer = JSONFramer()
+        frames: list[bytes] = []
+        for i in range(len(self.stream)):
+            frames += framer.feed(self.stream[i : i + 1])
+        assert frames == JSONFramer().feed(self.stream)
+
+    def test_oversized_object_is_dropped(self) -> None:
+        """An unbalanced brace does not block the following responses."""
+        framer = JSONFramer(max_size=16)
+        assert framer.feed(b"{" + b"x" * 32) == []
+        assert framer.feed(b'{"qid":1}') == [b'{"qid":1}']
+
+    def test_unbalanced_noise_resyncs(self) -> None:
+        """A brace or a quote left open in a log line does not swallow the next responses."""
+        stream = (
+            b"[E][x.cpp:1] bad {oops\r\n"
+            b'{"qid":1,"success":1}\r\n'
+            b'[E][x.cpp:2] bad {"oops\r\n'
+            b'++\r\n{"qid":2,"success":1}\r\n--\r\n'
+            b"[E][x.cpp:3] bad {oops\r\n"
+            b'++\r\n{"qid":3,"success":1}\r\n--\r\n'
+        )
+        expected = [b'{"qid":%d,"success":1}' % qid for qid in (1, 2, 3)]
+        assert JSONFramer().feed(stream) == expected
+        framer = JSONFramer()
+        frames: list[bytes] = []
+        for i in range(len(stream)):
+            frames += framer.feed(stream[i : i + 1])
+        assert frames == expected
+
+    def test_decode_response(self) -> None:
+        """Frames are decoded to typed responses, keeping negative positions."""
+        frames = JSONFramer().feed(self.stream)
+        motor = decode_response(frames[0])
+        assert isinstance(motor, MotorResponse)
+        assert motor.steppers[0].position == -1250
+        ack = decode_response(frames[2])
+        assert isinstance(ack, Acknowledge)
+        assert ack.qid == 4
+        assert ack.success == -1
+        state = decode_response(
+            b'{"motor":{"steppers":[{"stepperid":1,"position":-7}]},"qid":5}'
+        )
+        assert isinstance(state, PositionResponse)
+        assert state.state.steppers[0].position == -7
+
+
+class _FakeSerial:
+    """In-memory serial port answering like the UC2 firmware.
+
+    Responses to motor commands are held until ``release`` is called.
+    """
+
+    def __init__(self) -> None:
+        self._rx = bytearray()
+        self._cond = threading.Condition()
+        self._held: list[bytes] = []
+        self.hold_motors = False
+
+    @staticmethod
+    def _frame(message: dict[str, Any]) -> bytes:
+        return b"++\n" + json.dumps(message).encode() + b"\n--\n"
+
+    def write(self, packet: bytes) -> int:
+        command = json.loads(packet)
+        qid = command["qid"]
+        replies = [self._frame({"qid": qid, "success": 1})]
+        if command["task"] == "/motor_act":
+            stepper = command["motor"]["steppers"][0]
+            done = {"stepperid": stepper["stepperid"], "position": stepper["position"]}
+            reply = self._frame({"qid": qid, "steppers": [{**done, "isDone": 1}]})
+            if self.hold_motors:
+                self._held.append(reply)
+            else:
+                replies.append(reply)
+        self._push(b"".join(replies))
+        return len(packet)
+
+    def release(self) -> None:
+        held, self._held = self._held, []
+        # answer in reverse order, as concurrent movements may finish
+        self._push(b"".join(reversed(held)))
+
+    def _push(self, data: bytes) -> None:
+        with self._cond:
+            self._rx.extend(data)
+            self._cond.notify_all()
+
+    @property
+    def in_waiting(self) -> int:
+        return len(self._rx)
+
+    def read(self, size: int = 1) -> bytes:
+        with self._cond:
+            self._cond.wait_for(lambda: len(self._rx) > 0, timeout=0.05)
+            data = bytes(self._rx[:size])
+            del self._rx[:size]
+            return data
+
+
+class TestSerialEngine:
+    """Tests for the UC2 serial engine."""
+
+    @pytest.fixture
+    def serial(self) -> _FakeSerial:
+        return _FakeSerial()
+
+    @pytest.fixture
+    def engine(self, serial: _FakeSerial) -> Any:
+        engine = SerialEngine(serial, timeout=2.0)  # type: ignore[arg-type]
+        yield engine
+        engine.close()
+
+    def _motor(self, stepper: int, position: int) -> MotorAction:
+        return MotorAction(movement=MotorAction.generate_movement(stepper, position))
+
+    def test_acknowledged_command_completes(self, engine: SerialEngine) -> None:
+        """A laser command completes when acknowledged."""
+        status = engine.submit(LaserAction(id=1, value=100))
+        status.wait(timeout=1.0)
+        assert status.success
+        assert engine.in_flight == 0
+
+    def test_responses_routed_by_qid(
+        self, engine: SerialEngine, serial: _FakeSerial
+    ) -> None:
+        """Commands in flight are completed by their own responses, in any order."""
+        serial.hold_motors = True
+        moves = [engine.submit(self._motor(k, 10 * k), responses=2) for k in (1, 2)]
+        laser = engine.submit(LaserAction(id=1, value=100))
+        laser.wait(timeout=1.0)
+        assert not any(move.done for move in moves)
+        assert engine.in_flight == 2
+        serial.release()
+        for move in moves:
+            move.wait(timeout=1.0)
+            assert move.success
+
+    def test_statistics(self, engine: SerialEngine, serial: _FakeSerial) -> None:
+        """The phases of each command and the serial traffic are recorded."""
+        engine.submit(LaserAction(id=1, value=100)).wait(timeout=1.0)
+        engine.submit(self._motor(1, 10), responses=2).wait(timeout=1.0)
+        snapshot = engine.statistics.snapshot()
+        assert snapshot["bytes_sent"] > 0
+        assert snapshot["bytes_received"] > 0
+        laser = snapshot["tasks"]["/laser_act"]
+        assert laser["failures"] == 0
+        assert {"queue", "write", "ack", "total"} <= set(laser)
+        assert "motion" not in laser
+        motor = snapshot["tasks"]["/motor_act"]
+        assert motor["motion"]["count"] == 1
+        assert motor["total"]["max"] >= motor["ack"]["max"]
+        assert "/motor_act" in engine.statistics.summary()
+
+    def test_latency_histogram(self) -> None:
+        """Quantiles are estimated within a factor 2."""
+        histogram = LatencyHistogram()
+        assert histogram.quantile(0.5) == 0.0
+        for ms in range(1, 101):
+            histogram.record(ms * 1e-3)
+        assert histogram.count == 100
+        assert histogram.mean == pytest.approx(0.0505)
+        assert 0.05 <= histogram.quantile(0.5) <= 0.1
+        assert histogram.quantile(1.0) == pytest.approx(0.1)
+        assert histogram.snapshot()["min"] == pytest.approx(1e-3)
+
+    def test_unanswered_command_times_out(self, serial: _FakeSerial) -> None:
+        """Commands without responses fail after the timeout and are discarded."""
+        engine = SerialEngine(serial, timeout=0.1)  # type: ignore[arg-type]
+        serial.hold_motors = True
+        status = engine.submit(self._motor(1, 10), responses=2)
+        with pytest.raises(TimeoutError):
+            status.wait(timeout=1.0)
+        assert engine.in_flight == 0
+        assert engine.statistics.snapshot()["tasks"]["/motor_act"]["failures"] == 1
+        engine.close()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="requires a POSIX pty")
+class TestUC2Simulator:
+    """Tests of the UC2 devices against the firmware simulator."""
+
+    @pytest.fixture
+    def connect(self) -> Any:
+        opened: list[tuple[UC2Simulator, MimirSerialDevice]] = []
+
+        def _connect(**kwargs: Any) -> UC2Simulator:
+            sim = UC2Simulator(seed=0, **kwargs)
+            sim.start()
+            serial = MimirSerialDevice("serial", port=sim.port, timeout=0.05)
+            opened.append((sim, serial))
+            engine = MimirSerialDevice.get()
+            if isinstance(engine, Future):
+                engine.result(timeout=2.0)
+            return sim
+
+        yield _connect
+        for sim, serial in opened:
+            serial.shutdown()
+            sim.close()
+
+    def test_travel_time(self) -> None:
+        """Travel time follows constant speed, or a trapezoidal/triangular ramp."""
+        assert travel_time(-500, 1000, 1000, ramp=False) == pytest.approx(0.5)
+        assert travel_time(2000, 1000, 1000, ramp=True) == pytest.approx(3.0)
+        assert travel_time(250, 1000, 1000, ramp=True) == pytest.approx(1.0)
+        assert travel_time(0, 1000, 1000, ramp=True) == 0.0
+
+    def test_laser_and_motor(self, connect: Any) -> None:
+        """Commands reach the simulated firmware and complete after the travel time."""
+        sim = connect()
+        laser = MimirLaserDevice("laser")
+        motor = MimirMotorDevice("motor")
+        laser.set(300)
+        laser.trigger().wait(timeout=2.0)
+        assert sim.lasers == {1: 300}
+
+        start = time.monotonic()
+        motor.set(-100.0).wait(timeout=2.0)
+        # -312 steps at 10000 steps/s
+        assert time.monotonic() - start >= 0.031
+        assert sim.positions == {1: -100 * 1000 // 320}
+        assert motor.locate()["readback"] == -100.0
+
+    def test_multi_axis_move(self, connect: Any) -> None:
+        """Several axes are moved with a single command."""
+        sim = connect()
+        motor = MimirMotorDevice("motor")
+        start = time.monotonic()
+        motor.set({"X": 32.0, "Y": -320.0}).wait(timeout=2.0)
+        # 1000 steps at 10000 steps/s for the longest axis
+        assert time.monotonic() - start >= 0.1
+        # the probe, then a single motor command
+        assert sim.received == 2
+        assert sim.positions == {1: 100, 2: -1000}
+        locations = motor.locate_axes()
+        assert locations["X"]["readback"] == 32.0
+        assert locations["Y"]["readback"] == -320.0
+        assert motor.locate()["readback"] == 32.0
+
+    def test_laser_coalescing(self, connect: Any) -> None:
+        """Intensity changes sent while a command is in flight keep only the latest."""
+        sim = connect()
+        laser = MimirLaserDevice("laser")
+        laser.trigger().wait(timeout=2.0)
+        received = sim.received
+        statuses = [laser.set(value) for value in range(1, 101)]
+        statuses[-1].wait(timeout=2.0)
+        assert all(status.done for status in statuses)
+        assert sim.lasers == {1: 100}
+        # one command per round trip, not per requested value
+        assert sim.received - received < 20
+        # the acknowledged value is not sent again
+        received = sim.received
+        laser.set(100).wait(timeout=2.0)
+        assert sim.received == received
+
+    def test_position_polling(self, connect: Any) -> None:
+        """Polled positions are reported as readback, during and after movements."""
+        sim = connect()
+        motor = MimirMotorDevice("motor", poll_interval=0.02)
+
+        def readback_reaches(condition: Any) -> bool:
+            deadline = time.monotonic() + 2.0
+            while time.monotonic() < deadline:
+                if condition(motor.locate()["readback"]):
+                    return True
+                time.sleep(0.01)
+            return False
+
+        try:
+            # 2000 steps at 10000 steps/s
+            status = motor.set(640.0)
+            assert readback_reaches(lambda x: 0.0 < x < 640.0)
+            status.wait(timeout=2.0)
+            assert motor.locate()["readback"] == 640.0
+            # the stage misses some steps
+            sim.positions[1] = 1900
+            assert readback_reaches(lambda x: x == 608.0)
+            assert motor.locate()["setpoint"] == 640.0
+        finally:
+            motor.shutdown()
+
+    def test_trajectory(self, connect: Any) -> None:
+        """Trajectory points are sent one after the other and reported in order."""
+        sim = connect()
+        motor = MimirMotorDevice("motor")
+        assert isinstance(motor, TrajectoryMotor)
+        with pytest.raises(ValueError):
+            motor.upload_trajectory([{"W": 1.0}])
+        reached: list[int] = []
+        traj = motor.upload_trajectory(
+            [{"X": 32.0}, {"X": 32.0, "Y": 32.0}, {"Y": -32.0}]
+        )
+        traj.add_callback(reached.append)
+        assert list(traj) == [0, 1, 2]
+        traj.done.wait(timeout=2.0)
+        assert reached == [0, 1, 2]
+        times = [traj.point(i).result() for i in range(len(traj))]
+        assert times == sorted(times)
+        # the probe, then one command per point
+        assert sim.received == 4
+        assert sim.positions == {1: 200, 2: 0}
+        assert motor.locate_axes()["X"]["readback"] == 64.0
+        assert motor.locate_axes()["Y"]["readback"] == 0.0
+
+    def test_trajectory_window(self, connect: Any) -> None:
+        """With a queueing firmware, points are sent ahead of the motion."""
+        sim = connect(queue_moves=True)
+        motor = MimirMotorDevice("motor")
+        start = time.monotonic()
+        traj = motor.upload_trajectory([{"X": 32.0}] * 4, window=4)
+        # all points are in flight before the first one is reached
+        assert traj.sent == 4
+        traj.done.wait(timeout=2.0)
+        # 4 moves of 100 steps at 10000 steps/s, executed one after the other
+        assert time.monotonic() - start >= 0.04
+        assert sim.positions == {1: 400}
+
+    def test_trajectory_cancel(self, connect: Any) -> None:
+        """A cancelled trajectory completes the point in flight and stops."""
+        sim = connect()
+        motor = MimirMotorDevice("motor")
+        traj = motor.upload_trajectory([{"X": 320.0}] * 3)
+        traj.cancel()
+        traj.point(0).result(timeout=2.0)
+        with pytest.raises(RuntimeError):
+            traj.point(1).result(timeout=2.0)
+        with pytest.raises(RuntimeError):
+            traj.done.wait(timeout=2.0)
+        assert sim.positions == {1: 1000}
+
+    def test_noise_and_split_writes(self, connect: Any) -> None:
+        """Firmware log lines and fragmented responses do not break the link."""
+        sim = connect(noise=1.0, chunk_size=3)
+        laser = MimirLaserDevice("laser")
+        laser.set(300)
+        for _ in range(10):
+            status = laser.trigger()
+            status.wait(timeout=2.0)
+            assert status.success
+        # the probe, then the commands
+        assert sim.received == 11
+
+    def test_rejected_command_fails(self, connect: Any) -> None:
+        """A command rejected by the firmware fails its status."""
+        connect(fault_rate=1.0)
+        motor = MimirMotorDevice("motor")
+        status = motor.set(10.0)
+        with pytest.raises(RuntimeError):
+            status.wait(timeout=2.0)
+        assert motor.locate()["readback"] == 0.0
+
+    def test_probe_skips_reset(self, connect: Any) -> None:
+        """A board that answers the probe is used right away."""
+        start = time.monotonic()
+        sim = connect()
+        # no reset, nor waiting for the setup marker
+        assert time.monotonic() - start < 0.5
+        assert sim.received == 1
+
+    def test_reset_runs_in_background(self) -> None:
+        """An unresponsive board is reset without blocking the construction."""
+        with UC2Simulator(booted=False) as sim:
+            start = time.monotonic()
+            serial = MimirSerialDevice(
+                "serial", port=sim.port, timeout=0.05, probe_timeout=0.1
+            )
+            assert time.monotonic() - start < 0.1
+            engine = MimirSerialDevice.get()
+            assert isinstance(engine, Future)
+            laser = MimirLaserDevice("laser")
+            sim.boot(delay=0.3)
+            engine.result(timeout=2.0)
+            assert time.monotonic() - start >= 0.3
+            laser.trigger().wait(timeout=2.0)
+            assert sim.lasers == {1: 0}
+            serial.shutdown()
+
+
+class TestTrajectory:
+    """Tests of the trajectory streaming helper."""
+
+    def test_points_sent_on_completion(self) -> None:
+        """A point is only sent once the previous one completes, after the dwell time."""
+        statuses: list[Status] = []
+
+        def submit(index: int) -> Status:
+            statuses.append(Status())
+            return statuses[-1]
+
+        traj = Trajectory(3, submit, dwell=0.05).start()
+        assert traj.sent == 1
+        statuses[0].set_finished()
+        reached = traj.point(0).result(timeout=1.0)
+        while traj.sent < 2:
+            time.sleep(0.005)
+        assert time.monotonic() - reached >= 0.05
+        statuses[1].set_finished()
+        while traj.sent < 3:
+            time.sleep(0.005)
+        statuses[2].set_finished()
+        traj.done.wait(timeout=1.0)
+        assert list(traj) == [0, 1, 2]
+
+    def test_failed_point_cancels(self) -> None:
+        """A failing point fails the trajectory and the points after it."""
+        statuses: list[Status] = []
+
+        def submit(index: int) -> Status:
+            statuses.append(Status())
+            return statuses[-1]
+
+        traj = Trajectory(3, submit, window=2).start()
+        assert traj.sent == 2
+        statuses[0].set_exception(RuntimeError("stalled"))
+        with pytest.raises(RuntimeError, match="stalled"):
+            traj.done.wait(timeout=1.0)
+        with pytest.raises(RuntimeError, match="stalled"):
+            list(traj)
+        statuses[1].set_finished()
+        traj.point(1).result(timeout=1.0)
+        assert traj.point(2).exception() is not None
+        assert traj.sent == 2
+
+    def test_empty(self) -> None:
+        """An empty trajectory is done as soon as it starts."""
+        traj = Trajectory(0, lambda index: Status()).start()
+        traj.done.wait(timeout=1.0)
+        assert traj.sent == 0
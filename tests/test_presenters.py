@@ -1,19 +1,52 @@
 from __future__ import annotations
 
+import itertools
+import sys
+import threading
+import time
+from concurrent.futures import Future
+from queue import Queue
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from collections.abc import Generator
 
+    import numpy.typing as npt
+    from bluesky.utils import Msg
+
 import numpy as np
 import pytest
+from bluesky import RunEngine
+from bluesky import preprocessors as bpp
+from redsun import engine
+from redsun.engine import Status
 from redsun.virtual import VirtualContainer
 
 from redsun_mimir.device._mocks import MockLightDevice
-from redsun_mimir.device.mmcore import MMCoreStageDevice
+from redsun_mimir.device.mmcore import MMCoreCameraDevice, MMCoreStageDevice
+from redsun_mimir.device.pseudo import MedianPseudoDevice, PositionPseudoDevice
+from redsun_mimir.device.youseetoo import MimirMotorDevice, MimirSerialDevice
+from redsun_mimir.device.youseetoo._simulator import UC2Simulator
+from redsun_mimir.presenter.acquisition import (
+    AcquisitionPresenter,
+    fly_path,
+    frame_motion,
+    median_cache_keys,
+    parse_positions,
+    parse_roi,
+    stream_and_stash,
+    wait_for_settle,
+)
 from redsun_mimir.presenter.light import LightPresenter
 from redsun_mimir.presenter.median import MedianPresenter
+from redsun_mimir.presenter.mosaic import MosaicPresenter
 from redsun_mimir.presenter.motor import MotorPresenter
+from redsun_mimir.utils.geometry import (
+    order_positions,
+    path_length,
+    phase_correlation,
+    snake_grid,
+)
 
 
 class TestMotorPresenter:
@@ -46,8 +79,6 @@ class TestMotorPresenter:
         self, controller: MotorPresenter, xy_mock_motor: MMCoreStageDevice
     ) -> None:
         """move() enqueues and executes a position update."""
-        import threading
-
         done = threading.Event()
         received: list[tuple[str, str, float]] = []
 
@@ -62,15 +93,37 @@ class TestMotorPresenter:
         motor_name, axis, pos = received[0]
         assert motor_name == "xystage"
         assert axis == "X"
-        assert pos == pytest.approx(10.0)
+        # the readback, within a step of the stage
+        assert pos == pytest.approx(10.0, abs=0.015)
+        assert pos == xy_mock_motor.locate()["readback"]
         assert xy_mock_motor.locate()["setpoint"] == pytest.approx(10.0)
 
+    def test_move_emits_readback(
+        self,
+        controller: MotorPresenter,
+        xy_mock_motor: MMCoreStageDevice,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """The position emitted with sigNewPosition is read back from the device."""
+        done = threading.Event()
+        received: list[float] = []
+
+        def on_position(m: str, a: str, p: float) -> None:
+            received.append(p)
+            done.set()
+
+        monkeypatch.setattr(
+            xy_mock_motor, "locate", lambda: {"setpoint": 10.0, "readback": 9.5}
+        )
+        controller.sigNewPosition.connect(on_position)
+        controller.move("xystage", "X", 10.0)
+        assert done.wait(timeout=2.0), "sigNewPosition was not emitted in time"
+        assert received == [pytest.approx(9.5)]
+
     def test_move_via_device_name(
         self, controller: MotorPresenter, xy_mock_motor: MMCoreStageDevice
     ) -> None:
         """move() accepts the bare device name."""
-        import threading
-
         done = threading.Event()
         controller.sigNewPosition.connect(lambda m, a, p: done.set())
         controller.move(xy_mock_motor.name, "X", 5.0)
@@ -166,6 +219,18 @@ class TestLightPresenter:
         controller.set(mock_laser.name, 42.0)
         assert mock_laser.intensity == pytest.approx(42.0)
 
+    def test_set_intensity_does_not_wait(
+        self,
+        controller: LightPresenter,
+        mock_laser: MockLightDevice,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """set() returns without waiting for the device to complete."""
+        monkeypatch.setattr(mock_laser, "set", lambda value: Status())
+        start = time.monotonic()
+        controller.set("laser", 10.0)
+        assert time.monotonic() - start < 0.5
+
     def test_non_light_devices_are_excluded(
         self, xy_mock_motor: MMCoreStageDevice, virtual_container: VirtualContainer
     ) -> None:
@@ -182,13 +247,15 @@ class TestMedianPresenter:
     def presenter(
         self, virtual_container: VirtualContainer
     ) -> Generator[MedianPresenter, None, None]:
-        yield MedianPresenter(
+        presenter = MedianPresenter(
             "median_presenter",
             {},
             median_streams=["square_scan"],
             live_streams=["primary"],
             hints=["buffer"],
         )
+        yield presenter
+        presenter.shutdown()
 
     def _make_event(self, descriptor_uid: str, data: dict[str, Any]) -> dict[str, Any]:
         return {
@@ -241,28 +308,26 @@ class TestMedianPresenter:
     def test_live_stream_computes_and_emits_median(
         self, presenter: MedianPresenter
     ) -> None:
-        """Events from a non-expected stream trigger median computation and emission."""
+        """The median read in the scan stream corrects the live frames on the worker thread."""
         scan_uid = "scan-desc"
         live_uid = "live-desc"
         presenter.uid_to_stream[scan_uid] = "square_scan"
         presenter.uid_to_stream[live_uid] = "primary"
 
-        # Stack two identical frames so median == the frame itself
+        # the scan stream carries the frames and the median computed from them
         frame = np.ones((4, 4)) * 2.0
-        for _ in range(2):
-            presenter.event(self._make_event(scan_uid, {"cam-buffer": frame}))  # type: ignore[arg-type]
+        scan_data = {"cam-buffer": frame, "cam_median-buffer": frame}
+        presenter.event(self._make_event(scan_uid, scan_data))  # type: ignore[arg-type]
 
         # Now send a live event — median should be applied
-        emitted: list[Any] = []
-        presenter.sigNewData.connect(lambda d: emitted.append(d))
+        emitted: Queue[Any] = Queue()
+        presenter.sigNewData.connect(emitted.put)
 
         live_frame = np.ones((4, 4)) * 4.0
         presenter.event(self._make_event(live_uid, {"cam-buffer": live_frame}))  # type: ignore[arg-type]
 
-        assert len(emitted) == 1
-        result = emitted[0]
-        # cam-median key should be present
-        assert any("median" in k for k in result)
+        result = emitted.get(timeout=2.0)
+        np.testing.assert_allclose(result["cam_median"]["buffer"], 2.0)
 
     def test_inactive_presenter_does_nothing(
         self, virtual_container: VirtualContainer
@@ -276,6 +341,7 @@ class TestMedianPresenter:
         emitted: list[Any] = []
         p.sigNewData.connect(lambda d: emitted.append(d))
         p.event(evt)  # type: ignore[arg-type]
+        p.shutdown()
         assert emitted == []
 
     def test_apply_median_skips_missing_device(
@@ -286,8 +352,8 @@ class TestMedianPresenter:
         presenter.uid_to_stream[live_uid] = "primary"
         # Force median computation to only have "cam"
         presenter.medians["cam"] = {"buffer": np.ones((4, 4)) * 2.0}
-        emitted: list[Any] = []
-        presenter.sigNewData.connect(lambda d: emitted.append(d))
+        emitted: Queue[Any] = Queue()
+        presenter.sigNewData.connect(emitted.put)
         # Send live event with both "cam" and "cam2" keys
         evt = self._make_event(
             live_uid,
@@ -297,6 +363,560 @@ class TestMedianPresenter:
             },
         )
         presenter.event(evt)  # type: ignore[arg-type]
-        assert len(emitted) == 1
-        assert "cam_median" in emitted[0]
-        assert "cam2_median" not in emitted[0]
+        result = emitted.get(timeout=2.0)
+        assert "cam_median" in result
+        assert "cam2_median" not in result
+
+    def test_apply_median_output_dtype(self, presenter: MedianPresenter) -> None:
+        """Corrected images use the configured floating point precision."""
+        live_uid = "live-desc"
+        presenter.uid_to_stream[live_uid] = "primary"
+        presenter.medians["cam"] = {"buffer": np.full((4, 4), 2.0, dtype=np.float32)}
+        emitted: Queue[Any] = Queue()
+        presenter.sigNewData.connect(emitted.put)
+        frame = np.full((4, 4), 4, dtype=np.uint16)
+        presenter.event(self._make_event(live_uid, {"cam-buffer": frame}))  # type: ignore[arg-type]
+        result = emitted.get(timeout=2.0)["cam_median"]["buffer"]
+        assert result.dtype == np.float32
+        np.testing.assert_allclose(result, 2.0)
+
+    def test_live_stream_uses_median_from_pseudo_device(
+        self, presenter: MedianPresenter
+    ) -> None:
+        """Median keys read in the live stream are stored and applied."""
+        live_uid = "live-desc"
+        presenter.uid_to_stream[live_uid] = "primary"
+        emitted: Queue[Any] = Queue()
+        presenter.sigNewData.connect(emitted.put)
+
+        # an empty median is ignored
+        empty = np.zeros((4, 4), dtype=np.float32)
+        presenter.event(
+            self._make_event(
+                live_uid, {"cam-buffer": np.ones((4, 4)), "cam_median-buffer": empty}
+            )  # type: ignore[arg-type]
+        )
+
+        median = np.full((4, 4), 4.0, dtype=np.float32)
+        results: list[Any] = []
+        for value in [2.0, 4.0, 6.0]:
+            presenter.event(
+                self._make_event(
+                    live_uid,
+                    {"cam-buffer": np.full((4, 4), value), "cam_median-buffer": median},
+                )  # type: ignore[arg-type]
+            )
+            results.append(emitted.get(timeout=2.0)["cam_median"]["buffer"])
+        # frames still held by the consumer are not overwritten
+        for result, expected in zip(results, [0.5, 1.0, 1.5]):
+            np.testing.assert_allclose(result, expected)
+        assert len({id(result) for result in results}) == 3
+
+        # released frames are reused
+        released = {id(result) for result in results}
+        del results, result
+        presenter.event(
+            self._make_event(
+                live_uid,
+                {"cam-buffer": np.full((4, 4), 8.0), "cam_median-buffer": median},
+            )  # type: ignore[arg-type]
+        )
+        result = emitted.get(timeout=2.0)["cam_median"]["buffer"]
+        np.testing.assert_allclose(result, 2.0)
+        assert id(result) in released
+
+    def test_event_does_not_block_on_correction(
+        self, presenter: MedianPresenter
+    ) -> None:
+        """event() returns while the correction runs on the worker thread."""
+        live_uid = "live-desc"
+        presenter.uid_to_stream[live_uid] = "primary"
+        presenter.medians["cam"] = {"buffer": np.full((4, 4), 2.0)}
+        release = threading.Event()
+        emitted: Queue[Any] = Queue()
+
+        def on_data(data: Any) -> None:
+            release.wait(timeout=2.0)
+            emitted.put(data)
+
+        presenter.sigNewData.connect(on_data)
+        for _ in range(5):
+            presenter.event(
+                self._make_event(live_uid, {"cam-buffer": np.full((4, 4), 4.0)})
+            )  # type: ignore[arg-type]
+        # the worker is stuck on the first event; the others were coalesced
+        assert emitted.empty()
+        release.set()
+        emitted.get(timeout=2.0)
+        presenter.shutdown()
+        assert emitted.qsize() <= 1
+
+    def test_rolling_mode_divides_by_temporal_median(
+        self, virtual_container: VirtualContainer
+    ) -> None:
+        """In rolling mode, live frames are divided by the median of the last frames."""
+        p = MedianPresenter(
+            "median_presenter",
+            {},
+            live_streams=["primary"],
+            hints=["buffer"],
+            mode="rolling",
+            window=3,
+        )
+        live_uid = "live-desc"
+        p.uid_to_stream[live_uid] = "primary"
+        emitted: Queue[Any] = Queue()
+        p.sigNewData.connect(emitted.put)
+        for value in [2.0, 4.0, 4.0, 8.0]:
+            p.event(self._make_event(live_uid, {"cam-buffer": np.full((4, 4), value)}))  # type: ignore[arg-type]
+            result = emitted.get(timeout=2.0)
+        p.shutdown()
+        # median of the last three frames (4, 4, 8) is 4
+        np.testing.assert_allclose(result["cam_median"]["buffer"], 2.0)
+
+
+class _DriftingSource:
+    """Readable whose image flickers for the first ``moving_reads`` reads."""
+
+    name = "cam"
+    parent = None
+
+    def __init__(self, moving_reads: int) -> None:
+        self.moving_reads = moving_reads
+        self.reads = 0
+
+    def read(self) -> dict[str, Any]:
+        moving = self.reads < self.moving_reads
+        value = 1000.0 + 500.0 * (self.reads % 2) if moving else 1000.0
+        self.reads += 1
+        frame = np.full((64, 64), value, dtype=np.float32)
+        return {"cam-buffer": {"value": frame, "timestamp": 0.0}}
+
+    def describe(self) -> dict[str, Any]:
+        return {"cam-buffer": {"source": "data", "dtype": "array", "shape": [64, 64]}}
+
+
+class TestSettleDetection:
+    """Tests for the image-based settle detection plan stub."""
+
+    def test_frame_motion(self) -> None:
+        """frame_motion is zero for equal frames and relative to the first frame."""
+        a = np.full((8, 8), 100.0, dtype=np.float32)
+        assert frame_motion(a, a) == 0.0
+        assert frame_motion(a, a + 10.0) == pytest.approx(0.1)
+        zero = np.zeros((8, 8), dtype=np.float32)
+        assert frame_motion(zero, zero) == 0.0
+        assert frame_motion(zero, a) == np.inf
+
+    def test_returns_once_image_is_still(self) -> None:
+        """wait_for_settle stops reading as soon as two frames match."""
+        RE = RunEngine(call_returns_result=True)
+        source = _DriftingSource(moving_reads=3)
+        settled = RE(wait_for_settle([source], tolerance=0.01, timeout=5.0))
+        assert settled.plan_result is True
+        # frames 0..2 flicker, frame 3 equals frame 2
+        assert source.reads == 4
+
+    def test_times_out(self) -> None:
+        """wait_for_settle gives up after the timeout if the image keeps changing."""
+        RE = RunEngine(call_returns_result=True)
+        source = _DriftingSource(moving_reads=10**6)
+        settled = RE(wait_for_settle([source], tolerance=0.01, timeout=0.05))
+        assert settled.plan_result is False
+
+
+class TestAcquisitionPresenter:
+    """Tests for AcquisitionPresenter presenter."""
+
+    def test_builds_all_plan_specs(
+        self, mmcore_camera: MMCoreCameraDevice, xy_mock_motor: MMCoreStageDevice
+    ) -> None:
+        """Every plan can be described for the UI."""
+        devices = {mmcore_camera.name: mmcore_camera, xy_mock_motor.name: xy_mock_motor}
+        presenter = AcquisitionPresenter("acquisition", devices)  # type: ignore[arg-type]
+        assert set(presenter.plan_specs) == set(presenter.plans)
+
+    def test_median_cache_keys_keep_active_axis(
+        self, mmcore_camera: MMCoreCameraDevice, xy_mock_motor: MMCoreStageDevice
+    ) -> None:
+        """median_cache_keys reads the stage position without changing the active axis."""
+        xy_mock_motor.set("X", prop="axis").wait(timeout=1.0)
+        xy_mock_motor.set(250.0).wait(timeout=1.0)
+        RE = RunEngine(call_returns_result=True)
+        result = RE(
+            median_cache_keys([mmcore_camera], xy_mock_motor, 100.0, scan={"step": 1.0})
+        )
+        [(_, context)] = result.plan_result
+        assert context["position"] == [2, 0]
+        assert context["scan"] == {"step": 1.0}
+        assert xy_mock_motor.locate()["setpoint"] == pytest.approx(250.0)
+
+    def test_parse_roi(self) -> None:
+        """parse_roi accepts "x, y, w, h" and "full"."""
+        assert parse_roi("full") is None
+        assert parse_roi("") is None
+        assert parse_roi("1, 2, 30, 40") == (1, 2, 30, 40)
+        with pytest.raises(ValueError):
+            parse_roi("1, 2, 3")
+
+    def test_parse_positions(self) -> None:
+        """parse_positions splits positions on semicolons and coordinates on commas."""
+        assert parse_positions("0, 0; 10.5, -2;") == [(0.0, 0.0), (10.5, -2.0)]
+        with pytest.raises(ValueError):
+            parse_positions("")
+        with pytest.raises(ValueError):
+            parse_positions("0, 0; 1, 2, 3")
+
+    def test_multi_position_single_run(
+        self, mmcore_camera: MMCoreCameraDevice, xy_mock_motor: MMCoreStageDevice
+    ) -> None:
+        """multi_position emits one run, visiting the positions in travel order."""
+        devices = {mmcore_camera.name: mmcore_camera, xy_mock_motor.name: xy_mock_motor}
+        presenter = AcquisitionPresenter("acquisition", devices)  # type: ignore[arg-type]
+        docs: list[tuple[str, dict[str, Any]]] = []
+        # stage position when each frame is triggered
+        readbacks: list[float] = []
+
+        def record_readback(msg: Msg) -> None:
+            if msg.command == "trigger" and msg.obj is mmcore_camera:
+                x, _ = xy_mock_motor._core.getXYPosition(xy_mock_motor.name)
+                readbacks.append(x)
+
+        RE = RunEngine()
+        RE.msg_hook = record_readback
+        RE.subscribe(lambda name, doc: docs.append((name, doc)))
+        RE(
+            presenter.multi_position(
+                [mmcore_camera],
+                xy_mock_motor,
+                "30, 0; 10, 0; 20, 0",
+                frames=2,
+            )
+        )
+        names = [name for name, _ in docs]
+        assert names.count("start") == 1
+        assert names.count("stop") == 1
+        streams = {
+            doc["uid"]: doc["name"] for name, doc in docs if name == "descriptor"
+        }
+        events = [doc for name, doc in docs if name == "event"]
+        visited = [
+            doc["data"]["xystage_position-x"]
+            for doc in events
+            if streams[doc["descriptor"]] == "positions"
+        ]
+        assert visited == [10.0, 20.0, 30.0]
+        snaps = [
+            doc for doc in events if streams[doc["descriptor"]] == "multi_position"
+        ]
+        assert len(snaps) == 6
+        # the stage has reached each position before its frames are taken
+        assert readbacks == pytest.approx(
+            [10.0, 10.0, 20.0, 20.0, 30.0, 30.0], abs=0.015
+        )
+
+    def test_fly_path_positions_match_frame_timestamps(
+        self, xy_mock_motor: MMCoreStageDevice
+    ) -> None:
+        """Positions interpolated from the fly_path knots follow the real stage motion."""
+        # slow the demo stage down to 0.1 um/ms, so that each leg takes 200 ms
+        core = xy_mock_motor._core
+        core.setProperty(xy_mock_motor.name, "Velocity", "0.1")
+        # frames taken while moving, with the true stage position at their timestamp
+        frames: list[tuple[float, float, float]] = []
+        flying = threading.Event()
+        flying.set()
+
+        def acquire() -> None:
+            while flying.is_set():
+                x, y = core.getXYPosition(xy_mock_motor.name)
+                frames.append((time.time(), x, y))
+                time.sleep(0.005)
+
+        camera = threading.Thread(target=acquire)
+        camera.start()
+        RE = RunEngine(call_returns_result=True)
+        legs = [("X", 20.0), ("Y", 20.0), ("X", -20.0), ("Y", -20.0)]
+        try:
+            times, knots = RE(fly_path(xy_mock_motor, legs)).plan_result
+        finally:
+            flying.clear()
+            camera.join()
+
+        assert knots["X"][-1] == pytest.approx(0.0)
+        assert knots["Y"][-1] == pytest.approx(0.0)
+        timestamps, x, y = (np.array(values) for values in zip(*frames))
+        position = PositionPseudoDevice("camera_position", ["X", "Y"])
+        position.load(timestamps, times, knots)
+        # most frames are taken while moving; within a few ms of timing error
+        assert len(position) > 50
+        np.testing.assert_allclose(position.positions()["X"], x, atol=2.0)
+        np.testing.assert_allclose(position.positions()["Y"], y, atol=2.0)
+
+    def test_z_stack_software_fallback(
+        self, mmcore_camera: MMCoreCameraDevice, xy_mock_motor: MMCoreStageDevice
+    ) -> None:
+        """Stages that cannot be sequenced are stepped in software, one event per plane."""
+        devices = {mmcore_camera.name: mmcore_camera, xy_mock_motor.name: xy_mock_motor}
+        presenter = AcquisitionPresenter("acquisition", devices)  # type: ignore[arg-type]
+        docs: list[tuple[str, dict[str, Any]]] = []
+        RE = RunEngine()
+        RE.subscribe(lambda name, doc: docs.append((name, doc)))
+        RE(presenter.z_stack([mmcore_camera], xy_mock_motor, planes=3, axis="X"))
+        start = next(doc for name, doc in docs if name == "start")
+        assert start["z_stack"]["sequenced"] is False
+        assert start["z_stack"]["positions"] == pytest.approx([-1.0, 0.0, 1.0])
+        events = [doc for name, doc in docs if name == "event"]
+        assert len(events) == 3
+
+
+class _SimulatorCamera:
+    """Triggerable reader recording the simulated stage during each exposure."""
+
+    name = "cam"
+    parent = None
+    sensor_shape = (8, 8)
+
+    def __init__(self, sim: UC2Simulator, exposure: float) -> None:
+        self.sim = sim
+        self.exposure = exposure
+        # steps of each stepper and commands received,
+        # at the start and at the end of each exposure
+        self.exposures: list[tuple[Any, Any]] = []
+
+    def _state(self) -> tuple[dict[int, int], int]:
+        return dict(self.sim.positions), self.sim.received
+
+    def trigger(self) -> Status:
+        s = Status()
+        start = self._state()
+
+        def expose() -> None:
+            time.sleep(self.exposure)
+            self.exposures.append((start, self._state()))
+            s.set_finished()
+
+        threading.Thread(target=expose).start()
+        return s
+
+    def read(self) -> dict[str, Any]:
+        frame = np.zeros(self.sensor_shape, dtype=np.uint16)
+        return {"cam-buffer": {"value": frame, "timestamp": time.time()}}
+
+    def describe(self) -> dict[str, Any]:
+        return {"cam-buffer": {"source": "data", "dtype": "array", "shape": [8, 8]}}
+
+    def get_writer(self) -> None:
+        return None
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="requires a POSIX pty")
+class TestStreamAndStash:
+    """Tests of the trajectory scan against the UC2 firmware simulator."""
+
+    @pytest.fixture
+    def sim(self) -> Generator[UC2Simulator, None, None]:
+        sim = UC2Simulator(seed=0, queue_moves=True)
+        sim.start()
+        serial = MimirSerialDevice("serial", port=sim.port, timeout=0.05)
+        serial_engine = MimirSerialDevice.get()
+        if isinstance(serial_engine, Future):
+            serial_engine.result(timeout=2.0)
+        yield sim
+        serial.shutdown()
+        sim.close()
+
+    def _scan(self, sim: UC2Simulator, dwell: float) -> _SimulatorCamera:
+        motor = MimirMotorDevice("motor")
+        camera = _SimulatorCamera(sim, exposure=0.02)
+        describe = camera.describe()
+        collect = {"cam-buffer_stream": describe["cam-buffer"]}
+        cache = MedianPseudoDevice(camera, describe, collect)  # type: ignore[arg-type]
+        # the redsun engine knows how to stash readings
+        RE = engine.RunEngine()
+        # 100 steps along each axis, 10 ms per move
+        moves = [{"X": 32.0}, {"Y": 32.0}, {"X": -32.0}, {"Y": -32.0}]
+        plan = stream_and_stash(
+            [camera],  # type: ignore[list-item]
+            motor,
+            [cache],
+            moves,
+            dwell=dwell,
+        )
+        try:
+            RE(bpp.run_wrapper(plan)).result(timeout=5.0)
+        finally:
+            # whatever happens, the stage is back where it started
+            locations = motor.locate_axes()
+            assert locations["X"]["readback"] == 0.0
+            assert locations["Y"]["readback"] == 0.0
+        return camera
+
+    def test_frames_taken_at_each_point(self, sim: UC2Simulator) -> None:
+        """With enough dwell time, each frame is exposed while the stage holds its point."""
+        camera = self._scan(sim, dwell=0.1)
+        points = [{}, {1: 100}, {1: 100, 2: 100}, {1: 0, 2: 100}]
+        assert len(camera.exposures) == len(points)
+        for (start, end), point in zip(camera.exposures, points):
+            # no motor command is received during the exposure
+            assert start == end
+            assert start[0] == point
+
+    def test_overrun_fails(self, sim: UC2Simulator) -> None:
+        """A dwell time shorter than the exposure fails the scan."""
+        with pytest.raises(RuntimeError, match="dwell time"):
+            self._scan(sim, dwell=0.0)
+
+
+class TestOrderPositions:
+    """Tests for the travel-optimized ordering of stage positions."""
+
+    def test_orders_points_on_a_line(self) -> None:
+        """Points on a line are visited from the closest to the farthest."""
+        points = [(5.0, 0.0), (1.0, 0.0), (3.0, 0.0), (2.0, 0.0), (4.0, 0.0)]
+        assert order_positions(points, start=(0.0, 0.0)) == [1, 3, 2, 4, 0]
+
+    def test_never_longer_than_given_order(self) -> None:
+        """The optimized route is a permutation no longer than the input order."""
+        rng = np.random.default_rng(0)
+        points = rng.uniform(0, 1000, (40, 2)).tolist()
+        order = order_positions(points, start=(0.0, 0.0))
+        assert sorted(order) == list(range(40))
+        optimized = path_length(points, order, (0.0, 0.0))
+        assert optimized < path_length(points, None, (0.0, 0.0))
+
+    def test_two_opt_removes_crossings(self) -> None:
+        """Nearest-neighbour routes with crossing edges are untangled."""
+        # nearest neighbour from the start goes (1, 0) -> (1, 1) -> ...
+        # then has to cross back; 2-opt finds the shortest open route
+        points = [(1.0, 0.0), (2.0, 1.0), (1.0, 1.0), (2.0, 0.0)]
+        order = order_positions(points, start=(0.0, 0.0))
+        best = min(
+            path_length(points, perm, (0.0, 0.0))
+            for perm in itertools.permutations(range(4))
+        )
+        assert path_length(points, order, (0.0, 0.0)) == pytest.approx(best)
+
+
+class TestMosaicGeometry:
+    """Tests for the grid ordering and registration helpers of mosaics."""
+
+    def test_snake_grid(self) -> None:
+        """Odd rows are visited in reverse, so consecutive cells are adjacent."""
+        cells = snake_grid(2, 3)
+        assert cells == [(0, 0), (0, 1), (0, 2), (1, 2), (1, 1), (1, 0)]
+        steps = [
+            abs(a[0] - b[0]) + abs(a[1] - b[1]) for a, b in itertools.pairwise(cells)
+        ]
+        assert steps == [1] * 5
+
+    def test_phase_correlation_finds_shift(self) -> None:
+        """The shift of a rolled image is recovered with a high peak."""
+        rng = np.random.default_rng(0)
+        reference = rng.normal(size=(64, 48))
+        moving = np.roll(reference, (3, -5), axis=(0, 1))
+        shift, peak = phase_correlation(reference, moving)
+        assert shift == (3, -5)
+        assert peak > 0.5
+
+    def test_phase_correlation_rejects_noise(self) -> None:
+        """Unrelated images give a low correlation peak."""
+        rng = np.random.default_rng(0)
+        _, peak = phase_correlation(
+            rng.normal(size=(64, 64)), rng.normal(size=(64, 64))
+        )
+        assert peak < 0.2
+
+
+class TestMosaicPresenter:
+    """Tests for MosaicPresenter."""
+
+    tile = 64
+    step = 48
+
+    @pytest.fixture
+    def presenter(self) -> Generator[MosaicPresenter, None, None]:
+        presenter = MosaicPresenter(
+            "mosaic_presenter",
+            {},
+            streams=["mosaic"],
+            hints=["buffer"],
+            downsample=1,
+        )
+        yield presenter
+        presenter.shutdown()
+
+    def _run(
+        self,
+        presenter: MosaicPresenter,
+        errors: dict[int, tuple[int, int]],
+        stream: str = "mosaic",
+    ) -> tuple[npt.NDArray[Any], list[Any]]:
+        """Feed a 2 x 2 mosaic of a random scene, with stage errors per tile."""
+        rng = np.random.default_rng(1)
+        scene = rng.normal(size=(160, 160))
+        # tiles are cut with a margin, so that negative errors stay in the scene
+        margin = 8
+        presenter.start(
+            {  # type: ignore[arg-type]
+                "uid": "run-uid",
+                "time": 0.0,
+                "mosaic": {
+                    "rows": 2,
+                    "cols": 2,
+                    "origin": [0.0, 0.0],
+                    "step": [float(self.step)] * 2,
+                    "pixel_size": 1.0,
+                    "egu": "um",
+                    "tile_shape": [self.tile, self.tile],
+                    "position_keys": ["stage_position-x", "stage_position-y"],
+                },
+            }
+        )
+        presenter.uid_to_stream["desc-uid"] = stream
+        emitted: list[Any] = []
+        presenter.sigNewData.connect(lambda d: emitted.append(d))
+        for k, (row, col) in enumerate(snake_grid(2, 2)):
+            x, y = col * self.step, row * self.step
+            ex, ey = errors.get(k, (0, 0))
+            start_x, start_y = margin + x + ex, margin + y + ey
+            frame = scene[start_x : start_x + self.tile, start_y : start_y + self.tile]
+            data = {
+                "cam-buffer": frame.copy(),
+                "stage_position-x": float(x),
+                "stage_position-y": float(y),
+            }
+            presenter.event(
+                {  # type: ignore[arg-type]
+                    "descriptor": "desc-uid",
+                    "data": data,
+                    "timestamps": {key: 0.0 for key in data},
+                    "seq_num": k + 1,
+                    "uid": f"evt-{k}",
+                    "time": 0.0,
+                }
+            )
+        presenter._queue.join()
+        return scene[margin:, margin:], emitted
+
+    def test_places_tiles_at_stage_positions(self, presenter: MosaicPresenter) -> None:
+        """Tiles are stitched at their stage positions and the preview is emitted."""
+        scene, emitted = self._run(presenter, {})
+        size = self.step + self.tile
+        assert presenter.offsets["cam"] == [(0, 0), (48, 0), (48, 48), (0, 48)]
+        np.testing.assert_allclose(presenter.canvases["cam"], scene[:size, :size])
+        assert len(emitted) == 4
+        np.testing.assert_allclose(
+            emitted[-1]["cam_mosaic"]["buffer"], presenter.canvases["cam"]
+        )
+
+    def test_refines_stage_errors(self, presenter: MosaicPresenter) -> None:
+        """A tile acquired off its nominal position is moved to match its neighbours."""
+        _, _ = self._run(presenter, {1: (2, 1)})
+        assert presenter.offsets["cam"] == [(0, 0), (50, 1), (48, 48), (0, 48)]
+
+    def test_ignores_other_streams(self, presenter: MosaicPresenter) -> None:
+        """Events from streams that are not declared are not placed."""
+        _, emitted = self._run(presenter, {}, stream="primary")
+        assert emitted == []
+        assert presenter.canvases == {}